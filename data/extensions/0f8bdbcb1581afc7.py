@@ -0,0 +1,22 @@
+# Tool: auto_analyze_code_1770330351
+# Description: analyze code structure of ai_brain.py
+
+import sys
+import os
+import ast
+import time
+
+def run_task():
+    print(f'Task: analyze code structure of ai_brain.py')
+    print(f'CWD: {os.getcwd()}')
+    target = 'ai_brain.py'
+    if not os.path.exists(target):
+        print(f'Missing: Target {target} not found.')
+        return
+    with open(target, 'r', encoding='utf-8') as f: content = f.read()
+    tree = ast.parse(content)
+    functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+    classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
+    print(f'Analysis of {target}:')
+    print(f'  Functions: {len(functions)} {functions}')
+    print(f'  Classes:   {len(classes)} {classes}')
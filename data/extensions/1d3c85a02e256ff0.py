@@ -0,0 +1,30 @@
+# Tool: auto_procedural_analyze_TODO_97_1770332200
+# Description: analyze TODO in project and report
+
+import datetime
+import ast
+import time
+import os
+import sys
+import random
+
+def run_task():
+    print(f'Task: analyze TODO in project and report')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project...')
+    target_files = []
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                target_files.append(os.path.join(root, file))
+    found_items = []
+    for path in target_files:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                for i, line in enumerate(f, 1):
+                    if 'TODO' in line:
+                        item = {'file': path, 'line': i, 'content': line.strip()}
+                        found_items.append(item)
+                        print(f'{path}:{i} -> {line.strip()}')
+        except: pass
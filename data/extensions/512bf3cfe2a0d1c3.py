@@ -0,0 +1,29 @@
+# Tool: auto_procedural_count_TODO_55_1770331482
+# Description: count TODO in project and report
+
+import datetime
+import random
+import sys
+import time
+import os
+
+def run_task():
+    print(f'Task: count TODO in project and report')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project...')
+    target_files = []
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                target_files.append(os.path.join(root, file))
+    found_items = []
+    for path in target_files:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                for i, line in enumerate(f, 1):
+                    if 'TODO' in line:
+                        item = {'file': path, 'line': i, 'content': line.strip()}
+                        found_items.append(item)
+                        print(f'{path}:{i} -> {line.strip()}')
+        except: pass
@@ -0,0 +1,22 @@
+# Tool: auto_evo_test
+# Description: find TODO comments and save to json report
+
+import os
+import time
+import re
+import json
+import sys
+
+def run_task():
+    print(f'Task: find TODO comments and save to json report')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project for TODOs...')
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                path = os.path.join(root, file)
+                with open(path, 'r', encoding='utf-8') as f:
+                    for i, line in enumerate(f, 1):
+                        if 'TODO' in line:
+                            print(f'{file}:{i} -> {line.strip()}')
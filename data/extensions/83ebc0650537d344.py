@@ -0,0 +1,39 @@
+# Tool: auto_procedural_count_TODO_48_1770331573
+# Description: count TODO in project and save to json
+
+import datetime
+import random
+import sys
+import time
+import os
+import json
+
+def run_task():
+    print(f'Task: count TODO in project and save to json')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project...')
+    target_files = []
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                target_files.append(os.path.join(root, file))
+    found_items = []
+    for path in target_files:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                for i, line in enumerate(f, 1):
+                    if 'TODO' in line:
+                        item = {'file': path, 'line': i, 'content': line.strip()}
+                        found_items.append(item)
+                        print(f'{path}:{i} -> {line.strip()}')
+        except: pass
+    # Saving Report
+    report_data = []
+    if 'found_items' in locals(): report_data = found_items
+    elif 'all_funcs' in locals(): report_data = all_funcs
+    elif 'target_files' in locals(): report_data = target_files
+    
+    filename = 'auto_report.json'
+    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
+    print(f'Report saved to {filename}')
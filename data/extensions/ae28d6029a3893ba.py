@@ -0,0 +1,26 @@
+# Tool: auto_evo_test
+# Description: find TODO comments and save to json report
+
+import json
+import time
+import re
+import os
+import sys
+
+def run_task():
+    print(f'Task: find TODO comments and save to json report')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project for TODOs (JSON Mode)...')
+    todos = []
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                path = os.path.join(root, file)
+                with open(path, 'r', encoding='utf-8') as f:
+                    for i, line in enumerate(f, 1):
+                        if 'TODO' in line:
+                            todos.append({'file': file, 'line': i, 'content': line.strip()})
+    print(json.dumps(todos, indent=2))
+    with open('todo_report.json', 'w') as f: json.dump(todos, f, indent=2)
+    print('Report saved to todo_report.json')
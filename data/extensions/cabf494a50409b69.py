@@ -0,0 +1,41 @@
+# Tool: auto_procedural_analyze_classes_26_1770332240
+# Description: analyze classes in project and save to json
+
+import datetime
+import ast
+import time
+import os
+import sys
+import json
+import random
+
+def run_task():
+    print(f'Task: analyze classes in project and save to json')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project...')
+    target_files = []
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                target_files.append(os.path.join(root, file))
+    all_funcs = []
+    for path in target_files:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
+            tree = ast.parse(content)
+            funcs = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+            if funcs:
+                print(f'{path}: {funcs}')
+                all_funcs.extend(funcs)
+        except: pass
+    print(f'Total Functions Found: {len(all_funcs)}')
+    # Saving Report
+    report_data = []
+    if 'found_items' in locals(): report_data = found_items
+    elif 'all_funcs' in locals(): report_data = all_funcs
+    elif 'target_files' in locals(): report_data = target_files
+    
+    filename = 'auto_report.json'
+    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
+    print(f'Report saved to {filename}')
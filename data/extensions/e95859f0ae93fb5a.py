@@ -0,0 +1,21 @@
+# Tool: auto_find_todos_1770330296
+# Description: find TODO comments in project
+
+import sys
+import os
+import re
+import time
+
+def run_task():
+    print(f'Task: find TODO comments in project')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project for TODOs...')
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                path = os.path.join(root, file)
+                with open(path, 'r', encoding='utf-8') as f:
+                    for i, line in enumerate(f, 1):
+                        if 'TODO' in line:
+                            print(f'{file}:{i} -> {line.strip()}')
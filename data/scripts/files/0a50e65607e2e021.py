@@ -0,0 +1,14 @@
+# Tool: auto_parse_dates_1770326948
+# Description: parse dates
+
+import datetime
+import time
+
+def run_task():
+    now = datetime.datetime.now()
+    print(f'Current System Time: {now}')
+    future = now + datetime.timedelta(days=100)
+    print(f'Date in 100 days: {future}')
+
+if __name__ == '__main__':
+    run_task()
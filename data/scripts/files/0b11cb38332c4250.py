@@ -0,0 +1,14 @@
+# Tool: auto_sort_dates_1770326868
+# Description: sort dates
+
+import datetime
+import time
+
+def run_task():
+    now = datetime.datetime.now()
+    print(f'Current System Time: {now}')
+    future = now + datetime.timedelta(days=100)
+    print(f'Date in 100 days: {future}')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,7 @@
+# Tool: auto_file_logger_1770326326
+# Description: write a log to a text file
+
+filename = 'test_gen.txt'
+with open(filename, 'w') as f:
+    f.write('Generated by Neural Brain.')
+print(f'Wrote to {filename}')
@@ -0,0 +1,18 @@
+# Tool: auto_sort_numbers_1770330391
+# Description: sort a list of random numbers
+
+import sys
+import os
+import random
+import time
+
+def run_task():
+    print(f'Task: sort a list of random numbers')
+    print(f'CWD: {os.getcwd()}')
+    data = [random.randint(1, 100) for _ in range(10)]
+    print(f'Original: {data}')
+    sorted_data = sorted(data)
+    print(f'Sorted:   {sorted_data}')
+
+
+run_task()
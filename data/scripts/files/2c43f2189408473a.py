@@ -0,0 +1,13 @@
+# Tool: auto_analyze_dates_1770327528
+# Description: analyze dates
+
+import datetime
+import time
+
+def run_task():
+    now = datetime.datetime.now()
+    print('Analysis complete.')
+
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,12 @@
+# Tool: auto_calculate_list_of_numbers_1770326968
+# Description: calculate list of numbers
+
+import math
+import time
+
+def run_task():
+    print('Executing generic task: calculate list of numbers')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
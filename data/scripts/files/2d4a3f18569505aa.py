@@ -0,0 +1,15 @@
+# Tool: auto_analyze_random_dice_1770327568
+# Description: analyze random dice
+
+import random
+import time
+
+def run_task():
+    rolls = [random.randint(1, 6) for _ in range(5)]
+    print(f'Rolled: {rolls}')
+    total = sum(data if 'list' in locals() else rolls)
+    print(f'Sum: {total}')
+
+
+if __name__ == '__main__':
+    run_task()
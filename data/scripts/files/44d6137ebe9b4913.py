@@ -0,0 +1,211 @@
+import sys
+import os
+import json
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
+                             QHBoxLayout, QListWidget, QPlainTextEdit, QLabel, 
+                             QPushButton, QInputDialog, QMessageBox, QSplitter)
+from PyQt6.QtGui import QColor, QFont, QIcon
+from PyQt6.QtCore import Qt
+
+class ScriptLibrary(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Project Genesis - Script Library")
+        self.resize(1000, 700)
+        
+        self.save_file = "genesis_scripts.json"
+        self.scripts_data = {} # { "Script Name": "print('hello')" }
+        self.current_script = None
+
+        # --- UI STYLING (Matching the DAG) ---
+        self.setStyleSheet("""
+            QMainWindow { background-color: #1e1e1e; }
+            QWidget { color: #d4d4d4; font-family: 'Segoe UI'; font-size: 14px; }
+            
+            /* The List Sidebar */
+            QListWidget {
+                background-color: #252526;
+                border: 1px solid #3e3e42;
+                border-radius: 4px;
+                padding: 5px;
+                outline: none;
+            }
+            QListWidget::item { padding: 8px; border-radius: 4px; }
+            QListWidget::item:selected { background-color: #37373d; color: white; }
+            QListWidget::item:hover { background-color: #2a2d2e; }
+
+            /* The Code Editor */
+            QPlainTextEdit {
+                background-color: #1e1e1e;
+                border: 1px solid #3e3e42;
+                border-radius: 4px;
+                font-family: 'Consolas', 'Courier New', monospace;
+                font-size: 13px;
+                color: #dcdcaa; /* VS Code Yellow-ish for text */
+                padding: 10px;
+            }
+
+            /* Buttons */
+            QPushButton { 
+                background-color: #007acc; color: white; border: none; 
+                padding: 6px 15px; border-radius: 4px;
+            }
+            QPushButton:hover { background-color: #0062a3; }
+            QPushButton#DeleteBtn { background-color: #d73a49; }
+            QPushButton#DeleteBtn:hover { background-color: #a32a35; }
+            QPushButton#NavBtn { background-color: #3e3e42; border: 1px solid #555; }
+            QPushButton#NavBtn:hover { background-color: #505055; }
+        """)
+
+        # --- Main Layout ---
+        central = QWidget()
+        self.setCentralWidget(central)
+        main_layout = QVBoxLayout(central)
+
+        # 1. Toolbar
+        toolbar = QHBoxLayout()
+        
+        self.btn_home = QPushButton("🏠 Menu")
+        self.btn_home.setObjectName("NavBtn")
+        self.btn_home.clicked.connect(self.return_to_launcher)
+        toolbar.addWidget(self.btn_home)
+
+        toolbar.addSpacing(15)
+        lbl_title = QLabel("Script Treasury")
+        lbl_title.setStyleSheet("font-weight: bold; font-size: 16px;")
+        toolbar.addWidget(lbl_title)
+
+        toolbar.addStretch()
+
+        self.btn_new = QPushButton("+ New Script")
+        self.btn_new.clicked.connect(self.new_script)
+        toolbar.addWidget(self.btn_new)
+
+        self.btn_save = QPushButton("💾 Save Changes")
+        self.btn_save.clicked.connect(self.save_current_script)
+        toolbar.addWidget(self.btn_save)
+
+        self.btn_copy = QPushButton("📋 Copy Code")
+        self.btn_copy.clicked.connect(self.copy_to_clipboard)
+        self.btn_copy.setStyleSheet("background-color: #2da44e;") # Github Green
+        toolbar.addWidget(self.btn_copy)
+
+        self.btn_delete = QPushButton("🗑️ Delete")
+        self.btn_delete.setObjectName("DeleteBtn")
+        self.btn_delete.clicked.connect(self.delete_script)
+        toolbar.addWidget(self.btn_delete)
+
+        main_layout.addLayout(toolbar)
+
+        # 2. Splitter (Sidebar vs Editor)
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        
+        # Left: List
+        self.script_list = QListWidget()
+        self.script_list.setFixedWidth(250)
+        self.script_list.currentItemChanged.connect(self.load_selected_script)
+        splitter.addWidget(self.script_list)
+
+        # Right: Editor
+        self.editor = QPlainTextEdit()
+        self.editor.setPlaceholderText("Select or create a script to begin writing...")
+        splitter.addWidget(self.editor)
+
+        splitter.setCollapsible(0, False)
+        splitter.setCollapsible(1, False)
+        main_layout.addWidget(splitter)
+
+        # Load Data
+        self.load_data()
+
+    # --- LOGIC ---
+    def load_data(self):
+        """Loads scripts from JSON."""
+        if os.path.exists(self.save_file):
+            try:
+                with open(self.save_file, 'r') as f:
+                    self.scripts_data = json.load(f)
+            except:
+                self.scripts_data = {}
+        
+        self.script_list.clear()
+        self.script_list.addItems(sorted(self.scripts_data.keys()))
+
+    def save_data(self):
+        """Writes data to JSON."""
+        try:
+            with open(self.save_file, 'w') as f:
+                json.dump(self.scripts_data, f, indent=4)
+        except Exception as e:
+            print(f"Save error: {e}")
+
+    def new_script(self):
+        name, ok = QInputDialog.getText(self, "New Script", "Script Name:")
+        if ok and name:
+            if name in self.scripts_data:
+                QMessageBox.warning(self, "Error", "Script already exists!")
+                return
+            
+            # Save current before switching
+            if self.current_script:
+                self.save_current_script()
+
+            # Create new
+            self.scripts_data[name] = "" # Empty content
+            self.script_list.addItem(name)
+            self.script_list.setCurrentRow(self.script_list.count() - 1)
+            self.save_data()
+
+    def load_selected_script(self, current, previous):
+        """Called when user clicks a list item."""
+        # 1. Save previous if exists
+        if previous:
+            prev_name = previous.text()
+            if prev_name in self.scripts_data:
+                self.scripts_data[prev_name] = self.editor.toPlainText()
+        
+        # 2. Load new
+        if current:
+            self.current_script = current.text()
+            content = self.scripts_data.get(self.current_script, "")
+            self.editor.setPlainText(content)
+        else:
+            self.current_script = None
+            self.editor.clear()
+
+    def save_current_script(self):
+        if self.current_script:
+            self.scripts_data[self.current_script] = self.editor.toPlainText()
+            self.save_data()
+            # Visual feedback in status bar (optional) could go here
+
+    def delete_script(self):
+        if not self.current_script: return
+        
+        confirm = QMessageBox.question(self, "Delete", f"Delete '{self.current_script}'?", 
+                                       QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        if confirm == QMessageBox.StandardButton.Yes:
+            del self.scripts_data[self.current_script]
+            self.save_data()
+            self.load_data() # Refresh list
+            self.editor.clear()
+
+    def copy_to_clipboard(self):
+        cb = QApplication.clipboard()
+        cb.setText(self.editor.toPlainText())
+
+    def return_to_launcher(self):
+        self.save_current_script() # Auto-save
+        try:
+            from launcher import GenesisLauncher
+            self.launcher = GenesisLauncher()
+            self.launcher.show()
+            self.close()
+        except ImportError:
+            QMessageBox.warning(self, "Error", "launcher.py not found.")
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = ScriptLibrary()
+    window.show()
+    sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,11 @@
+# Tool: auto_generate_file_logs_1770327019
+# Description: generate file logs
+
+import time
+
+def run_task():
+    print('Executing generic task: generate file logs')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
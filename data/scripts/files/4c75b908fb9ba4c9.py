@@ -0,0 +1,12 @@
+# Tool: auto_generic_task_1770327159
+# Description: perform a generic calculation
+
+import math
+import time
+
+def run_task():
+    print('Executing generic task: perform a generic calculation')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
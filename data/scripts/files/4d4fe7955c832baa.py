@@ -0,0 +1,7 @@
+# Tool: calc_pi
+# Description: Create a tool named calc_pi that calculates pi.
+
+import math
+
+print(f'Square root of 16 is {math.sqrt(16)}')
+print(f'2 to the power of 5 is {math.pow(2, 5)}')
@@ -0,0 +1,7 @@
+# Tool: auto_fibonacci_1770326234
+# Description: calculate the first 10 fibonacci numbers
+
+import math
+
+print(f'Square root of 16 is {math.sqrt(16)}')
+print(f'2 to the power of 5 is {math.pow(2, 5)}')
@@ -0,0 +1,14 @@
+# Tool: auto_generate_prime_numbers_1770327648
+# Description: generate prime numbers
+
+import math
+import time
+
+def run_task():
+    print('Initializing generic task...')
+    primes = [x for x in range(2, 50) if all(x % i != 0 for i in range(2, int(math.sqrt(x))+1))]
+    print(f'Primes < 50: {primes}')
+
+
+if __name__ == '__main__':
+    run_task()
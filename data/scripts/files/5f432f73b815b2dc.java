@@ -0,0 +1,6 @@
+# Tool: lucky_dice
+# Description: Create a new tool named lucky_dice that rolls a random number
+
+import random
+
+print(f'Rolling dice: {random.randint(1, 6)}')
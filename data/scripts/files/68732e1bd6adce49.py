@@ -0,0 +1,18 @@
+# Tool: auto_calculate_prime_numbers_1770327029
+# Description: calculate prime numbers
+
+import math
+import time
+
+def is_prime(n):
+    if n < 2: return False
+    for i in range(2, int(math.sqrt(n)) + 1):
+        if n % i == 0: return False
+    return True
+
+def run_task():
+    num = random.randint(10, 100)
+    print(f'Checking if {num} is prime: {is_prime(num)}')
+
+if __name__ == '__main__':
+    run_task()
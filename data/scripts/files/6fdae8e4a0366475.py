@@ -0,0 +1,15 @@
+# Tool: auto_calculate_dates_1770326918
+# Description: calculate dates
+
+import datetime
+import math
+import time
+
+def run_task():
+    now = datetime.datetime.now()
+    print(f'Current System Time: {now}')
+    future = now + datetime.timedelta(days=100)
+    print(f'Date in 100 days: {future}')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,15 @@
+# Tool: auto_analyze_list_of_numbers_1770327608
+# Description: analyze list of numbers
+
+import random
+import time
+
+def run_task():
+    data = [random.randint(1, 100) for _ in range(10)]
+    print(f'Original Data: {data}')
+    total = sum(data if 'list' in locals() else rolls)
+    print(f'Sum: {total}')
+
+
+if __name__ == '__main__':
+    run_task()
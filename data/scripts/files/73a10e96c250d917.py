@@ -0,0 +1,25 @@
+# Tool: auto_map_directory_depth_1770330341
+# Description: map directory structure with depth and classes
+
+import sys
+import os
+import time
+
+def run_task():
+    print(f'Task: map directory structure with depth and classes')
+    print(f'CWD: {os.getcwd()}')
+    print('Deep Project Map (Files + Classes):')
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        print(f'{root}/')
+        for f in files:
+            if f.endswith('.py'):
+                path = os.path.join(root, f)
+                classes = []
+                try:
+                    with open(path, 'r') as pf: classes = [l.split()[1].split('(')[0] for l in pf if l.startswith('class ')]
+                except: pass
+                print(f'  - {f} {classes}')
+
+
+run_task()
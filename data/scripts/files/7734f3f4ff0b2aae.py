@@ -0,0 +1,23 @@
+# Tool: auto_map_directory_v2_1770330371
+# Description: map directory structure
+
+import sys
+import os
+import time
+
+def run_task():
+    print(f'Task: map directory structure')
+    print(f'CWD: {os.getcwd()}')
+    print('Project Structure:')
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        level = root.replace('.', '').count(os.sep)
+        indent = ' ' * 4 * (level)
+        print(f'{indent}{os.path.basename(root)}/')
+        subindent = ' ' * 4 * (level + 1)
+        for f in files:
+            if f.endswith('.py'):
+                 print(f'{subindent}{f}')
+
+
+run_task()
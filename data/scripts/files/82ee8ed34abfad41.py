@@ -0,0 +1,31 @@
+# Tool: auto_count_lines_1770331442
+# Description: count lines in script_library.py
+
+import datetime
+import random
+import sys
+import time
+import os
+
+def run_task():
+    print(f'Task: count lines in script_library.py')
+    print(f'CWD: {os.getcwd()}')
+    print('Scanning project...')
+    target_files = []
+    for root, dirs, files in os.walk('.'):
+        if '.venv' in root or '.git' in root: continue
+        for file in files:
+            if file.endswith('.py'):
+                target_files.append(os.path.join(root, file))
+    total_lines = 0
+    for path in target_files:
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                lines = len(f.readlines())
+                total_lines += lines
+                print(f'{path}: {lines}')
+        except: pass
+    print(f'Total Lines: {total_lines}')
+
+
+run_task()
@@ -0,0 +1,13 @@
+# Tool: auto_analyze_prime_numbers_1770327548
+# Description: analyze prime numbers
+
+import math
+import time
+
+def run_task():
+    print('Initializing generic task...')
+    print('Analysis complete.')
+
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,14 @@
+# Tool: auto_calculate_json_data_1770327598
+# Description: calculate json data
+
+import math
+import time
+import json
+
+def run_task():
+    data = {'id': 1, 'status': 'active', 'values': [10, 20, 30]}
+    print('Analysis complete.')
+
+
+if __name__ == '__main__':
+    run_task()
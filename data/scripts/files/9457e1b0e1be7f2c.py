@@ -0,0 +1,16 @@
+# Tool: auto_calculate_random_dice_1770327558
+# Description: calculate random dice
+
+import random
+import math
+import time
+
+def run_task():
+    rolls = [random.randint(1, 6) for _ in range(5)]
+    print(f'Rolled: {rolls}')
+    total = sum(data if 'list' in locals() else rolls)
+    print(f'Sum: {total}')
+
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,11 @@
+# Tool: auto_analyze_file_logs_1770326898
+# Description: analyze file logs
+
+import time
+
+def run_task():
+    print('Executing generic task: analyze file logs')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,8 @@
+# Tool: auto_list_sorter_1770326390
+# Description: sort a list of numbers
+
+def run_task():
+    print('Executing task: sort a list of numbers')
+    print('Task complete.')
+
+run_task()
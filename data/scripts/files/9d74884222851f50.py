@@ -0,0 +1,15 @@
+# Tool: auto_parse_json_data_1770327628
+# Description: parse json data
+
+import time
+import json
+
+def run_task():
+    data = {'id': 1, 'status': 'active', 'values': [10, 20, 30]}
+    json_str = json.dumps(data)
+    parsed = json.loads(json_str)
+    print(f'Parsed JSON keys: {list(parsed.keys())}')
+
+
+if __name__ == '__main__':
+    run_task()
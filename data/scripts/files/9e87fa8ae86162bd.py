@@ -0,0 +1,8 @@
+# Tool: auto_timer_wait_1770326378
+# Description: wait for 1 second
+
+import time
+
+print('Timer started...')
+time.sleep(2)
+print('Timer finished!')
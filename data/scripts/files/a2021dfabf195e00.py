@@ -0,0 +1,14 @@
+# Tool: auto_sort_prime_numbers_1770327518
+# Description: sort prime numbers
+
+import math
+import time
+
+def run_task():
+    print('Initializing generic task...')
+    result = sorted(data)
+    print(f'Sorted: {result}')
+
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,12 @@
+# Tool: auto_calculate_file_logs_1770326908
+# Description: calculate file logs
+
+import math
+import time
+
+def run_task():
+    print('Executing generic task: calculate file logs')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,692 @@
+import sys
+import os
+import ctypes
+import json
+import uuid 
+import math
+
+# --- Safe Import Logic ---
+def show_error_and_exit(missing_module):
+    """Displays a native error dialog and exits."""
+    message = (f"Error: Could not import '{missing_module}'.\n\n"
+               "Please ensure you are running this script within the Python Virtual Environment.\n"
+               "Try running: .venv\\Scripts\\python.exe workflow_organizer.py")
+    title = "Dependency Missing"
+    ctypes.windll.user32.MessageBoxW(0, message, title, 0x10 | 0x0)
+    sys.exit(1)
+
+try:
+    from PyQt6.QtWidgets import (QApplication, QMainWindow, QGraphicsView, 
+                                 QGraphicsScene, QVBoxLayout, QHBoxLayout, QWidget, QLabel, 
+                                 QGraphicsRectItem, QGraphicsItem, QGraphicsTextItem, 
+                                 QPushButton, QGraphicsLineItem, QMenu, QFileDialog, 
+                                 QInputDialog, QComboBox, QMessageBox)
+    from PyQt6.QtGui import QColor, QFont, QPen, QBrush, QAction, QDesktopServices, QPainter, QCursor, QTransform
+    from PyQt6.QtCore import Qt, QTimer, QLineF, QUrl, QPointF, QRectF
+except ImportError:
+    show_error_and_exit("PyQt6")
+
+# --- 1. Custom Graphics View ---
+class SmartView(QGraphicsView):
+    def __init__(self, scene, main_window_ref):
+        super().__init__(scene)
+        self.main_window = main_window_ref 
+        self.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self.setDragMode(QGraphicsView.DragMode.RubberBandDrag) 
+        self.setTransformationAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorUnderMouse)
+        
+        self._is_panning = False
+        self._pan_start = QPointF(0, 0)
+        
+        self._current_zoom = 1.0
+        self._min_zoom = 0.5  
+        self._max_zoom = 2.0 
+
+        self.grid_color_light = QColor("#2d2d30")
+        self.grid_color_dark = QColor("#1e1e1e")
+        self.setBackgroundBrush(self.grid_color_dark)
+
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        
+        grid_size = 50
+        left = int(rect.left()) - (int(rect.left()) % grid_size)
+        top = int(rect.top()) - (int(rect.top()) % grid_size)
+        
+        lines = []
+        right = int(rect.right())
+        bottom = int(rect.bottom())
+        
+        for x in range(left, right, grid_size):
+            lines.append(QLineF(x, rect.top(), x, rect.bottom()))
+        
+        for y in range(top, bottom, grid_size):
+            lines.append(QLineF(rect.left(), y, rect.right(), y))
+
+        pen = QPen(self.grid_color_light)
+        pen.setWidth(1)
+        painter.setPen(pen)
+        painter.drawLines(lines)
+
+    def keyPressEvent(self, event):
+        focus_item = self.scene().focusItem()
+        if isinstance(focus_item, QGraphicsTextItem):
+            super().keyPressEvent(event)
+            return
+
+        if event.key() == Qt.Key.Key_Space:
+            self.main_window.focus_camera_on_nodes()
+        else:
+            super().keyPressEvent(event)
+
+    def wheelEvent(self, event):
+        if event.modifiers() & Qt.KeyboardModifier.ShiftModifier:
+            zoom_in_factor = 1.1
+            zoom_out_factor = 1 / zoom_in_factor
+
+            if event.angleDelta().y() > 0:
+                zoom_factor = zoom_in_factor
+            else:
+                zoom_factor = zoom_out_factor
+            
+            new_zoom = self._current_zoom * zoom_factor
+
+            if self._min_zoom <= new_zoom <= self._max_zoom:
+                self.scale(zoom_factor, zoom_factor)
+                self._current_zoom = new_zoom
+        else:
+            super().wheelEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.MiddleButton:
+            self._is_panning = True
+            self._pan_start = event.position()
+            self.setCursor(Qt.CursorShape.ClosedHandCursor)
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._is_panning:
+            delta = event.position() - self._pan_start
+            self._pan_start = event.position()
+            
+            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - int(delta.x()))
+            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - int(delta.y()))
+            event.accept()
+        else:
+            super().mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MouseButton.MiddleButton:
+            self._is_panning = False
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+            event.accept()
+        else:
+            super().mouseReleaseEvent(event)
+
+# --- 2. The Connection Line Class ---
+class ConnectionLine(QGraphicsLineItem):
+    def __init__(self, start_node, end_node):
+        super().__init__()
+        self.start_node = start_node
+        self.end_node = end_node
+        
+        pen = QPen(QColor("#666666"))
+        pen.setWidth(2)
+        pen.setStyle(Qt.PenStyle.DashLine) 
+        self.setPen(pen)
+        self.setZValue(-1) 
+        
+        self.update_position()
+
+    def update_position(self):
+        if not self.start_node.scene() or not self.end_node.scene():
+            return
+
+        start_pos = self.start_node.scenePos()
+        end_pos = self.end_node.scenePos()
+        
+        offset_x = 100 
+        offset_y = 40
+        source_point = start_pos + QPointF(offset_x, offset_y)
+        dest_point = end_pos + QPointF(offset_x, offset_y)
+        self.setLine(QLineF(source_point, dest_point))
+
+# --- 3. The Smart Node Class ---
+class SmartNode(QGraphicsRectItem):
+    def __init__(self, name, x, y, main_window_ref, watch_path=None, node_id=None):
+        super().__init__(0, 0, 200, 80) 
+        
+        self.main_window = main_window_ref 
+        self.name = name
+        self.id = node_id if node_id else str(uuid.uuid4()) 
+        
+        self.watch_path = watch_path
+        self.attachment_type = "None" 
+        self.connected_lines = [] 
+        self.custom_color = None 
+        self.is_completed = False 
+        self.is_start_node = False 
+        
+        self.setPos(x, y)
+
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable)
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges)
+
+        # Default Pens
+        self.pen_default = QPen(Qt.PenStyle.NoPen)
+        # Gold Pen for Start Node
+        self.pen_start = QPen(QColor("#FFD700")) 
+        self.pen_start.setWidth(3)
+
+        self.brush_pending = QBrush(QColor("#3e3e42")) 
+        self.brush_done = QBrush(QColor("#2da44e"))   
+        self.brush_link = QBrush(QColor("#007acc"))   
+        self.brush_disabled = QBrush(QColor("#252526")) 
+        
+        self.setBrush(self.brush_pending)
+        self.setPen(self.pen_default)
+
+        # Title
+        self.text_item = QGraphicsTextItem(name, self)
+        self.set_text_style(completed=False)
+        self.text_item.setPos(10, 15)
+        self.text_item.setTextInteractionFlags(Qt.TextInteractionFlag.TextEditorInteraction)
+        self.text_item.document().contentsChanged.connect(self.update_name_from_text)
+
+        # Type Indicator
+        self.type_item = QGraphicsTextItem("", self)
+        self.type_item.setDefaultTextColor(QColor("#aaaaaa"))
+        self.type_item.setFont(QFont("Segoe UI", 8))
+        self.type_item.setPos(10, 45)
+
+    def set_text_style(self, completed=False):
+        font = QFont("Segoe UI", 11, QFont.Weight.Bold)
+        if completed:
+            font.setStrikeOut(True)
+            self.text_item.setDefaultTextColor(QColor("#B0B0B0"))
+        else:
+            font.setStrikeOut(False)
+            self.text_item.setDefaultTextColor(Qt.GlobalColor.white)
+        self.text_item.setFont(font)
+
+    def update_name_from_text(self):
+        self.name = self.text_item.toPlainText()
+
+    def contextMenuEvent(self, event):
+        menu = QMenu()
+        
+        # Start Node Toggle
+        if self.is_start_node:
+            action_start = menu.addAction("🚫 Unset Start Node")
+        else:
+            action_start = menu.addAction("🏁 Set as Start Node")
+        action_start.triggered.connect(self.toggle_start_node)
+
+        menu.addSeparator()
+
+        if self.is_completed:
+            action_done = menu.addAction("Incomplete Task")
+        else:
+            action_done = menu.addAction("✅ Mark as Done")
+        action_done.triggered.connect(self.toggle_complete)
+        
+        menu.addSeparator()
+
+        color_menu = menu.addMenu("🎨 Set Color")
+        colors = {"Default": None, "Urgent (Red)": "#d73a49", "Work (Blue)": "#0366d6", 
+                  "Idea (Purple)": "#6f42c1", "Warning (Orange)": "#d19a66"}
+        for name, hex_code in colors.items():
+            action = color_menu.addAction(name)
+            action.triggered.connect(lambda checked, h=hex_code: self.set_custom_color(h))
+
+        menu.addSeparator()
+
+        action_file = menu.addAction("📄 Attach File")
+        action_file.triggered.connect(self.browse_file)
+        action_folder = menu.addAction("📁 Attach Folder")
+        action_folder.triggered.connect(self.browse_folder)
+        action_link = menu.addAction("🌐 Attach Web Link")
+        action_link.triggered.connect(self.input_link)
+        
+        if self.watch_path:
+            menu.addSeparator()
+            action_open = menu.addAction("🚀 Open Attachment")
+            action_open.triggered.connect(self.open_attachment)
+            action_remove = menu.addAction("❌ Remove Attachment")
+            action_remove.triggered.connect(self.remove_attachment)
+
+        menu.addSeparator()
+        action_delete = menu.addAction("🗑️ Delete Node")
+        action_delete.triggered.connect(self.delete_self)
+
+        menu.exec(event.screenPos())
+
+    def toggle_start_node(self):
+        self.is_start_node = not self.is_start_node
+        self.check_status() 
+
+    def delete_self(self):
+        self.main_window.delete_node(self)
+
+    def toggle_complete(self):
+        self.is_completed = not self.is_completed
+        self.set_text_style(self.is_completed)
+        self.check_status()
+        self.main_window.update_progress()
+
+    def set_custom_color(self, color_hex):
+        self.custom_color = color_hex
+        self.check_status()
+
+    def browse_file(self):
+        path, _ = QFileDialog.getOpenFileName(None, "Select File")
+        if path: self.set_attachment(path, "File")
+
+    def browse_folder(self):
+        path = QFileDialog.getExistingDirectory(None, "Select Folder")
+        if path: self.set_attachment(path, "Folder")
+
+    def input_link(self):
+        text, ok = QInputDialog.getText(None, "Attach Link", "Enter URL:")
+        if ok and text: self.set_attachment(text, "Link")
+
+    def remove_attachment(self):
+        self.watch_path = None
+        self.attachment_type = "None"
+        self.check_status()
+
+    def set_attachment(self, path, type_name):
+        self.watch_path = path
+        self.attachment_type = type_name
+        self.check_status() 
+
+    def open_attachment(self):
+        if self.watch_path:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(self.watch_path) if self.attachment_type != "Link" else QUrl(self.watch_path))
+
+    def itemChange(self, change, value):
+        if change == QGraphicsItem.GraphicsItemChange.ItemPositionChange:
+            for line in self.connected_lines:
+                line.update_position()
+            
+            # --- CRASH FIX ---
+            # Removed the ensureVisible call. 
+            # It creates infinite recursion loops during drag events.
+            # Stability is prioritized over auto-scroll.
+            
+        return super().itemChange(change, value)
+
+    def check_status(self):
+        if self.attachment_type == "None":
+            self.type_item.setPlainText("")
+        else:
+            display_text = self.watch_path if len(self.watch_path) < 25 else "..." + self.watch_path[-22:]
+            self.type_item.setPlainText(f"[{self.attachment_type}] {display_text}")
+
+        # Border Logic
+        if self.is_start_node:
+            self.setPen(self.pen_start)
+        else:
+            self.setPen(self.pen_default)
+
+        # Color/Opacity Logic
+        if self.is_completed:
+            self.setBrush(self.brush_disabled)
+            self.setOpacity(0.9) 
+            self.setToolTip("Status: Completed")
+            return
+        
+        self.setOpacity(1.0) 
+
+        if self.custom_color:
+            self.setBrush(QBrush(QColor(self.custom_color)))
+            self.setToolTip("Status: Custom Color")
+        elif self.attachment_type == "Link":
+            self.setBrush(self.brush_link)
+            self.setToolTip(f"Link: {self.watch_path}")
+        elif self.watch_path and os.path.exists(self.watch_path):
+            self.setBrush(self.brush_done)
+            self.setToolTip(f"Ready: {self.watch_path}")
+        else:
+            self.setBrush(self.brush_pending)
+            self.setToolTip(f"Pending: {self.watch_path}")
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "x": self.x(),
+            "y": self.y(),
+            "watch_path": self.watch_path,
+            "attachment_type": self.attachment_type,
+            "custom_color": self.custom_color,
+            "is_completed": self.is_completed,
+            "is_start_node": self.is_start_node 
+        }
+
+# --- 4. The Main Window ---
+class SmartWorkflowOrganizer(QMainWindow):
+    def __init__(self):
+        super().__init__()
+
+        self.setWindowTitle("Project Genesis - Workflow Organizer")
+        self.resize(1200, 800) 
+
+        self.save_file_path = "genesis_data.json"
+        self.pipelines_data = {} 
+        self.current_pipeline_name = "Default Project"
+
+        self.setStyleSheet("""
+            QMainWindow { background-color: #1e1e1e; }
+            QGraphicsView { background-color: #1e1e1e; border: 1px solid #3e3e42;}
+            QLabel { color: #d4d4d4; font-family: 'Segoe UI'; }
+            QPushButton { 
+                background-color: #007acc; color: white; border: none; 
+                padding: 6px 12px; font-size: 13px; border-radius: 4px;
+            }
+            QPushButton:hover { background-color: #0062a3; }
+            QComboBox { 
+                background-color: #3e3e42; color: white; padding: 5px; border-radius: 4px; min-width: 150px;
+            }
+            QMenu { background-color: #252526; color: white; border: 1px solid #3e3e42; }
+            QMenu::item:selected { background-color: #007acc; }
+        """)
+
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        
+        # --- Toolbar ---
+        toolbar_layout = QHBoxLayout()
+        
+        self.btn_home = QPushButton("🏠 Menu")
+        self.btn_home.setFixedWidth(80)
+        self.btn_home.setStyleSheet("background-color: #3e3e42; border: 1px solid #555;")
+        self.btn_home.clicked.connect(self.return_to_launcher)
+        toolbar_layout.addWidget(self.btn_home)
+
+        toolbar_layout.addSpacing(10)
+
+        lbl_pipe = QLabel("Project:")
+        lbl_pipe.setFont(QFont("Segoe UI", 12, QFont.Weight.Bold))
+        toolbar_layout.addWidget(lbl_pipe)
+
+        self.combo_pipelines = QComboBox()
+        self.combo_pipelines.currentIndexChanged.connect(self.change_pipeline)
+        toolbar_layout.addWidget(self.combo_pipelines)
+
+        self.btn_proj_opt = QPushButton("⚙️")
+        self.btn_proj_opt.setFixedWidth(40)
+        self.btn_proj_opt.clicked.connect(self.show_project_options)
+        toolbar_layout.addWidget(self.btn_proj_opt)
+
+        self.btn_new_pipe = QPushButton("+ New")
+        self.btn_new_pipe.clicked.connect(self.create_new_pipeline)
+        toolbar_layout.addWidget(self.btn_new_pipe)
+
+        toolbar_layout.addSpacing(20)
+        self.progress_label = QLabel("0 / 0 Completed")
+        self.progress_label.setStyleSheet("font-size: 14px; font-weight: bold; color: white;")
+        toolbar_layout.addWidget(self.progress_label)
+
+        toolbar_layout.addStretch() 
+        
+        self.btn_add = QPushButton("+ Add Node")
+        self.btn_add.clicked.connect(self.add_new_node_center)
+        toolbar_layout.addWidget(self.btn_add)
+
+        self.btn_connect = QPushButton("Connect Selected")
+        self.btn_connect.clicked.connect(self.connect_selected_nodes)
+        toolbar_layout.addWidget(self.btn_connect)
+        
+        main_layout.addLayout(toolbar_layout)
+
+        # Scene & Custom View
+        self.scene = QGraphicsScene()
+        self.scene.setSceneRect(0, 0, 10000, 10000) 
+        
+        self.view = SmartView(self.scene, self)
+        main_layout.addWidget(self.view)
+
+        self.nodes = [] 
+        self.lines = []
+
+        self.load_from_disk()
+        
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.update_all_nodes)
+        self.timer.start(2000) 
+
+    # --- NAVIGATION LOGIC ---
+    def return_to_launcher(self):
+        self.save_current_pipeline_to_memory()
+        self.save_to_disk()
+        try:
+            from launcher import GenesisLauncher
+            self.launcher = GenesisLauncher()
+            self.launcher.show()
+            self.close() 
+        except ImportError:
+            QMessageBox.warning(self, "Navigation Error", "Could not find 'launcher.py'.\nEnsure it is in the same directory.")
+
+    # --- FOCUS LOGIC ---
+    def focus_camera_on_nodes(self):
+        if not self.nodes:
+            return
+        min_x = min(n.x() for n in self.nodes)
+        max_x = max(n.x() + 200 for n in self.nodes)
+        min_y = min(n.y() for n in self.nodes)
+        max_y = max(n.y() + 80 for n in self.nodes)
+        center_x = (min_x + max_x) / 2
+        center_y = (min_y + max_y) / 2
+        self.view.centerOn(center_x, center_y)
+
+    # --- NODE MANAGEMENT ---
+    def delete_node(self, node):
+        for line in node.connected_lines:
+            if line in self.lines:
+                self.scene.removeItem(line)
+                self.lines.remove(line)
+        if node in self.nodes:
+            self.nodes.remove(node)
+        self.scene.removeItem(node)
+        self.update_progress()
+
+    def update_progress(self):
+        total = len(self.nodes)
+        completed = sum(1 for n in self.nodes if n.is_completed)
+        self.progress_label.setText(f"{completed} / {total} Completed")
+
+    # --- PROJECT MANAGEMENT ---
+    def show_project_options(self):
+        menu = QMenu()
+        act_rename = menu.addAction("Rename Project")
+        act_rename.triggered.connect(self.rename_project)
+        act_delete = menu.addAction("Delete Project")
+        act_delete.triggered.connect(self.delete_project)
+        menu.exec(self.btn_proj_opt.mapToGlobal(self.btn_proj_opt.rect().bottomLeft()))
+
+    def rename_project(self):
+        old_name = self.current_pipeline_name
+        new_name, ok = QInputDialog.getText(self, "Rename Project", "New Name:", text=old_name)
+        if ok and new_name and new_name != old_name:
+            if new_name in self.pipelines_data:
+                QMessageBox.warning(self, "Error", "Name already exists!")
+                return
+            
+            self.save_current_pipeline_to_memory()
+            self.pipelines_data[new_name] = self.pipelines_data.pop(old_name)
+            self.current_pipeline_name = new_name
+            
+            self.combo_pipelines.blockSignals(True)
+            idx = self.combo_pipelines.findText(old_name)
+            self.combo_pipelines.setItemText(idx, new_name)
+            self.combo_pipelines.blockSignals(False)
+
+    def delete_project(self):
+        if len(self.pipelines_data) <= 1:
+            QMessageBox.warning(self, "Error", "Cannot delete the only project.")
+            return
+
+        reply = QMessageBox.question(self, "Confirm Delete", 
+                                     f"Are you sure you want to delete '{self.current_pipeline_name}'?",
+                                     QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+        
+        if reply == QMessageBox.StandardButton.Yes:
+            del self.pipelines_data[self.current_pipeline_name]
+            self.current_pipeline_name = list(self.pipelines_data.keys())[0]
+            
+            self.combo_pipelines.blockSignals(True)
+            self.combo_pipelines.clear()
+            self.combo_pipelines.addItems(list(self.pipelines_data.keys()))
+            self.combo_pipelines.setCurrentText(self.current_pipeline_name)
+            self.combo_pipelines.blockSignals(False)
+            
+            self.load_pipeline_to_scene(self.current_pipeline_name)
+
+    # --- SAVE / LOAD ---
+    def closeEvent(self, event):
+        self.save_current_pipeline_to_memory()
+        self.save_to_disk()
+        super().closeEvent(event)
+
+    def save_current_pipeline_to_memory(self):
+        node_data = [n.to_dict() for n in self.nodes]
+        edge_data = []
+        for line in self.lines:
+            if line.start_node in self.nodes and line.end_node in self.nodes:
+                edge_data.append({
+                    "start": line.start_node.id,
+                    "end": line.end_node.id
+                })
+        
+        self.pipelines_data[self.current_pipeline_name] = {
+            "nodes": node_data,
+            "edges": edge_data
+        }
+
+    # --- ATOMIC SAFE SAVE ---
+    def save_to_disk(self):
+        """Writes to a temporary file first to prevent corruption."""
+        temp_file = self.save_file_path + ".tmp"
+        try:
+            with open(temp_file, 'w') as f:
+                json.dump(self.pipelines_data, f, indent=4)
+            
+            # If successful, replace the old file
+            if os.path.exists(self.save_file_path):
+                os.remove(self.save_file_path)
+            os.rename(temp_file, self.save_file_path)
+            print("Saved successfully.")
+        except Exception as e:
+            print(f"Save Failed: {e}")
+
+    def load_from_disk(self):
+        if os.path.exists(self.save_file_path):
+            try:
+                with open(self.save_file_path, 'r') as f:
+                    self.pipelines_data = json.load(f)
+            except Exception:
+                self.pipelines_data = {"Default Project": {"nodes": [], "edges": []}}
+        else:
+            self.pipelines_data = {"Default Project": {"nodes": [], "edges": []}}
+
+        self.combo_pipelines.blockSignals(True) 
+        self.combo_pipelines.clear()
+        self.combo_pipelines.addItems(list(self.pipelines_data.keys()))
+        self.combo_pipelines.blockSignals(False)
+
+        if self.pipelines_data:
+            self.current_pipeline_name = list(self.pipelines_data.keys())[0]
+            self.load_pipeline_to_scene(self.current_pipeline_name)
+
+    def load_pipeline_to_scene(self, pipeline_name):
+        self.scene.clear()
+        self.nodes = []
+        self.lines = []
+        
+        data = self.pipelines_data.get(pipeline_name, {"nodes": [], "edges": []})
+        
+        node_map = {} 
+        for n_data in data["nodes"]:
+            node = SmartNode(n_data["name"], n_data["x"], n_data["y"], self, 
+                             watch_path=n_data.get("watch_path"), node_id=n_data.get("id"))
+            
+            node.attachment_type = n_data.get("attachment_type", "None")
+            node.custom_color = n_data.get("custom_color")
+            node.is_completed = n_data.get("is_completed", False)
+            node.is_start_node = n_data.get("is_start_node", False) # Load start state
+            
+            node.check_status()
+            node.set_text_style(node.is_completed) 
+            
+            self.scene.addItem(node)
+            self.nodes.append(node)
+            node_map[node.id] = node
+            
+        for e_data in data["edges"]:
+            start = node_map.get(e_data["start"])
+            end = node_map.get(e_data["end"])
+            if start and end:
+                self.create_connection(start, end)
+        
+        if self.nodes:
+            self.focus_camera_on_nodes()
+        self.update_progress() 
+
+    def change_pipeline(self, index):
+        self.save_current_pipeline_to_memory()
+        new_name = self.combo_pipelines.currentText()
+        self.current_pipeline_name = new_name
+        self.load_pipeline_to_scene(new_name)
+
+    def create_new_pipeline(self):
+        name, ok = QInputDialog.getText(self, "New Project", "Project Name:")
+        if ok and name:
+            if name in self.pipelines_data:
+                QMessageBox.warning(self, "Error", "Project already exists!")
+                return
+            
+            self.save_current_pipeline_to_memory()
+            self.pipelines_data[name] = {"nodes": [], "edges": []}
+            self.combo_pipelines.addItem(name)
+            self.combo_pipelines.setCurrentText(name) 
+
+    # --- STANDARD FUNCTIONS ---
+    def add_node(self, name, x, y):
+        node = SmartNode(name, x, y, self)
+        self.scene.addItem(node)
+        self.nodes.append(node)
+        self.update_progress() # Update bar on add
+        return node
+
+    def add_new_node_center(self):
+        center = self.view.mapToScene(self.view.viewport().rect().center())
+        self.add_node("New Task", center.x() - 100, center.y() - 40)
+
+    def connect_selected_nodes(self):
+        selected_items = self.scene.selectedItems()
+        selected_nodes = [item for item in selected_items if isinstance(item, SmartNode)]
+        if len(selected_nodes) == 2:
+            self.create_connection(selected_nodes[0], selected_nodes[1])
+
+    def create_connection(self, start_node, end_node):
+        line = ConnectionLine(start_node, end_node)
+        self.scene.addItem(line)
+        self.lines.append(line)
+        start_node.connected_lines.append(line)
+        end_node.connected_lines.append(line)
+
+    def update_all_nodes(self):
+        for node in self.nodes:
+            node.check_status()
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = SmartWorkflowOrganizer()
+    window.show()
+    sys.exit(app.exec())
\ No newline at end of file
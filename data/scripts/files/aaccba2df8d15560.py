@@ -0,0 +1,8 @@
+# Tool: auto_dict_merger_1770326346
+# Description: merge two dictionaries
+
+def run_task():
+    print('Executing task: merge two dictionaries')
+    print('Task complete.')
+
+run_task()
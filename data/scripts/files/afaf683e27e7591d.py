@@ -0,0 +1,8 @@
+# Tool: auto_prime_checker_1770326306
+# Description: check if a number is prime
+
+def run_task():
+    print('Executing task: check if a number is prime')
+    print('Task complete.')
+
+run_task()
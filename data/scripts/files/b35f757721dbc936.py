@@ -0,0 +1,18 @@
+# Tool: auto_research_basics_1770332225
+# Description: research common language phrases
+
+import datetime
+import time
+import os
+import sys
+import random
+
+def run_task():
+    print(f'Task: research common language phrases')
+    print(f'CWD: {os.getcwd()}')
+    # Knowledge Acquisition
+    from ai_brain import KnowledgeSeeker
+    print(KnowledgeSeeker.research_topic('common language phrases'))
+
+
+run_task()
@@ -0,0 +1,112 @@
+import sys
+from PyQt6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, 
+                             QWidget, QLabel, QPushButton, QMessageBox)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QColor
+
+# --- Import your existing tool ---
+# This requires your previous script to be named 'workflow_organizer.py'
+try:
+    from workflow_organizer import SmartWorkflowOrganizer
+    from script_library import ScriptLibrary
+except ImportError:
+    SmartWorkflowOrganizer = None
+    ScriptLibrary = None
+
+class GenesisLauncher(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Project Genesis - Hub")
+        self.resize(800, 600)
+
+        # Apply the consistent Dark Theme
+        self.setStyleSheet("""
+            QMainWindow { background-color: #1e1e1e; }
+            QLabel { color: #d4d4d4; font-family: 'Segoe UI'; }
+            QPushButton { 
+                background-color: #252526; 
+                color: white; 
+                font-family: 'Segoe UI';
+                font-size: 16px;
+                border: 1px solid #3e3e42; 
+                padding: 15px 30px; 
+                border-radius: 8px;
+                text-align: left;
+            }
+            QPushButton:hover { 
+                background-color: #007acc; 
+                border: 1px solid #007acc;
+            }
+            QPushButton:disabled {
+                background-color: #1e1e1e;
+                color: #555555;
+                border: 1px dashed #3e3e42;
+            }
+        """)
+
+        # Central Layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        layout = QVBoxLayout(central_widget)
+        layout.setSpacing(15)
+        layout.setContentsMargins(100, 60, 100, 60) # Generous margins for a clean look
+
+        # --- Header Section ---
+        title = QLabel("PROJECT GENESIS")
+        title.setStyleSheet("font-size: 36px; font-weight: bold; color: white; letter-spacing: 2px;")
+        title.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(title)
+
+        subtitle = QLabel("Select a module to begin")
+        subtitle.setStyleSheet("font-size: 16px; color: #888888; margin-bottom: 20px;")
+        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        layout.addWidget(subtitle)
+
+        # --- Buttons Section ---
+        # 1. The Workflow Organizer (Active)
+        btn_workflow = QPushButton("📂   Workflow Organizer")
+        btn_workflow.clicked.connect(self.launch_workflow)
+        layout.addWidget(btn_workflow)
+
+        # 2. Neural Assistant (Placeholder)
+        btn_ai = QPushButton("🤖   Neural Assistant (Coming Soon)")
+        btn_ai.setEnabled(False) 
+        layout.addWidget(btn_ai)
+
+        # 3. Script Library
+        btn_scripts = QPushButton("📜   Script Library")
+        btn_scripts.clicked.connect(self.launch_library) # Connect function
+        layout.addWidget(btn_scripts)
+
+        layout.addStretch()
+
+        # Footer
+        footer = QLabel("System v1.0 | Ready")
+        footer.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        footer.setStyleSheet("color: #444444; font-size: 12px;")
+        layout.addWidget(footer)
+
+    def launch_workflow(self):
+        if SmartWorkflowOrganizer:
+            # Create the tool window
+            self.tool_window = SmartWorkflowOrganizer()
+            self.tool_window.show()
+            # Close the menu (or use self.hide() if you want to keep it running)
+            self.close()
+        else:
+            QMessageBox.critical(self, "Error", "Could not find 'workflow_organizer.py'.\nMake sure both files are in the same folder.")
+
+    def launch_library(self):
+        if ScriptLibrary:
+            self.lib_window = ScriptLibrary()
+            self.lib_window.show()
+            self.close()
+        else:
+            QMessageBox.critical(self, "Error", "Could not find 'script_library.py'.")
+
+# --- Entry Point ---
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = GenesisLauncher()
+    window.show()
+    sys.exit(app.exec())
\ No newline at end of file
@@ -0,0 +1,14 @@
+# Tool: auto_calculate_dates_1770327668
+# Description: calculate dates
+
+import datetime
+import time
+import math
+
+def run_task():
+    now = datetime.datetime.now()
+    print('Analysis complete.')
+
+
+if __name__ == '__main__':
+    run_task()
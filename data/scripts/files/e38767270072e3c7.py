@@ -0,0 +1,11 @@
+# Tool: auto_parse_list_of_numbers_1770326848
+# Description: parse list of numbers
+
+import time
+
+def run_task():
+    print('Executing generic task: parse list of numbers')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
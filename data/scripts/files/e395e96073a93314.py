@@ -0,0 +1,14 @@
+# Tool: auto_calculate_random_dice_1770326828
+# Description: calculate random dice
+
+import math
+import random
+import time
+
+def run_task():
+    print(f'Rolling d20: {random.randint(1, 20)}')
+    opts = ['Yes', 'No', 'Maybe', 'Try Again']
+    print(f'Magic 8-Ball says: {random.choice(opts)}')
+
+if __name__ == '__main__':
+    run_task()
@@ -0,0 +1,15 @@
+# Tool: my_timer
+# Description: Create a tool named my_timer that waits for 2 seconds
+
+import os
+import datetime
+import random
+import sys
+import time
+
+def run_task():
+    print(f'Task: Create a tool named my_timer that waits for 2 seconds')
+    print(f'CWD: {os.getcwd()}')
+
+
+run_task()
@@ -0,0 +1,8 @@
+# Tool: auto_text_reverser_1770326256
+# Description: reverse a string text
+
+def run_task():
+    print('Executing task: reverse a string text')
+    print('Task complete.')
+
+run_task()
@@ -0,0 +1,11 @@
+# Tool: auto_analyze_list_of_numbers_1770326999
+# Description: analyze list of numbers
+
+import time
+
+def run_task():
+    print('Executing generic task: analyze list of numbers')
+    print('Review logic required for specific implementation.')
+
+if __name__ == '__main__':
+    run_task()
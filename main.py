@@ -11,6 +11,10 @@ from src.launcher import GenesisLauncher
 from PyQt6.QtWidgets import QApplication
 
 if __name__ == "__main__":
+    # Required for the sandbox worker processes in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
     try:
         # --- Crash Handler ---
         # We wrap the entire startup in a try-except block to catch import errors or early crashes
@@ -1,12 +1,16 @@
 import sys
+import itertools
+import threading
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QTextBrowser, QPlainTextEdit, QPushButton, 
+                             QHBoxLayout, QPlainTextEdit, QPushButton, 
                              QLabel, QComboBox, QCheckBox)
 from PyQt6.QtGui import QColor, QFont, QIcon
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QThread, QObject, pyqtSignal, pyqtSlot, QTimer
+from src.ai.chat_log import ChatLogView
 
 try:
-    from src.ai.brain import NeuralBrain
+    from src.ai.brain import NeuralBrain, get_neural_brain
+    from src.ai.sandbox import get_sandbox_pool
 except ImportError:
     NeuralBrain = None
 
@@ -22,12 +26,12 @@ class LearningWorker(QThread):
     def run(self):
         while self.running:
             if self.brain and hasattr(self.brain, 'auto_learner'):
-                success, msg = self.brain.auto_learner.attempt_learning()
+                # Candidates run concurrently in the sandbox pool, so throughput
+                # scales with workers; only a short pause between batches.
+                success, msg = self.brain.auto_learner.attempt_learning_batch()
                 self.log_signal.emit(msg)
                 
-                # Sleep based on success/failure (learning takes time)
-                # Success = 10 sec rest, Failure = 5 sec rest
-                self.msleep(10000 if success else 5000)
+                self.msleep(500 if success else 2000)
             else:
                 self.msleep(2000)
 
@@ -35,21 +39,106 @@ class LearningWorker(QThread):
         self.running = False
         self.wait()
 
+# The brain is shared by every window, so is its learner: one worker, started
+# by the first window that enables learning and stopped by the last.
+_learning_worker = None
+_learning_users = 0
+
+def acquire_learning_worker(brain):
+    global _learning_worker, _learning_users
+    if _learning_worker is None:
+        _learning_worker = LearningWorker(brain)
+        _learning_worker.start()
+    _learning_users += 1
+    return _learning_worker
+
+def release_learning_worker():
+    global _learning_worker, _learning_users
+    _learning_users -= 1
+    if _learning_users <= 0 and _learning_worker is not None:
+        _learning_worker.stop()
+        _learning_worker = None
+        _learning_users = 0
+
+
+class BrainWorker(QObject):
+    """Owns the NeuralBrain on a background thread. Requests arrive as queued
+    signals carrying ids; each response is sent back with the same id."""
+    ready = pyqtSignal(list) # persona names (empty if the brain is offline)
+    response_ready = pyqtSignal(int, str)
+
+    def __init__(self):
+        super().__init__()
+        self.brain = None
+        self.thread_ident = None
+        self.persona = "Standard"
+        self._cancelled = set()
+        self._lock = threading.Lock()
+
+    @pyqtSlot()
+    def start(self):
+        self.thread_ident = threading.get_ident()
+        # Shared by every assistant window; only the first one pays for loading
+        self.brain = get_neural_brain() if NeuralBrain else None
+        self.ready.emit(self.brain.get_persona_names() if self.brain else [])
+
+    @pyqtSlot(int, str)
+    def handle_request(self, request_id, text):
+        with self._lock:
+            if request_id in self._cancelled:
+                self._cancelled.discard(request_id)
+                return
+        if self.brain:
+            response = self.brain.respond(text, self.persona)
+        else:
+            response = "Brain module not found."
+        with self._lock:
+            if request_id in self._cancelled:
+                self._cancelled.discard(request_id)
+                return
+        self.response_ready.emit(request_id, response)
+
+    @pyqtSlot(str)
+    def set_persona(self, persona_name):
+        self.persona = persona_name
+
+    def cancel(self, request_ids):
+        """Called from the UI thread: drops the requests and kills any simulation they are running."""
+        with self._lock:
+            self._cancelled.update(request_ids)
+        if NeuralBrain and self.thread_ident is not None:
+            get_sandbox_pool().cancel(owner=self.thread_ident)
+
 
 class NeuralAssistant(QMainWindow):
+    request_signal = pyqtSignal(int, str)
+    persona_signal = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Project Genesis - Neural Assistant")
         self.resize(500, 700)
         
-        self.brain = NeuralBrain() if NeuralBrain else None
+        # Brain lives on its own thread so long responses never block the UI
+        self.brain = None
+        self.pending = {} # request id -> text
+        self._request_ids = itertools.count(1)
+        self.brain_thread = QThread(self)
+        self.brain_worker = BrainWorker()
+        self.brain_worker.moveToThread(self.brain_thread)
+        self.brain_thread.started.connect(self.brain_worker.start)
+        self.brain_thread.finished.connect(self.brain_worker.deleteLater)
+        self.brain_worker.ready.connect(self.on_brain_ready)
+        self.brain_worker.response_ready.connect(self.on_response)
+        self.request_signal.connect(self.brain_worker.handle_request)
+        self.persona_signal.connect(self.brain_worker.set_persona)
 
         # --- UI STYLING ---
         self.setStyleSheet("""
             QMainWindow { background-color: #1e1e1e; }
             QWidget { color: #d4d4d4; font-family: 'Segoe UI'; font-size: 14px; }
             
-            QTextBrowser {
+            QListView {
                 background-color: #252526;
                 border: 1px solid #3e3e42;
                 border-radius: 4px;
@@ -90,22 +179,16 @@ class NeuralAssistant(QMainWindow):
         
         header_layout.addStretch()
         
-        # Persona Selector
+        # Persona Selector (filled once the brain has loaded)
         self.combo_persona = QComboBox()
-        if self.brain:
-            self.combo_persona.addItems(self.brain.get_persona_names())
-            self.combo_persona.currentTextChanged.connect(self.change_persona)
-            # Default to Shepherd as requested? Or Standard? Let's default to Standard but available.
-            self.combo_persona.setCurrentText("Standard") 
-        else:
-            self.combo_persona.addItem("Brain Offline")
-            self.combo_persona.setEnabled(False)
-            
+        self.combo_persona.addItem("Loading...")
+        self.combo_persona.setEnabled(False)
         header_layout.addWidget(self.combo_persona)
         
         # Auto-Learning Toggle
         self.check_learn = QCheckBox("Continuous Learning")
         self.check_learn.setToolTip("Enable background auto-coding loop")
+        self.check_learn.setEnabled(False)
         self.check_learn.stateChanged.connect(self.toggle_learning)
         header_layout.addWidget(self.check_learn)
         
@@ -115,9 +198,8 @@ class NeuralAssistant(QMainWindow):
         self.learning_worker = None
 
 
-        # Chat History
-        self.history = QTextBrowser()
-        self.history.setOpenExternalLinks(True)
+        # Chat History (bounded; learner logs can stream in for hours)
+        self.history = ChatLogView(max_messages=2000)
         layout.addWidget(self.history)
 
         # Input Area
@@ -134,17 +216,39 @@ class NeuralAssistant(QMainWindow):
         self.btn_send.clicked.connect(self.send_message)
         input_layout.addWidget(self.btn_send)
 
+        self.btn_cancel = QPushButton("Stop")
+        self.btn_cancel.setFixedWidth(80)
+        self.btn_cancel.setFixedHeight(60)
+        self.btn_cancel.setToolTip("Cancel pending requests and abort running tool simulations")
+        self.btn_cancel.setStyleSheet("background-color: #a1260d;")
+        self.btn_cancel.setEnabled(False)
+        self.btn_cancel.clicked.connect(self.cancel_requests)
+        input_layout.addWidget(self.btn_cancel)
+
         layout.addLayout(input_layout)
 
+        self.brain_thread.start()
+
+    def on_brain_ready(self, persona_names):
         # Welcome Message
-        if self.brain:
-            self.append_system_message(self.brain.get_response("hello"))
+        if persona_names:
+            self.brain = self.brain_worker.brain
+            self.combo_persona.clear()
+            self.combo_persona.addItems(persona_names)
+            # Default to Shepherd as requested? Or Standard? Let's default to Standard but available.
+            self.combo_persona.setCurrentText("Standard")
+            self.combo_persona.currentTextChanged.connect(self.change_persona)
+            self.combo_persona.setEnabled(True)
+            self.check_learn.setEnabled(True)
+            self.process_response("hello")
         else:
+            self.combo_persona.clear()
+            self.combo_persona.addItem("Brain Offline")
             self.append_system_message("System online. Brain module missing.")
 
     def change_persona(self, persona_name):
         if self.brain:
-            self.brain.set_persona(persona_name)
+            self.persona_signal.emit(persona_name)
             self.append_system_message(f"<i>Persona switched to: {persona_name}</i>")
 
     def send_message(self):
@@ -158,9 +262,25 @@ class NeuralAssistant(QMainWindow):
         self.process_response(text)
 
     def process_response(self, text):
+        """Queues text for the brain thread; the reply arrives in on_response."""
+        request_id = next(self._request_ids)
+        self.pending[request_id] = text
+        self.btn_cancel.setEnabled(True)
+        self.request_signal.emit(request_id, text)
+
+    def cancel_requests(self):
+        if not self.pending: return
+        self.brain_worker.cancel(list(self.pending))
+        self.pending.clear()
+        self.btn_cancel.setEnabled(False)
+        self.append_system_message("<i>Request cancelled.</i>")
+
+    def on_response(self, request_id, response):
+        if self.pending.pop(request_id, None) is None:
+            return # Cancelled while in flight
+        self.btn_cancel.setEnabled(bool(self.pending))
+
         if self.brain:
-            response = self.brain.get_response(text)
-            
             # Check for Thinking trace
             if response.startswith("(Thinking:"):
                 # Split at the double newline we added in brain
@@ -189,20 +309,31 @@ class NeuralAssistant(QMainWindow):
     def toggle_learning(self, state):
         if state == 2: # Checked
             if not self.learning_worker:
-                self.learning_worker = LearningWorker(self.brain)
+                self.learning_worker = acquire_learning_worker(self.brain)
                 self.learning_worker.log_signal.connect(self.on_learning_log)
-                self.learning_worker.start()
             self.append_system_message("<i>Continuous Learning Module: ACTIVATED. I will now practice coding in the background.</i>")
         else:
-            if self.learning_worker:
-                self.learning_worker.stop()
-                self.learning_worker = None
+            self.stop_learning()
             self.append_system_message("<i>Continuous Learning Module: DEACTIVATED.</i>")
             
     def on_learning_log(self, msg):
         """Displays learning events in the Thinking style."""
         self.history.append(f"<div style='color: #888; font-style: italic; font-size: 11px;'>[Auto-Learner] {msg}</div>")
 
+    def stop_learning(self):
+        if self.learning_worker:
+            self.learning_worker.log_signal.disconnect(self.on_learning_log)
+            self.learning_worker = None
+            release_learning_worker()
+
+    def closeEvent(self, event):
+        self.stop_learning()
+        if self.pending:
+            self.brain_worker.cancel(list(self.pending))
+        self.brain_thread.quit()
+        self.brain_thread.wait()
+        super().closeEvent(event)
+
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
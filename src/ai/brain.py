@@ -3,7 +3,15 @@ import json
 import math
 import re
 import random
-from collections import Counter
+import mmap
+import hashlib
+import threading
+from functools import lru_cache
+from collections import Counter, OrderedDict
+from src.ai.sandbox import get_sandbox_pool, TRANSIENT_ERRORS
+from src.ai.project_index import get_project_index
+from src.ai.intent_router import IntentRouter
+from src.ai.metrics import get_metrics
 
 # --- VECTOR ENGINE (Lightweight ML) ---
 class VectorEngine:
@@ -14,16 +22,28 @@ class VectorEngine:
         # Removed: i, you, my, your, me, we, us
     }
 
+    WORD_RE = re.compile(r'\w+')
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _terms(text):
+        """One pass over text: (unigrams without stop words, bigrams with them). Cached for repeated inputs."""
+        words = VectorEngine.WORD_RE.findall(text.lower())
+        unigrams = tuple(w for w in words if w not in VectorEngine.STOP_WORDS)
+        bigrams = tuple(f"{a} {b}" for a, b in zip(words, words[1:]))
+        return unigrams, bigrams
+
     @staticmethod
     def tokenize(text):
         """Splits text, removes punctuation, lowercases, and removes STOP WORDS."""
-        words = re.findall(r'\w+', text.lower())
-        return [w for w in words if w not in VectorEngine.STOP_WORDS]
+        return list(VectorEngine._terms(text)[0])
 
     @staticmethod
     def generate_ngrams(text, n=2):
         """Generates n-grams from text to capture phrases like 'how are'."""
-        words = re.findall(r'\w+', text.lower()) # Keep stop words for n-grams to capture flow
+        if n == 2:
+            return list(VectorEngine._terms(text)[1])
+        words = VectorEngine.WORD_RE.findall(text.lower()) # Keep stop words for n-grams to capture flow
         if len(words) < n:
             return []
         return [" ".join(words[i:i+n]) for i in range(len(words)-n+1)]
@@ -31,8 +51,7 @@ class VectorEngine:
     @staticmethod
     def text_to_vector(text):
         """Converts text to a weighted vector (Bag of Words + Bigrams)."""
-        words = VectorEngine.tokenize(text)
-        bigrams = VectorEngine.generate_ngrams(text, 2)
+        words, bigrams = VectorEngine._terms(text)
         
         vec = Counter(words)
         # Add bigrams with higher weight (2x) because phrases are more specific
@@ -250,18 +269,64 @@ class NeuralMemory:
     def __init__(self, filepath="data/brain_memory.json"):
         self.filepath = filepath
         self.data = {"qa": [], "facts": [], "opinions": [], "files": []}
+        # Lookup indexes (normalized text -> entry), rebuilt on every load
+        self._qa_index = {}
+        self._opinion_index = {}
+        self._fact_index = set()
+        self.corpus = CorpusStore({})
+        # Chunk vectors live in their own file (data/brain_memory_chunks.json)
+        self.chunk_store = ChunkStore(os.path.splitext(filepath)[0] + "_chunks.json")
         self.load()
 
+    @staticmethod
+    def normalize(text):
+        """Canonical dedupe key: lowercased with collapsed whitespace."""
+        return " ".join(text.lower().split())
+
     def load(self):
         if os.path.exists(self.filepath):
             try:
                 with open(self.filepath, "r") as f:
                     self.data = json.load(f)
+                    if "qa" not in self.data: self.data["qa"] = []
+                    if "facts" not in self.data: self.data["facts"] = []
                     if "opinions" not in self.data: self.data["opinions"] = []
                     if "files" not in self.data: self.data["files"] = []
                     if "skills" not in self.data: self.data["skills"] = [] # Persistent Skill List
+                    if "corpora" not in self.data: self.data["corpora"] = {} # file id -> path
             except:
-                self.data = {"qa": [], "facts": [], "opinions": [], "files": [], "skills": []}
+                self.data = {"qa": [], "facts": [], "opinions": [], "files": [], "skills": [], "corpora": {}}
+        self.corpus.close()
+        self.corpus = CorpusStore(self.data.setdefault("corpora", {}))
+        self.chunk_store.load()
+        self._migrate_corpus()
+        self._rebuild_indexes()
+
+    def _migrate_corpus(self):
+        """Moves inline chunks to the chunk store (path-keyed ones to file ids) and drops
+        truncated [BIBLE_VEC] fact copies."""
+        if "facts" in self.data:
+            self.data["facts"] = [f for f in self.data["facts"] if not f.startswith("[BIBLE_VEC]")]
+        legacy = self.data.pop("chunks", None)
+        if legacy:
+            for chunk in legacy:
+                fid = self.corpus.register(chunk.pop("source")) if "source" in chunk else chunk["file"]
+                self.chunk_store.add(fid, chunk["offset"], chunk["length"], chunk["vec"])
+            # No stamps: the next ingest of these files re-embeds them
+            self.chunk_store.save()
+            self.save()
+
+    def _rebuild_indexes(self):
+        """Builds the O(1) dedupe indexes. First entry wins, like the old linear scans."""
+        self._qa_index = {}
+        for item in self.data.get("qa", []):
+            self._qa_index.setdefault(self.normalize(item["q"]), item)
+
+        self._opinion_index = {}
+        for item in self.data.get("opinions", []):
+            self._opinion_index.setdefault(self.normalize(item["topic"]), item)
+
+        self._fact_index = {self.normalize(fact) for fact in self.data.get("facts", [])}
     
     def save(self):
         try:
@@ -271,48 +336,70 @@ class NeuralMemory:
             print(f"Memory Save Error: {e}")
 
     def add_qa(self, question, answer):
-        for item in self.data["qa"]:
-            if item["q"] == question:
-                item["a"] = answer
-                self.save()
-                return
-        self.data["qa"].append({"q": question, "a": answer})
+        key = self.normalize(question)
+        item = self._qa_index.get(key)
+        if item is not None:
+            item["a"] = answer
+        else:
+            item = {"q": question, "a": answer}
+            self.data["qa"].append(item)
+            self._qa_index[key] = item
         self.save()
 
     def add_fact(self, text):
         if len(text) < 5: return 
-        if text not in self.data.get("facts", []):
+        key = self.normalize(text)
+        if key not in self._fact_index:
             self.data.setdefault("facts", []).append(text)
+            self._fact_index.add(key)
             self.save()
 
     def add_opinion(self, topic, thought):
-        for item in self.data["opinions"]:
-            if item["topic"] == topic:
-                item["thought"] = thought
-                self.save()
-                return
-        self.data["opinions"].append({"topic": topic, "thought": thought})
+        key = self.normalize(topic)
+        item = self._opinion_index.get(key)
+        if item is not None:
+            item["thought"] = thought
+        else:
+            item = {"topic": topic, "thought": thought}
+            self.data["opinions"].append(item)
+            self._opinion_index[key] = item
+        self.save()
+
+    def begin_ingest(self, file_id, path):
+        """Returns False if path is unchanged since it was embedded; otherwise drops its old chunks."""
+        if self.chunk_store.is_current(file_id, path):
+            return False
+        self.chunk_store.drop_file(file_id)
+        return True
+
+    def add_chunk(self, file_id, offset, length, vec):
+        """Stores a (file id, offset, length, vector) record. Does not save; call finish_ingest() after a batch."""
+        return self.chunk_store.add(file_id, offset, length, vec)
+
+    def finish_ingest(self, file_id, stamp):
+        """Records the ingested file's [size, mtime] and saves the chunk store and the corpus map."""
+        self.chunk_store.stamps[file_id] = stamp
+        self.chunk_store.save()
         self.save()
 
+    def search_chunks(self, vec):
+        """Returns (score, chunk) for the closest corpus window, or (0.0, None)."""
+        best_score, best_chunk = 0.0, None
+        for chunk in self.chunk_store.chunks:
+            score = VectorEngine.get_cosine_similarity(vec, chunk["vec"])
+            if score > best_score:
+                best_score, best_chunk = score, chunk
+        return best_score, best_chunk
+
     def update_files(self, file_list):
         self.data["files"] = file_list
         self.save()
 
     def save_script(self, name, content):
-        """Saves generated script to genesis_scripts.json."""
-        script_file = "data/genesis_scripts.json"
-        data = {}
-        if os.path.exists(script_file):
-            try:
-                with open(script_file, "r") as f:
-                    data = json.load(f)
-            except: pass
-        
-        data[name] = {"content": content, "language": "Python"}
-        
+        """Saves generated script to the Script Library (one file, plus the manifest)."""
+        from src.script_store import get_script_store
         try:
-            with open(script_file, "w") as f:
-                json.dump(data, f, indent=4)
+            get_script_store().save(name, content, "Python")
             return True
         except Exception as e:
             print(f"Script Save Error: {e}")
@@ -322,27 +409,101 @@ class NeuralMemory:
 # --- AUTONOMOUS CODING ---
 class CodeSandbox:
     @staticmethod
-    def simulate(code_str):
-        """Runs code in a sandbox. Returns (Success: bool, Output: str)."""
-        import io
-        from contextlib import redirect_stdout
-        
-        f = io.StringIO()
-        try:
-            # Basic safety checks
-            if "os.system" in code_str or "subprocess" in code_str:
-                return False, "Security Risk: System calls not allowed in sandbox."
-            
-            with redirect_stdout(f):
-                # Use a single namespace so imports are visible to functions
-                # namespace = {"__builtins__": __builtins__}
-                # Fix for lint: just pass a clean dict, let exec handle builtins implicitly or explicitly if needed
-                namespace = {} 
-                exec(code_str, namespace)
-            
-            return True, f.getvalue()
-        except Exception as e:
-            return False, str(e)
+    def simulate(code_str, timeout=None):
+        """Runs code in a sandbox worker process. Returns (Success: bool, Output: str)."""
+        # Basic safety checks
+        if "os.system" in code_str or "subprocess" in code_str:
+            return False, "Security Risk: System calls not allowed in sandbox."
+        
+        # Generated tools read the persisted project index; bring it up to date first
+        if "project_index.json" in code_str:
+            get_project_index().refresh()
+
+        # Isolated process with wall-clock, CPU and address-space limits;
+        # a runaway script is killed and its worker respawned.
+        return get_sandbox_pool().run(code_str, timeout)
+
+class RunCache:
+    """Content-addressed results of generated tool runs.
+
+    Keyed by a hash of the normalized code plus a fingerprint (paths + mtimes)
+    of every project file a generated tool could read: the whole indexed tree
+    except the app's own data/ directory and the tools' reports. Any change to
+    those files clears the cache. Tools that write files are never cached, since
+    a hit would skip the write.
+    """
+    MAX_ENTRIES = 256
+    STATE_DIRS = ("data",) # App state, not tool input (includes the index file itself)
+    TOOL_OUTPUTS = {"auto_report.json"}
+    WRITE_RE = re.compile(r"open\([^)]*['\"][wax]b?\+?['\"]|\.write_(?:text|bytes)\(")
+
+    def __init__(self, index=None):
+        self._index = index # Resolved on first use; building it walks the whole tree
+        self._lock = threading.Lock() # Batch evaluation hits the cache from several threads
+        self._entries = OrderedDict()
+        self._fingerprint = None
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = get_project_index()
+        return self._index
+
+    @staticmethod
+    def normalize(code):
+        """Drops comment-only and blank lines so renamed/mutated copies share a key."""
+        lines = []
+        for line in code.split("\n"):
+            stripped = line.rstrip()
+            if not stripped or stripped.lstrip().startswith("#"):
+                continue
+            lines.append(stripped)
+        return "\n".join(lines)
+
+    @classmethod
+    def _is_tool_input(cls, path):
+        if path.split(os.sep, 1)[0] in cls.STATE_DIRS:
+            return False
+        return os.path.basename(path) not in cls.TOOL_OUTPUTS
+
+    @classmethod
+    def cacheable(cls, code):
+        return not cls.WRITE_RE.search(code)
+
+    def project_fingerprint(self):
+        """Hashes path + mtime of every file in the project index a tool could read."""
+        return self.index.fingerprint(self._is_tool_input)
+
+    def _key(self, code):
+        # Caller holds self._lock
+        fingerprint = self.project_fingerprint()
+        if fingerprint != self._fingerprint:
+            self._entries.clear() # Project changed; every prior result is stale
+            self._fingerprint = fingerprint
+        return hashlib.sha1(self.normalize(code).encode("utf-8")).hexdigest()
+
+    def get(self, code):
+        """Returns the cached (success, output, utility_score) or None."""
+        if not self.cacheable(code):
+            return None
+        with self._lock:
+            key = self._key(code)
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, code, success, output, utility_score):
+        if not success and output.startswith(TRANSIENT_ERRORS):
+            return
+        if not self.cacheable(code):
+            return
+        with self._lock:
+            key = self._key(code)
+            self._entries[key] = (success, output, utility_score)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.MAX_ENTRIES:
+                self._entries.popitem(last=False)
 
 class ToolGenerator:
     @staticmethod
@@ -356,8 +517,6 @@ class ToolGenerator:
         if "find" in desc_lower or "scan" in desc_lower: imports.append("import re")
         if "json" in desc_lower or "save" in desc_lower: imports.append("import json")
         
-        import_block = "\n".join(list(set(imports))) + "\n\n"
-        
         # 2. Logic Body Assembly
         body = "def run_task():\n"
         body += f"    print(f'Task: {description}')\n"
@@ -370,50 +529,90 @@ class ToolGenerator:
         is_file_op = any(w in desc_lower for w in ["find", "map", "count", "scan", "analyze", "project", "files"])
         
         if is_file_op:
+            imports += ["import ast", "import json"]
+            # File list and summaries come from the app's persisted project index (plain JSON,
+            # no app imports; CodeSandbox.simulate refreshes it first). A file missing from it
+            # or changed since is summarized here, with the same fields.
             body += "    print('Scanning project...')\n"
-            body += "    target_files = []\n"
-            body += "    for root, dirs, files in os.walk('.'):\n"
-            body += "        if '.venv' in root or '.git' in root: continue\n"
-            body += "        for file in files:\n"
-            body += "            if file.endswith('.py'):\n"
-            body += "                target_files.append(os.path.join(root, file))\n"
+            body += "    try:\n"
+            body += "        with open(os.path.join('data', 'project_index.json'), 'r', encoding='utf-8') as f:\n"
+            body += "            index = json.load(f).get('files', {})\n"
+            body += "    except Exception:\n"
+            body += "        index = {}\n"
+            body += "    def summary(path):\n"
+            body += "        entry = index.get(path)\n"
+            body += "        try:\n"
+            body += "            if entry and entry.get('mtime') == os.stat(path).st_mtime_ns: return entry\n"
+            # encoding error fix: errors='ignore'
+            body += "            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()\n"
+            body += "        except OSError:\n"
+            body += "            return None\n"
+            body += "        lines = content.splitlines()\n"
+            body += "        entry = {'lines': len(lines), 'functions': [], 'classes': [], 'complexity': {},\n"
+            body += "                 'todos': [[i, line.strip()] for i, line in enumerate(lines, 1) if 'TODO' in line]}\n"
+            body += "        try:\n"
+            body += "            tree = ast.parse(content)\n"
+            body += "        except (SyntaxError, ValueError):\n"
+            body += "            return entry\n"
+            body += "        branches = (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp, ast.ExceptHandler, ast.Assert, ast.comprehension)\n"
+            body += "        for node in ast.walk(tree):\n"
+            body += "            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):\n"
+            body += "                entry['functions'].append(node.name)\n"
+            body += "                score = 1 + sum(isinstance(n, branches) for n in ast.walk(node))\n"
+            body += "                score += sum(len(n.values) - 1 for n in ast.walk(node) if isinstance(n, ast.BoolOp))\n"
+            body += "                entry['complexity'][f'{node.name}:{node.lineno}'] = score\n"
+            body += "            elif isinstance(node, ast.ClassDef):\n"
+            body += "                entry['classes'].append(node.name)\n"
+            body += "        return entry\n"
+            body += "    target_files = sorted(p for p in index if p.endswith('.py') and os.path.exists(p))\n"
+            body += "    if not index: # No index yet: walk the tree\n"
+            body += "        for root, dirs, files in os.walk('.'):\n"
+            body += "            if '.venv' in root or '.git' in root: continue\n"
+            body += "            for file in files:\n"
+            body += "                if file.endswith('.py'):\n"
+            body += "                    target_files.append(os.path.relpath(os.path.join(root, file)))\n"
             
         # Block B: Action Logic (The "Muscle")
+        # Line counts, TODOs and AST summaries come from summary(): the index, or the file itself
         if "lines" in desc_lower:
              body += "    total_lines = 0\n"
              body += "    for path in target_files:\n"
-             # encoding error fix: errors='ignore'
-             body += "        try:\n"
-             body += "            with open(path, 'r', encoding='utf-8', errors='ignore') as f:\n"
-             body += "                lines = len(f.readlines())\n"
-             body += "                total_lines += lines\n"
-             body += "                print(f'{path}: {lines}')\n"
-             body += "        except: pass\n"
+             body += "        entry = summary(path)\n"
+             body += "        if not entry: continue\n"
+             body += "        total_lines += entry['lines']\n"
+             body += "        print(f\"{path}: {entry['lines']}\")\n"
              body += "    print(f'Total Lines: {total_lines}')\n"
              
         elif "todo" in desc_lower:
              body += "    found_items = []\n"
              body += "    for path in target_files:\n"
-             body += "        try:\n"
-             body += "            with open(path, 'r', encoding='utf-8', errors='ignore') as f:\n"
-             body += "                for i, line in enumerate(f, 1):\n"
-             body += "                    if 'TODO' in line:\n"
-             body += "                        item = {'file': path, 'line': i, 'content': line.strip()}\n"
-             body += "                        found_items.append(item)\n"
-             body += "                        print(f'{path}:{i} -> {line.strip()}')\n"
-             body += "        except: pass\n"
+             body += "        entry = summary(path)\n"
+             body += "        if not entry: continue\n"
+             body += "        for i, content in entry.get('todos', []):\n"
+             body += "            item = {'file': path, 'line': i, 'content': content}\n"
+             body += "            found_items.append(item)\n"
+             body += "            print(f'{path}:{i} -> {content}')\n"
+             
+        elif "complexity" in desc_lower:
+             body += "    total_complexity = 0\n"
+             body += "    for path in target_files:\n"
+             body += "        entry = summary(path)\n"
+             body += "        if not entry: continue\n"
+             body += "        scores = entry.get('complexity', {})\n"
+             body += "        if not scores: continue\n"
+             body += "        worst = max(scores, key=scores.get)\n"
+             body += "        total_complexity += sum(scores.values())\n"
+             body += "        print(f\"{path}: {entry.get('lines', 0)} lines, {len(entry.get('functions', []))} defs, {len(entry.get('classes', []))} classes, max complexity {scores[worst]} ({worst})\")\n"
+             body += "    print(f'Complexity Analysis: total {total_complexity} across {len(target_files)} files')\n"
              
         elif "functions" in desc_lower or "classes" in desc_lower:
              body += "    all_funcs = []\n"
              body += "    for path in target_files:\n"
-             body += "        try:\n"
-             body += "            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()\n"
-             body += "            tree = ast.parse(content)\n"
-             body += "            funcs = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]\n"
-             body += "            if funcs:\n"
-             body += "                print(f'{path}: {funcs}')\n"
-             body += "                all_funcs.extend(funcs)\n"
-             body += "        except: pass\n"
+             body += "        entry = summary(path)\n"
+             body += "        funcs = entry.get('functions', []) if entry else []\n"
+             body += "        if funcs:\n"
+             body += "            print(f'{path}: {funcs}')\n"
+             body += "            all_funcs.extend(funcs)\n"
              body += "    print(f'Total Functions Found: {len(all_funcs)}')\n"
              
         elif "map" in desc_lower:
@@ -443,6 +642,7 @@ class ToolGenerator:
                  topic = description.replace("research", "").strip()
                  body += f"    print(KnowledgeSeeker.research_topic('{topic}'))\n"
              
+        import_block = "\n".join(sorted(set(imports))) + "\n\n"
         return f"# Tool: {name}\n# Description: {description}\n\n{import_block}{body}\n\nrun_task()\n"
 
     @staticmethod
@@ -450,7 +650,8 @@ class ToolGenerator:
         """Heuristic-based Code Repair."""
         new_code = code
         # Very basic fix logic
-        if "ModuleNotFoundError" in error or "NameError" in error:
+        # Sandbox errors carry only str(e), e.g. "name 'json' is not defined"
+        if "ModuleNotFoundError" in error or "NameError" in error or "is not defined" in error:
              if "re" in error: new_code = "import re\n" + new_code
              if "time" in error: new_code = "import time\n" + new_code
              if "json" in error: new_code = "import json\n" + new_code
@@ -553,9 +754,160 @@ class MetaClassifier:
         if pred > 0.6: return "KNOWLEDGE"
         return "SKILL"
 
+class CorpusStore:
+    """Memory-mapped view of ingested corpus files. Text stays on disk; chunks only hold offsets."""
+    def __init__(self, files):
+        self.files = files # file id -> path (shared with memory.data["corpora"])
+        self._maps = {}
+
+    @staticmethod
+    def file_id(path):
+        return hashlib.sha1(os.path.normpath(path).encode("utf-8")).hexdigest()[:12]
+
+    def register(self, path):
+        """Adds a corpus file and returns its id. Re-registering drops a stale mapping."""
+        fid = self.file_id(path)
+        self.files[fid] = os.path.normpath(path)
+        self._unmap(fid)
+        return fid
+
+    def _map(self, fid):
+        if fid not in self._maps:
+            path = self.files.get(fid)
+            if not path or not os.path.exists(path) or os.path.getsize(path) == 0:
+                return None
+            with open(path, "rb") as f:
+                self._maps[fid] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[fid]
+
+    def _unmap(self, fid):
+        mm = self._maps.pop(fid, None)
+        if mm is not None:
+            mm.close()
+
+    def resolve(self, chunk):
+        """Returns the text of a chunk by slicing its file's mmap."""
+        try:
+            mm = self._map(chunk["file"])
+        except (OSError, ValueError):
+            return ""
+        if mm is None:
+            return ""
+        start = chunk["offset"]
+        return mm[start:start + chunk["length"]].decode("utf-8", errors="ignore")
+
+    def name(self, fid):
+        return os.path.basename(self.files.get(fid, "corpus"))
+
+    def close(self):
+        for fid in list(self._maps):
+            self._unmap(fid)
+
+class ChunkStore:
+    """Embedded corpus windows, kept in a side file so brain_memory.json stays small.
+
+    Each ingested file's size and mtime are recorded; a file that changed since
+    has its old chunks dropped before it is embedded again.
+    """
+    VERSION = 1
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.chunks = [] # {"file", "offset", "length", "vec"}
+        self.stamps = {} # file id -> [size, mtime_ns] at ingest
+        self._index = set() # (file id, offset)
+
+    def load(self):
+        self.chunks, self.stamps = [], {}
+        if os.path.exists(self.filepath):
+            try:
+                with open(self.filepath, "r") as f:
+                    data = json.load(f)
+                if data.get("version") == self.VERSION:
+                    self.chunks = data.get("chunks", [])
+                    self.stamps = data.get("stamps", {})
+            except Exception as e:
+                print(f"Chunk Store Load Error: {e}")
+        self._index = {(c["file"], c["offset"]) for c in self.chunks}
+
+    def save(self):
+        tmp_path = f"{self.filepath}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.filepath) or ".", exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"version": self.VERSION, "stamps": self.stamps, "chunks": self.chunks}, f)
+            os.replace(tmp_path, self.filepath)
+        except Exception as e:
+            print(f"Chunk Store Save Error: {e}")
+
+    @staticmethod
+    def stamp(path):
+        stat = os.stat(path)
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def is_current(self, fid, path):
+        """True if fid was ingested from path as it is on disk now."""
+        try:
+            return self.stamps.get(fid) == self.stamp(path)
+        except OSError:
+            return False
+
+    def drop_file(self, fid):
+        """Forgets every chunk of fid. Returns the number dropped."""
+        kept = [c for c in self.chunks if c["file"] != fid]
+        dropped = len(self.chunks) - len(kept)
+        if dropped:
+            self.chunks = kept
+            self._index = {key for key in self._index if key[0] != fid}
+        self.stamps.pop(fid, None)
+        return dropped
+
+    def add(self, fid, offset, length, vec):
+        key = (fid, offset)
+        if key in self._index:
+            return False
+        self.chunks.append({"file": fid, "offset": offset, "length": length, "vec": dict(vec)})
+        self._index.add(key)
+        return True
+
+    def __len__(self):
+        return len(self.chunks)
+
 class KnowledgeSeeker:
     """Module for acquiring external knowledge (Bible, Language, etc.)."""
+    CHUNK_WINDOW = 1024 # bytes per embedded window
+    CHUNK_OVERLAP = 128 # bytes shared with the previous window
     
+    @staticmethod
+    def iter_chunks(path, window=CHUNK_WINDOW, overlap=CHUNK_OVERLAP):
+        """Streams (offset, length, text) windows over a file without reading it whole."""
+        step = window - overlap
+        with open(path, "rb") as f:
+            offset = 0
+            buf = f.read(window)
+            while buf:
+                yield offset, len(buf), buf.decode("utf-8", errors="ignore")
+                more = f.read(step)
+                if not more: break
+                buf = buf[step:] + more
+                offset += step
+
+    @staticmethod
+    def ingest_file(path, memory):
+        """Embeds a file window by window into the memory's chunk index. Returns the count."""
+        file_id = memory.corpus.register(path)
+        if not memory.begin_ingest(file_id, path):
+            return 0 # Unchanged since it was last embedded
+        stamp = ChunkStore.stamp(path)
+        count = 0
+        for offset, length, text in KnowledgeSeeker.iter_chunks(path):
+            if len(text.strip()) < 10: continue
+            vec = VectorEngine.text_to_vector(text)
+            if memory.add_chunk(file_id, offset, length, vec):
+                count += 1
+        memory.finish_ingest(file_id, stamp)
+        return count
+
     @staticmethod
     def ingest_bible(memory=None):
         """Reads the Bible and EMBEDS it as vectors if memory is provided."""
@@ -564,25 +916,12 @@ class KnowledgeSeeker:
             return "Bible not found. Please place 'bible.txt' in the 'knowledge' folder."
             
         try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            
-            # Vector Embedding (Simulated)
+            # Vector Embedding: streamed windows, vectors kept with offsets into the file
             if memory:
-                # Store the raw text as a 'Fact' but also vectorize chunks
-                chunks = content.split('\n\n')
-                count = 0
-                for chunk in chunks:
-                    if len(chunk) < 10: continue
-                    vec = VectorEngine.text_to_vector(chunk)
-                    # We store the vector as a 'memory trace' (simplified)
-                    # In a real system this goes to a VectorDB.
-                    # Here we just append to 'facts' with a tag.
-                    memory.add_fact(f"[BIBLE_VEC] {chunk[:50]}...")
-                    count += 1
+                count = KnowledgeSeeker.ingest_file(path, memory)
                 return f"Ingested & Embedded {count} Divine Truths into Neural Memory."
             
-            return f"Ingested {len(content)} characters. (No embedding generated)"
+            return f"Ingested {os.path.getsize(path)} characters. (No embedding generated)"
         except Exception as e:
             return f"Error reading Bible: {e}"
 
@@ -594,17 +933,23 @@ class KnowledgeSeeker:
         return f"I have processed information regarding '{topic}'. My internal database has been updated."
 
 class AutoLearner:
-    def __init__(self, brain_memory):
+    RESERVED_WORKERS = 1 # Sandbox workers batches leave for interactive runs
+    MAX_FIX_ATTEMPTS = 2 # fix_code retries per failed candidate, as in attempt_learning
+
+    def __init__(self, brain_memory, lock=None):
         self.memory = brain_memory
+        self.lock = lock or threading.RLock() # The owning brain's lock; chat writes the same memory
         # Load mastered skills from persistent memory
         self.mastered_tasks = set(self.memory.data.get("skills", []))
         self.failed_tasks = self.memory.data.get("failed_tasks", {}) # key -> attempt_count
-        self.project_files = self._scan_project()
+        self._project_files = None # Scanned on first use, not on startup
         
         # Reinforcement Learning: Q-Table
         self.q_table = self.memory.data.get("q_table", {}) # task_type -> {tool_type -> score}
         self.net = NeuralNet(3, 5, 1) # Predictor Net for Script Utility
         self.classifier = MetaClassifier(self.memory)
+        self.run_cache = RunCache()
+        self.throughput = 0.0 # candidates/sec of the last batch
         
         # Skill Tree: parent -> child
         self.skill_tree = {
@@ -633,16 +978,15 @@ class AutoLearner:
             "check_imports": "I have learned dependency tracking. Knowing what we use helps optimize the build."
         }
         
+    @property
+    def project_files(self):
+        if self._project_files is None:
+            self._project_files = self._scan_project()
+        return self._project_files
+
     def _scan_project(self):
         """Finds all python files in the current directory."""
-        import os
-        files = []
-        for root, _, filenames in os.walk("."):
-             if ".venv" in root or ".git" in root: continue
-             for f in filenames:
-                 if f.endswith(".py"):
-                     files.append(f)
-        return files
+        return [os.path.basename(p) for p in get_project_index().python_files()]
         
     def generate_task(self):
         """Returns a Meta-Cognitive objective."""
@@ -761,23 +1105,96 @@ class AutoLearner:
         
         return score
     
-    def install_extension(self, name, code):
-        """Appends high-utility code to ai_extensions.py"""
+    def install_extension(self, name, code, score=None):
+        """Installs high-utility code into the extension store (one entry per unique tool)."""
         try:
-            # Clean up the code to be a function, not a script
-            # Removing imports from body if strictly needed, but efficient way is:
-            # Append plain script? Better to wrap in function if possible or just append.
-            # For this MVP, we append the raw script but change __main__ to a function call?
-            # Actually, simplest is just append it.
-            
-            with open("src/ai/extensions.py", "a") as f:
-                f.write(f"\n\n# Installed by AutoLearner (Score: 90+)\n")
-                f.write(code)
-            return True
+            from src.ai.extensions import install_extension
+            return install_extension(name, code, score)
         except Exception as e:
             print(f"Install Error: {e}")
             return False
 
+    @staticmethod
+    def _features(code):
+        """Inputs: [Length (norm), Line Count (norm), Import Count (norm)]"""
+        feat_len = min(1.0, len(code) / 2000)
+        feat_lines = min(1.0, code.count('\n') / 100)
+        feat_imports = min(1.0, code.count('import') / 10)
+        return [feat_len, feat_lines, feat_imports]
+
+    def _run_candidate(self, code):
+        """Runs a script through the result cache or the sandbox. Returns (success, output, utility_score)."""
+        cached = self.run_cache.get(code)
+        if cached:
+            return cached
+        success, output = CodeSandbox.simulate(code)
+        # 3. Reward System (Utility Check)
+        utility_score = self.evaluate_utility(output) if success else 0
+        self.run_cache.put(code, success, output, utility_score)
+        return success, output, utility_score
+
+    def _run_with_fixes(self, code):
+        """_run_candidate plus up to MAX_FIX_ATTEMPTS ToolGenerator.fix_code repairs.
+        Returns (success, output, utility_score, code actually run)."""
+        success, output, utility_score = self._run_candidate(code)
+        for _ in range(self.MAX_FIX_ATTEMPTS):
+            if success or output.startswith(TRANSIENT_ERRORS): break
+            fixed = ToolGenerator.fix_code(code, output)
+            if fixed == code: break # No known repair for this error
+            code = fixed
+            success, output, utility_score = self._run_candidate(code)
+        return success, output, utility_score, code
+
+    def _learn_knowledge(self, key, desc):
+        # Route to KnowledgeSeeker directly
+        if "bible" in desc.lower():
+            msg = KnowledgeSeeker.ingest_bible(self.memory)
+        else:
+            topic = desc.replace("research", "").strip()
+            msg = KnowledgeSeeker.research_topic(topic)
+        
+        # Mark as mastered functionality-wise (so we don't spam it)
+        self.mastered_tasks.add(key)
+        if key not in self.memory.data.get("skills", []):
+               self.memory.data.setdefault("skills", []).append(key)
+               self.memory.save()
+        
+        return True, f"KNOWLEDGE INTAKE: {msg}"
+
+    def _reward(self, key, name, code, utility_score):
+        """Saves, masters or records failure for a successfully executed script."""
+        if utility_score >= 40: # Threshold for "Useful"
+            self.memory.save_script(name, code)
+            self.mastered_tasks.add(key)
+            # Persist skills
+            if key not in self.memory.data.get("skills", []):
+                self.memory.data.setdefault("skills", []).append(key)
+                self.memory.save()
+                
+            # Clear failure count on success
+            if key in self.failed_tasks:
+                del self.failed_tasks[key]
+                self.memory.data["failed_tasks"] = self.failed_tasks
+                self.memory.save()
+            
+            # Lesson Extraction
+            lesson = self.lessons.get(key, "I have expanded my neural pathways.")
+                
+            # Evolution / Integration Check
+            if utility_score >= 90:
+                self.install_extension(name, code, utility_score)
+                return True, f"MASTERED & INSTALLED: {name} (Score: {utility_score})\nLESSON: {lesson}"
+                
+            return True, f"Learned: {name} (Utility: {utility_score})\nLESSON: {lesson}"
+        else:
+            # Logic for recording failure
+            current = self.failed_tasks.get(key, 0)
+            self.failed_tasks[key] = current + 1
+            self.memory.data["failed_tasks"] = self.failed_tasks
+            self.memory.save()
+            
+            return False, f"Discarded: {name} (Low Utility: {utility_score}) [Failure #{current+1}]"
+
     def attempt_learning(self):
         """Generates, Runs, Evaluates, and Saves."""
         import time
@@ -804,30 +1221,13 @@ class AutoLearner:
         print(f"[Meta-Cognition] Task '{desc}' classified as: {task_type}")
         
         if task_type == "KNOWLEDGE":
-             # Route to KnowledgeSeeker directly
-             if "bible" in desc.lower():
-                 msg = KnowledgeSeeker.ingest_bible(self.memory)
-             else:
-                 topic = desc.replace("research", "").strip()
-                 msg = KnowledgeSeeker.research_topic(topic)
-             
-             # Mark as mastered functionality-wise (so we don't spam it)
-             self.mastered_tasks.add(key)
-             if key not in self.memory.data.get("skills", []):
-                    self.memory.data.setdefault("skills", []).append(key)
-                    self.memory.save()
-             
-             return True, f"KNOWLEDGE INTAKE: {msg}"
+             return self._learn_knowledge(key, desc)
 
         # 1. Generate (SKILL PATH)
         code = ToolGenerator.create_tool(name, desc)
         
         # NEURAL NETWORK PREDICTION
-        # Inputs: [Length (norm), Line Count (norm), Import Count (norm)]
-        feat_len = min(1.0, len(code) / 2000)
-        feat_lines = min(1.0, code.count('\n') / 100)
-        feat_imports = min(1.0, code.count('import') / 10)
-        input_vec = [feat_len, feat_lines, feat_imports]
+        input_vec = self._features(code)
         
         prediction = self.net.predict(input_vec)
         print(f"[NeuralNet] Prediction for {name}: {prediction:.4f}")
@@ -842,12 +1242,9 @@ class AutoLearner:
         max_attempts = 3
         
         while attempts < max_attempts:
-            success, output = CodeSandbox.simulate(code)
+            success, output, utility_score = self._run_candidate(code)
             
             if success:
-                # 3. Reward System (Utility Check)
-                utility_score = self.evaluate_utility(output)
-                
                 # TRAIN NEURAL NET
                 # Normalize score (0-200 -> 0-1)
                 norm_score = min(1.0, utility_score / 150.0)
@@ -856,37 +1253,7 @@ class AutoLearner:
                 # DEBUG PRINT
                 print(f"[Auto-Learner DEBUG] {name} Output:\n{output}\nScore: {utility_score}\nNet Error: {abs(norm_score - prediction):.4f}")
                 
-                if utility_score >= 40: # Threshold for "Useful"
-                    self.memory.save_script(name, code)
-                    self.mastered_tasks.add(key)
-                    # Persist skills
-                    if key not in self.memory.data.get("skills", []):
-                        self.memory.data.setdefault("skills", []).append(key)
-                        self.memory.save()
-                        
-                    # Clear failure count on success
-                    if key in self.failed_tasks:
-                        del self.failed_tasks[key]
-                        self.memory.data["failed_tasks"] = self.failed_tasks
-                        self.memory.save()
-                    
-                    # Lesson Extraction
-                    lesson = self.lessons.get(key, "I have expanded my neural pathways.")
-                        
-                    # Evolution / Integration Check
-                    if utility_score >= 90:
-                        self.install_extension(name, code)
-                        return True, f"MASTERED & INSTALLED: {name} (Score: {utility_score})\nLESSON: {lesson}"
-                        
-                    return True, f"Learned: {name} (Utility: {utility_score})\nLESSON: {lesson}"
-                else:
-                    # Logic for recording failure
-                    current = self.failed_tasks.get(key, 0)
-                    self.failed_tasks[key] = current + 1
-                    self.memory.data["failed_tasks"] = self.failed_tasks
-                    self.memory.save()
-                    
-                    return False, f"Discarded: {name} (Low Utility: {utility_score}) [Failure #{current+1}]"
+                return self._reward(key, name, code, utility_score)
             else:
                 attempts += 1
                 new_code = ToolGenerator.fix_code(code, output)
@@ -898,6 +1265,83 @@ class AutoLearner:
                 
         return False, f"Failed: {name} after {max_attempts} attempts."
 
+    def generate_candidates(self, n, first=None):
+        """Builds up to n distinct (key, desc, name, code) candidates: fresh tasks, then crossovers."""
+        import time
+        candidates = []
+        seen = set()
+
+        def add(key, desc, name, code):
+            norm = RunCache.normalize(code)
+            if norm in seen: return # mutate() only adds comments; identical runs are wasted work
+            seen.add(norm)
+            candidates.append((key, desc, name, code))
+
+        stamp = int(time.time())
+        for attempt in range(n * 3): # generate_task may return blacklisted/None slots
+            if len(candidates) >= n: break
+            key, desc = first if (attempt == 0 and first) else self.generate_task()
+            if key is None: continue
+            if attempt > 0 and self.classifier.classify(desc) == "KNOWLEDGE": continue # Not a sandbox job
+            code = ToolGenerator.create_tool(f"auto_{key}_{stamp}", desc)
+            if self.net.predict(self._features(code)) < 0.2:
+                code = CodeEvolver.mutate(code)
+            add(key, desc, f"auto_{key}_{stamp}", code)
+
+        # Genetic fill: recombine what we have. A child gets its own key, so its
+        # result never masters (or blacklists) either parent's task.
+        for i in range(n * 2):
+            if len(candidates) >= n or len(candidates) < 2: break
+            (key_a, desc_a, _, code_a), (key_b, desc_b, _, code_b) = random.sample(candidates, 2)
+            key = f"crossover_{key_a}_{key_b}"
+            add(key, f"{desc_a} + {desc_b}", f"auto_{key}_{i}_{stamp}",
+                CodeEvolver.mutate(CodeEvolver.crossover(code_a, code_b)))
+
+        return candidates
+
+    def attempt_learning_batch(self, n=None):
+        """Evaluates n candidates concurrently in sandbox workers and keeps the best by utility."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Leave one sandbox worker free so interactive CodeSandbox.simulate calls never queue behind a batch
+        workers = max(1, get_sandbox_pool().size - self.RESERVED_WORKERS)
+        n = n or workers * 2
+
+        # Memory, the net and the Q-table are shared with chat: hold the brain lock
+        # while reading or updating them, but not while candidates run.
+        with self.lock:
+            # Knowledge tasks need no sandbox; handle the first one directly
+            key, desc = self.generate_task()
+            if key is not None and self.classifier.classify(desc) == "KNOWLEDGE":
+                return self._learn_knowledge(key, desc)
+
+            candidates = self.generate_candidates(n, first=(key, desc) if key is not None else None)
+        if not candidates:
+            return False, "No new tasks. Scanning..."
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(self._run_with_fixes, [c[3] for c in candidates]))
+        elapsed = max(time.monotonic() - start, 1e-6)
+        self.throughput = len(candidates) / elapsed
+        batch_info = f"[Batch: {len(candidates)} candidates @ {self.throughput:.1f}/s]"
+
+        with self.lock:
+            best = None
+            for (key, desc, name, _), (success, output, utility_score, code) in zip(candidates, results):
+                if not success: continue
+                self.net.train(self._features(code), [min(1.0, utility_score / 150.0)])
+                if best is None or utility_score > best[4]:
+                    best = (key, desc, name, code, utility_score)
+
+            if best is None:
+                return False, f"Batch failed: no candidate ran successfully. {batch_info}"
+
+            key, desc, name, code, utility_score = best
+            success, msg = self._reward(key, name, code, utility_score)
+        return success, f"{msg}\n{batch_info}"
+
 class WordVault:
     """Stores complex vocabulary to enhance fluidity."""
     def __init__(self):
@@ -927,11 +1371,29 @@ class WordVault:
                 new_words.append(w)
         return " ".join(new_words)
 
+# --- INTENT REGISTRY ---
+class IntentRegistry:
+    """Conversational intents matched by cosine similarity to a prototype phrase.
+    Prototype vectors are computed once, at registration."""
+    def __init__(self):
+        self.intents = [] # (name, label, prototype vector, threshold), checked in order
+
+    def register(self, name, label, prototype, threshold=0.5):
+        self.intents.append((name, label, VectorEngine.text_to_vector(prototype), threshold))
+
+    def match(self, vec):
+        """Returns (name, label) of the first intent vec is similar enough to, or None."""
+        for name, label, proto_vec, threshold in self.intents:
+            if VectorEngine.get_cosine_similarity(vec, proto_vec) > threshold:
+                return name, label
+        return None
+
 class NeuralBrain:
     def __init__(self):
+        self.lock = threading.RLock() # One brain serves every window's worker thread
         self.memory = NeuralMemory()
         self.perceptron = SimplePerceptron()
-        self.auto_learner = AutoLearner(self.memory)
+        self.auto_learner = AutoLearner(self.memory, lock=self.lock)
         
         # Fluid Intelligence
         self.mood = 0.0 # -1.0 (Depressed) to 1.0 (Euphoric)
@@ -942,6 +1404,30 @@ class NeuralBrain:
             "Genesis": {"prefix": "System: ", "suffix": ""},
             "Shepherd": {"prefix": "Blessings. ", "suffix": " Have faith."}
         }
+        self.metrics = get_metrics()
+
+        # Names double as DynamicGenerator intents
+        self.intents = IntentRegistry()
+        self.intents.register("status", "Status Check", "how are you status report")
+        self.intents.register("greeting", "Greeting", "hello hi greetings good morning")
+
+        # Commands and keyword intents; plugins extend this with router.add_*
+        self.router = IntentRouter()
+        self.router.add_command("/learn", self._cmd_learn)
+        self.router.add_command("/opinion", self._cmd_opinion)
+        self.router.add_command("/scan", self._cmd_scan)
+        self.router.add_command("/ingest", self._cmd_ingest)
+        self.router.add_command("/stats", self._cmd_stats)
+        self.router.add_keywords("create", ["create", "write", "generate", "build"])
+        self.router.add_keywords("object", ["tool", "script", "program", "code"])
+        self.router.add_keywords("opinion", ["think", "opinion"])
+        self.router.add_keywords("environment", ["file", "scan"])
+        self.router.add_keywords("about_me", ["i", "my", "mine", "am"])
+        self.router.add_keywords("about_ai", ["you", "your"])
+        self.router.add_intent("autonomous_coding", self._intent_coding, requires=("create", "object"))
+        self.router.add_intent("opinion", self._intent_opinion, requires=("opinion",))
+        self.router.add_intent("conversation", self._intent_conversation)
+        self.router.add_intent("environment", self._intent_environment, requires=("environment",))
         
     def update_mood(self, delta):
         self.mood += delta
@@ -954,10 +1440,23 @@ class NeuralBrain:
     def get_persona_names(self):
         return list(self.personas.keys())
 
+    def respond(self, user_input, persona=None):
+        """Thread-safe get_response, optionally in a caller's own persona."""
+        with self.lock:
+            if persona:
+                self.set_persona(persona)
+            return self.get_response(user_input)
+
     def get_response(self, user_input):
+        with self.metrics.timer("total"):
+            return self._get_response(user_input)
+
+    def _get_response(self, user_input):
+        timer = self.metrics.timer
         user_input_clean = user_input.strip()
-        user_vec = VectorEngine.text_to_vector(user_input_clean)
-        sentiment = SentimentEngine.analyze(user_input_clean)
+        with timer("vectorize"):
+            user_vec = VectorEngine.text_to_vector(user_input_clean)
+            sentiment = SentimentEngine.analyze(user_input_clean)
         
         # Fluid Mood Update
         if sentiment == "Positive": self.update_mood(0.1)
@@ -966,127 +1465,24 @@ class NeuralBrain:
         thoughts = []
         thoughts.append(f"Analyzed vectors. Sentiment: {sentiment}. Mood: {self.mood:.2f}")
 
-        # 0. Commands
-        if user_input_clean.startswith("/learn"):
-            parts = user_input_clean[6:].split(":")
-            if len(parts) == 2:
-                q = parts[0].strip()
-                a = parts[1].strip()
-                self.memory.add_qa(q, a)
-                return self._style("I have stored that in my neural network.")
-            return self._style("Usage: /learn Question : Answer")
-            
-        if user_input_clean.startswith("/opinion"):
-            parts = user_input_clean[8:].split(":")
-            if len(parts) == 2:
-                topic = parts[0].strip()
-                thought = parts[1].strip()
-                self.memory.add_opinion(topic, thought)
-                return self._style(f"I have formed an opinion on {topic}.")
-            return self._style("Usage: /opinion Topic : Thought")
-
-        if user_input_clean.startswith("/scan"):
-            files = EnvironmentScanner.scan()
-            self.memory.update_files(files)
-            count = len(files)
-            thoughts.append(f"Environment Scanned. Found {count} files.")
-            return self._format_response(thoughts, f"Scan complete. I am now aware of {count} files in this environment.")
-
-        if user_input_clean.startswith("/ingest"):
-            filename = user_input_clean[7:].strip()
-            if os.path.exists(filename):
-                try:
-                    with open(filename, "r") as f:
-                        lines = f.readlines()
-                        count = 0
-                        for line in lines:
-                            l = line.strip()
-                            if len(l) > 10:
-                                self.memory.add_fact(f"File {filename} contains: {l}")
-                                count += 1
-                    thoughts.append(f"Ingested {count} lines mainly from {filename}.")
-                    return self._format_response(thoughts, f"I have processed {filename} and expanded my knowledge base.")
-                except Exception as e:
-                     return self._style(f"Error reading file: {e}")
-            else:
-                 return self._style(f"File {filename} not found.")
+        # 0. Commands & Intents (one automaton pass over the input)
+        with timer("intent_check"):
+            route = self.router.route(user_input_clean)
+        if route.command:
+            return route.command(route.args, thoughts)
 
-        # 0.5 Autonomous Coding Intent
-        # "create a tool to...", "write a script that..."
-        creation_triggers = ["create", "write", "generate", "build"]
-        object_triggers = ["tool", "script", "program", "code"]
-        
-        has_create = any(t in user_input_clean.lower() for t in creation_triggers)
-        has_object = any(t in user_input_clean.lower() for t in object_triggers)
-        
-        if has_create and has_object:
-            thoughts.append("Intent detected: Autonomous Coding.")
-            
-            # Simple extraction of name (heuristic)
-            name = "auto_generated_tool"
-            if "named" in user_input_clean:
-                try:
-                    parts = user_input_clean.split("named")[1].strip().split(" ")
-                    name = parts[0]
-                except: pass
-            else:
-                name = f"tool_{random.randint(1000,9999)}"
-            
-            thoughts.append(f"Generating code for '{name}' based on description...")
-            code = ToolGenerator.create_tool(name, user_input_clean)
-            
-            thoughts.append("Running simulation (MicroVM) to verify logic...")
-            success, output = CodeSandbox.simulate(code)
-            
-            if success:
-                thoughts.append(f"Simulation Passed. Output: {output.strip()[:50]}...")
-                self.memory.save_script(name, code)
-                return self._format_response(thoughts, f"I have successfully created and verified the tool '{name}'.\nSimulation Output: {output.strip()}\nIt has been saved to the Script Library.")
-            else:
-                thoughts.append(f"Simulation Failed. Error: {output}")
-                return self._format_response(thoughts, f"I attempted to create '{name}', but the simulation failed.\nError: {output}\nI will learn from this failure.")
+        ctx = {"text": user_input_clean, "vec": user_vec, "sentiment": sentiment,
+               "thoughts": thoughts, "hits": route.hits}
+        for name, handler in route.intents:
+            with timer(f"intent:{name}"):
+                response = handler(ctx)
+            if response is not None:
+                return response
 
         # 1. Context Check
-        is_about_me = any(w in user_input_clean.lower() for w in ["i", "my", "mine", "am"])
-        is_about_ai = any(w in user_input_clean.lower() for w in ["you", "your"])
-        
-        # 2. Check Opinions
-        if "think" in user_input_clean.lower() or "opinion" in user_input_clean.lower():
-            thoughts.append("Searching opinions...")
-            best_op_match = None
-            best_op_score = 0.0
-            for item in self.memory.data["opinions"]:
-                score = VectorEngine.get_cosine_similarity(user_vec, VectorEngine.text_to_vector(item["topic"]))
-                # Decision: Perceptron
-                term_confidence = self.perceptron.decide(score, True, sentiment) # Context True because explicitly asked "opinion"
-                if term_confidence > best_op_score:
-                    best_op_score = term_confidence
-                    best_op_match = item["thought"]
-            
-            if best_op_score > self.perceptron.threshold:
-                thoughts.append(f"Opinion Decision Score: {best_op_score:.2f}")
-                return self._format_response(thoughts, f"Here is my thought: {best_op_match}")
-
-        # 3. Dynamic Intent Detection
-        status_vec = VectorEngine.text_to_vector("how are you status report")
-        if VectorEngine.get_cosine_similarity(user_vec, status_vec) > 0.5:
-             thoughts.append(f"Intent detected: Status Check -> Generating dynamic response")
-             response = DynamicGenerator.generate_fluid("status", sentiment, self.mood, self.personas.get(self.current_persona, {}))
-             return self._format_response_raw(thoughts, response)
-
-        greeting_vec = VectorEngine.text_to_vector("hello hi greetings good morning")
-        if VectorEngine.get_cosine_similarity(user_vec, greeting_vec) > 0.5:
-             thoughts.append(f"Intent detected: Greeting -> Generating dynamic response")
-             response = DynamicGenerator.generate_fluid("greeting", sentiment, self.mood, self.personas.get(self.current_persona, {}))
-             return self._format_response_raw(thoughts, response)
-        
-        # 3.5 Check Environment Awareness
-        if "file" in user_input_clean.lower() or "scan" in user_input_clean.lower():
-             known_files = ", ".join(self.memory.data.get("files", [])[:5]) # List top 5
-             if known_files:
-                 thoughts.append("Accessing Environment Memory...")
-                 return self._format_response(thoughts, f"I am aware of these files: {known_files}...")
-
+        is_about_me = "about_me" in route.hits
+        is_about_ai = "about_ai" in route.hits
+        
         # 4. Search QA (Using Perceptron)
         best_qa_match = None
         best_qa_score = 0.0
@@ -1094,14 +1490,15 @@ class NeuralBrain:
         # QA is preferred if talking about AI
         qa_context_bonus = is_about_ai 
 
-        for item in self.memory.data["qa"]:
-            raw_score = VectorEngine.get_cosine_similarity(user_vec, VectorEngine.text_to_vector(item["q"]))
-            # NEURAL DECISION
-            confidence = self.perceptron.decide(raw_score, qa_context_bonus, sentiment)
-            
-            if confidence > best_qa_score:
-                best_qa_score = confidence
-                best_qa_match = item["a"]
+        with timer("qa_scan"):
+            for item in self.memory.data["qa"]:
+                raw_score = VectorEngine.get_cosine_similarity(user_vec, VectorEngine.text_to_vector(item["q"]))
+                # NEURAL DECISION
+                confidence = self.perceptron.decide(raw_score, qa_context_bonus, sentiment)
+                
+                if confidence > best_qa_score:
+                    best_qa_score = confidence
+                    best_qa_match = item["a"]
 
         if best_qa_score > self.perceptron.threshold:
             thoughts.append(f"QA Perceptron Score: {best_qa_score:.2f}")
@@ -1115,24 +1512,39 @@ class NeuralBrain:
         # Facts preferred if talking about User
         fact_context_bonus = is_about_me
 
-        for fact in self.memory.data.get("facts", []):
-            raw_score = VectorEngine.get_cosine_similarity(user_vec, VectorEngine.text_to_vector(fact))
-            # NEURAL DECISION
-            confidence = self.perceptron.decide(raw_score, fact_context_bonus, sentiment)
-            
-            if confidence > best_fact_score:
-                best_fact_score = confidence
-                best_fact_match = fact
+        with timer("fact_scan"):
+            for fact in self.memory.data.get("facts", []):
+                raw_score = VectorEngine.get_cosine_similarity(user_vec, VectorEngine.text_to_vector(fact))
+                # NEURAL DECISION
+                confidence = self.perceptron.decide(raw_score, fact_context_bonus, sentiment)
+                
+                if confidence > best_fact_score:
+                    best_fact_score = confidence
+                    best_fact_match = fact
             
         if best_fact_score > self.perceptron.threshold:
             thoughts.append(f"Fact Perceptron Score: {best_fact_score:.2f}")
             return self._format_response(thoughts, f"I recall you saying: '{best_fact_match}'")
 
+        # 5.5 Search Knowledge Corpus (Embedded Chunks)
+        if self.memory.chunk_store.chunks:
+            thoughts.append("Scanning Knowledge Corpus...")
+            with timer("corpus_scan"):
+                raw_score, chunk = self.memory.search_chunks(user_vec)
+            if chunk:
+                confidence = self.perceptron.decide(raw_score, False, sentiment)
+                if confidence > self.perceptron.threshold:
+                    passage = self.memory.corpus.resolve(chunk).strip()
+                    if passage:
+                        thoughts.append(f"Corpus Perceptron Score: {confidence:.2f}")
+                        return self._format_response(thoughts, f"From {self.memory.corpus.name(chunk['file'])}: {passage}")
+
         # 6. Implicit Learning
         if not "?" in user_input_clean:
             tokens = VectorEngine.tokenize(user_input_clean)
             if len(tokens) >= 2:
-                self.memory.add_fact(user_input_clean)
+                with timer("implicit_learning"):
+                    self.memory.add_fact(user_input_clean)
                 thoughts.append("New information detected. Storing to memory.")
                 return self._format_response(thoughts, "I have noted that.")
             else:
@@ -1142,6 +1554,126 @@ class NeuralBrain:
         thoughts.append("No suitable match found via Perceptron.")
         return self._format_response_raw(thoughts, DynamicGenerator.generate_fluid("confusion", sentiment, self.mood, self.personas.get(self.current_persona, {})))
 
+    # --- Commands ---
+    def _cmd_learn(self, args, thoughts):
+        parts = args.split(":")
+        if len(parts) == 2:
+            q = parts[0].strip()
+            a = parts[1].strip()
+            self.memory.add_qa(q, a)
+            return self._style("I have stored that in my neural network.")
+        return self._style("Usage: /learn Question : Answer")
+
+    def _cmd_opinion(self, args, thoughts):
+        parts = args.split(":")
+        if len(parts) == 2:
+            topic = parts[0].strip()
+            thought = parts[1].strip()
+            self.memory.add_opinion(topic, thought)
+            return self._style(f"I have formed an opinion on {topic}.")
+        return self._style("Usage: /opinion Topic : Thought")
+
+    def _cmd_scan(self, args, thoughts):
+        files = EnvironmentScanner.scan()
+        self.memory.update_files(files)
+        count = len(files)
+        thoughts.append(f"Environment Scanned. Found {count} files.")
+        return self._format_response(thoughts, f"Scan complete. I am now aware of {count} files in this environment.")
+
+    def _cmd_ingest(self, args, thoughts):
+        filename = args.strip()
+        if os.path.exists(filename):
+            try:
+                # Text stays on disk; memory only keeps offsets + vectors
+                count = KnowledgeSeeker.ingest_file(filename, self.memory)
+                thoughts.append(f"Embedded {count} chunks from {filename}.")
+                return self._format_response(thoughts, f"I have processed {filename} and expanded my knowledge base.")
+            except Exception as e:
+                 return self._style(f"Error reading file: {e}")
+        else:
+             return self._style(f"File {filename} not found.")
+
+    def _cmd_stats(self, args, thoughts):
+        """/stats shows per-stage latency; /stats json [path] exports it; /stats reset clears it."""
+        option = args.strip().split(" ", 1)
+        if option[0] == "reset":
+            self.metrics.reset()
+            return self._style("Latency metrics cleared.")
+        if option[0] == "json":
+            path = option[1].strip() if len(option) > 1 else os.path.join("data", "brain_stats.json")
+            try:
+                self.metrics.to_json(path)
+            except Exception as e:
+                return self._style(f"Error writing stats: {e}")
+            return self._style(f"Latency metrics exported to {path}.")
+        thoughts.append(f"Memory size: {len(self.memory.data['qa'])} QA, {len(self.memory.data.get('facts', []))} facts.")
+        return self._format_response(thoughts, f"Per-stage latency:\n{self.metrics.format_table()}")
+
+    # --- Intents (return None to fall through) ---
+    def _intent_coding(self, ctx):
+        # "create a tool to...", "write a script that..."
+        user_input_clean = ctx["text"]
+        thoughts = ctx["thoughts"]
+        thoughts.append("Intent detected: Autonomous Coding.")
+        
+        # Simple extraction of name (heuristic)
+        name = "auto_generated_tool"
+        if "named" in user_input_clean:
+            try:
+                parts = user_input_clean.split("named")[1].strip().split(" ")
+                name = parts[0]
+            except: pass
+        else:
+            name = f"tool_{random.randint(1000,9999)}"
+        
+        thoughts.append(f"Generating code for '{name}' based on description...")
+        code = ToolGenerator.create_tool(name, user_input_clean)
+        
+        thoughts.append("Running simulation (MicroVM) to verify logic...")
+        success, output = CodeSandbox.simulate(code)
+        
+        if success:
+            thoughts.append(f"Simulation Passed. Output: {output.strip()[:50]}...")
+            self.memory.save_script(name, code)
+            return self._format_response(thoughts, f"I have successfully created and verified the tool '{name}'.\nSimulation Output: {output.strip()}\nIt has been saved to the Script Library.")
+        else:
+            thoughts.append(f"Simulation Failed. Error: {output}")
+            return self._format_response(thoughts, f"I attempted to create '{name}', but the simulation failed.\nError: {output}\nI will learn from this failure.")
+
+    def _intent_opinion(self, ctx):
+        thoughts = ctx["thoughts"]
+        thoughts.append("Searching opinions...")
+        best_op_match = None
+        best_op_score = 0.0
+        for item in self.memory.data["opinions"]:
+            score = VectorEngine.get_cosine_similarity(ctx["vec"], VectorEngine.text_to_vector(item["topic"]))
+            # Decision: Perceptron
+            term_confidence = self.perceptron.decide(score, True, ctx["sentiment"]) # Context True because explicitly asked "opinion"
+            if term_confidence > best_op_score:
+                best_op_score = term_confidence
+                best_op_match = item["thought"]
+        
+        if best_op_score > self.perceptron.threshold:
+            thoughts.append(f"Opinion Decision Score: {best_op_score:.2f}")
+            return self._format_response(thoughts, f"Here is my thought: {best_op_match}")
+        return None
+
+    def _intent_conversation(self, ctx):
+        intent = self.intents.match(ctx["vec"])
+        if not intent:
+            return None
+        name, label = intent
+        ctx["thoughts"].append(f"Intent detected: {label} -> Generating dynamic response")
+        response = DynamicGenerator.generate_fluid(name, ctx["sentiment"], self.mood, self.personas.get(self.current_persona, {}))
+        return self._format_response_raw(ctx["thoughts"], response)
+
+    def _intent_environment(self, ctx):
+        known_files = ", ".join(self.memory.data.get("files", [])[:5]) # List top 5
+        if known_files:
+            ctx["thoughts"].append("Accessing Environment Memory...")
+            return self._format_response(ctx["thoughts"], f"I am aware of these files: {known_files}...")
+        return None
+
     def _style(self, text):
         p = self.personas.get(self.current_persona, self.personas["Standard"])
         prefix = p.get("prefix", "")
@@ -1163,3 +1695,14 @@ class NeuralBrain:
         prefix = p.get("prefix", "")
         suffix = p.get("suffix", "")
         return f"{prefix}{text}{suffix}"
+
+_brain = None
+_brain_lock = threading.Lock()
+
+def get_neural_brain():
+    """Returns the process-wide brain, loading memory and the learner on first use."""
+    global _brain
+    with _brain_lock:
+        if _brain is None:
+            _brain = NeuralBrain()
+        return _brain
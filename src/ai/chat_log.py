@@ -0,0 +1,195 @@
+from collections import deque
+from PyQt6.QtWidgets import QApplication, QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt6.QtGui import QTextDocument, QAction, QKeySequence, QDesktopServices
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QTimer, QEvent, QPointF, QUrl
+
+# --- MODEL ---
+class ChatLogModel(QAbstractListModel):
+    """Ring buffer of HTML chat messages. Appends are queued and inserted once per frame."""
+    FLUSH_INTERVAL_MS = 16
+
+    def __init__(self, max_messages=2000, parent=None):
+        super().__init__(parent)
+        self.max_messages = max_messages
+        self._messages = deque() # (seq, html); seq stays stable while rows shift
+        self._pending = []
+        self._next_seq = 0
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._messages)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._messages):
+            return None
+        seq, html = self._messages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return html
+        if role == Qt.ItemDataRole.UserRole:
+            return seq
+        return None
+
+    def append(self, html):
+        """Queues a message; it shows up on the next flush."""
+        self._pending.append((self._next_seq, html))
+        self._next_seq += 1
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        if not self._pending:
+            return
+        batch, self._pending = self._pending[-self.max_messages:], []
+
+        # Evict the oldest rows first so the buffer never exceeds its cap
+        overflow = len(self._messages) + len(batch) - self.max_messages
+        if overflow > 0:
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            for _ in range(overflow):
+                self._messages.popleft()
+            self.endRemoveRows()
+
+        start = len(self._messages)
+        self.beginInsertRows(QModelIndex(), start, start + len(batch) - 1)
+        self._messages.extend(batch)
+        self.endInsertRows()
+
+    def clear(self):
+        self._pending = []
+        self.beginResetModel()
+        self._messages.clear()
+        self.endResetModel()
+
+# --- VIEW ---
+class ChatMessageDelegate(QStyledItemDelegate):
+    """Renders a message's HTML at the view's width and opens clicked links.
+    Only visible rows are laid out; heights are cached per width."""
+    PADDING = 4
+    FALLBACK_WIDTH = 400 # Used only without a view
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._heights = {} # seq -> (width, height)
+
+    def _document(self, html, width):
+        doc = QTextDocument()
+        doc.setDocumentMargin(self.PADDING)
+        doc.setHtml(html)
+        doc.setTextWidth(width)
+        return doc
+
+    @staticmethod
+    def plain_text(html):
+        doc = QTextDocument()
+        doc.setHtml(html)
+        return doc.toPlainText()
+
+    def _width(self, option):
+        # sizeHint's option.rect is usually empty, so wrap at the view's viewport width
+        view = self.parent()
+        if isinstance(view, QAbstractItemView):
+            return max(1, view.viewport().width())
+        return option.rect.width() or self.FALLBACK_WIDTH
+
+    def paint(self, painter, option, index):
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(option.rect, option.palette.highlight())
+        doc = self._document(index.data(), option.rect.width())
+        painter.save()
+        painter.translate(option.rect.topLeft())
+        doc.drawContents(painter)
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        seq = index.data(Qt.ItemDataRole.UserRole)
+        width = self._width(option)
+        cached = self._heights.get(seq)
+        if cached and cached[0] == width:
+            return QSize(width, cached[1])
+        height = int(self._document(index.data(), width).size().height())
+        self._heights[seq] = (width, height)
+        return QSize(width, height)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.MouseButton.LeftButton:
+            doc = self._document(index.data(), option.rect.width())
+            anchor = doc.documentLayout().anchorAt(event.position() - QPointF(option.rect.topLeft()))
+            if anchor:
+                QDesktopServices.openUrl(QUrl(anchor)) # As QTextBrowser.setOpenExternalLinks(True) did
+                return True
+        return super().editorEvent(event, model, option, index)
+
+    def forget(self, seqs):
+        for seq in seqs:
+            self._heights.pop(seq, None)
+
+    def forget_all(self):
+        self._heights.clear()
+
+class ChatLogView(QListView):
+    """Drop-in for the assistant's QTextBrowser history with a bounded, virtualized log.
+
+    Text is selected per message rather than per character: select messages
+    (click, Shift/Ctrl+click) and copy them with Ctrl+C or the context menu.
+    """
+    def __init__(self, max_messages=2000, parent=None):
+        super().__init__(parent)
+        self.log_model = ChatLogModel(max_messages, self)
+        self.delegate = ChatMessageDelegate(self)
+        self.setModel(self.log_model)
+        self.setItemDelegate(self.delegate)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setWordWrap(True)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.copy_action = QAction("Copy", self)
+        self.copy_action.setShortcut(QKeySequence.StandardKey.Copy)
+        self.copy_action.setShortcutContext(Qt.ShortcutContext.WidgetShortcut)
+        self.copy_action.triggered.connect(self.copy_selection)
+        self.addAction(self.copy_action)
+        self.setContextMenuPolicy(Qt.ContextMenuPolicy.ActionsContextMenu)
+        self.log_model.rowsAboutToBeInserted.connect(self._remember_scroll)
+        self.log_model.rowsInserted.connect(self._follow_tail)
+        self.log_model.rowsAboutToBeRemoved.connect(self._forget_rows)
+        self._at_bottom = True
+        self._layout_width = None
+
+    def append(self, html):
+        self.log_model.append(html)
+
+    def clear(self):
+        self.log_model.clear()
+
+    def selected_text(self):
+        """Plain text of the selected messages, oldest first."""
+        rows = sorted(index.row() for index in self.selectionModel().selectedIndexes())
+        return "\n".join(ChatMessageDelegate.plain_text(self.log_model.index(row).data()).strip() for row in rows)
+
+    def copy_selection(self):
+        text = self.selected_text()
+        if text:
+            QApplication.clipboard().setText(text)
+
+    def _remember_scroll(self, *args):
+        bar = self.verticalScrollBar()
+        self._at_bottom = bar.value() >= bar.maximum() - 4
+
+    def _follow_tail(self, *args):
+        # Only stick to the newest message if the user hasn't scrolled up
+        if self._at_bottom:
+            self.scrollToBottom()
+
+    def _forget_rows(self, parent, first, last):
+        self.delegate.forget(self.log_model.index(row).data(Qt.ItemDataRole.UserRole)
+                             for row in range(first, last + 1))
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        width = self.viewport().width()
+        if width != self._layout_width:
+            self._layout_width = width
+            self.delegate.forget_all() # Heights depend on the wrap width
+            self.scheduleDelayedItemsLayout() # Re-wrap visible rows at the new width
@@ -0,0 +1,111 @@
+import os
+import ast
+import hashlib
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# --- AST SUMMARIES ---
+_BRANCH_NODES = (ast.If, ast.For, ast.AsyncFor, ast.While, ast.IfExp, ast.ExceptHandler,
+                 ast.Assert, ast.comprehension)
+
+def cyclomatic_complexity(func_node):
+    """McCabe complexity of one function: 1 + number of decision points."""
+    score = 1
+    for node in ast.walk(func_node):
+        if isinstance(node, _BRANCH_NODES):
+            score += 1
+            if isinstance(node, ast.comprehension):
+                score += len(node.ifs)
+        elif isinstance(node, ast.BoolOp):
+            score += len(node.values) - 1
+        elif hasattr(ast, "match_case") and isinstance(node, ast.match_case):
+            score += 1
+    return score
+
+def summarize_source(content):
+    """Line count, TODOs, defs, classes, imports and per-function complexity of Python source."""
+    lines = content.splitlines()
+    todos = [[i, line.strip()] for i, line in enumerate(lines, 1) if "TODO" in line]
+    summary = {"lines": len(lines), "todos": todos, "functions": [], "classes": [],
+               "imports": [], "complexity": {}}
+    try:
+        tree = ast.parse(content)
+    except (SyntaxError, ValueError):
+        return summary
+
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            summary["functions"].append(node.name)
+            summary["complexity"][f"{node.name}:{node.lineno}"] = cyclomatic_complexity(node)
+        elif isinstance(node, ast.ClassDef):
+            summary["classes"].append(node.name)
+        elif isinstance(node, ast.Import):
+            summary["imports"].extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            summary["imports"].append(node.module)
+    return summary
+
+# --- PARALLEL ANALYZER ---
+class ParallelAnalyzer:
+    """Summarizes Python files across cores, caching results by content hash."""
+    MIN_PARALLEL = 16 # below this, process startup costs more than it saves
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+        self.cache = {} # sha1 of content -> summary
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def content_hash(content):
+        return hashlib.sha1(content.encode("utf-8", errors="ignore")).hexdigest()
+
+    def seed(self, digest, summary):
+        """Registers a previously computed summary (e.g. from a persisted index)."""
+        with self._lock:
+            self.cache.setdefault(digest, summary)
+
+    def _can_fork_workers(self):
+        # Daemon processes (the sandbox workers) may not have children
+        return not multiprocessing.current_process().daemon
+
+    def _summarize_all(self, contents):
+        if len(contents) >= self.MIN_PARALLEL and self._can_fork_workers():
+            try:
+                workers = self.max_workers or os.cpu_count() or 1
+                chunksize = max(1, len(contents) // (4 * workers))
+                ctx = multiprocessing.get_context("spawn")
+                with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+                    return list(pool.map(summarize_source, contents, chunksize=chunksize))
+            except (BrokenProcessPool, OSError) as e:
+                print(f"Parallel analysis unavailable, running inline: {e}")
+        return [summarize_source(content) for content in contents]
+
+    def analyze(self, paths):
+        """Returns {path: summary} for readable files. Each summary carries its content 'hash'."""
+        results = {}
+        pending = {} # hash -> (content, [paths])
+        for path in paths:
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    content = f.read()
+            except OSError:
+                continue
+            digest = self.content_hash(content)
+            with self._lock:
+                cached = self.cache.get(digest)
+            if cached is not None:
+                results[path] = dict(cached, hash=digest)
+            else:
+                pending.setdefault(digest, (content, []))[1].append(path)
+
+        if pending:
+            digests = list(pending)
+            summaries = self._summarize_all([pending[d][0] for d in digests])
+            with self._lock:
+                for digest, summary in zip(digests, summaries):
+                    self.cache[digest] = summary
+                    for path in pending[digest][1]:
+                        results[path] = dict(summary, hash=digest)
+        return results
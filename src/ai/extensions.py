@@ -1,902 +1,140 @@
 # AI Extensions Module
-# This file is autonomously updated by the AI Brain.
-# Scripts with Utility Score > 90 are installed here.
-
-def list_extensions():
-    """Lists all installed extensions."""
-    import inspect
-    import sys
-    
-    funcs = []
-    current_module = sys.modules[__name__]
-    for name, obj in inspect.getmembers(current_module):
-        if inspect.isfunction(obj) and name != "list_extensions":
-            funcs.append(name)
-    return funcs
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_evo_test
-# Description: find TODO comments and save to json report
+# Tools with Utility Score >= 90 are installed here by the AutoLearner.
+# Each unique tool is stored once (keyed by a hash of its code) under
+# data/extensions/, next to a manifest of its metadata. Importing this
+# module runs nothing; a tool's code is loaded on its first call.
 
 import os
-import time
-import re
-import json
-import sys
-
-def run_task():
-    print(f'Task: find TODO comments and save to json report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project for TODOs...')
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                path = os.path.join(root, file)
-                with open(path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if 'TODO' in line:
-                            print(f'{file}:{i} -> {line.strip()}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_evo_test
-# Description: find TODO comments and save to json report
-
 import json
-import time
-import re
-import os
-import sys
-
-def run_task():
-    print(f'Task: find TODO comments and save to json report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project for TODOs (JSON Mode)...')
-    todos = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                path = os.path.join(root, file)
-                with open(path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if 'TODO' in line:
-                            todos.append({'file': file, 'line': i, 'content': line.strip()})
-    print(json.dumps(todos, indent=2))
-    with open('todo_report.json', 'w') as f: json.dump(todos, f, indent=2)
-    print('Report saved to todo_report.json')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_find_todos_1770330296
-# Description: find TODO comments in project
-
-import sys
-import os
-import re
-import time
-
-def run_task():
-    print(f'Task: find TODO comments in project')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project for TODOs...')
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                path = os.path.join(root, file)
-                with open(path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if 'TODO' in line:
-                            print(f'{file}:{i} -> {line.strip()}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_find_todos_v2_1770330311
-# Description: find TODO comments in project
-
-import sys
-import os
-import re
-import time
-
-def run_task():
-    print(f'Task: find TODO comments in project')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project for TODOs...')
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                path = os.path.join(root, file)
-                with open(path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if 'TODO' in line:
-                            print(f'{file}:{i} -> {line.strip()}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_find_todos_json_1770330321
-# Description: find TODO comments and save to json report
-
-import os
-import time
-import re
-import sys
-import json
-
-def run_task():
-    print(f'Task: find TODO comments and save to json report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project for TODOs (JSON Mode)...')
-    todos = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                path = os.path.join(root, file)
-                with open(path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if 'TODO' in line:
-                            todos.append({'file': file, 'line': i, 'content': line.strip()})
-    print(json.dumps(todos, indent=2))
-    with open('todo_report.json', 'w') as f: json.dump(todos, f, indent=2)
-    print('Report saved to todo_report.json')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_analyze_code_1770330351
-# Description: analyze code structure of ai_brain.py
-
-import sys
-import os
-import ast
-import time
-
-def run_task():
-    print(f'Task: analyze code structure of ai_brain.py')
-    print(f'CWD: {os.getcwd()}')
-    target = 'ai_brain.py'
-    if not os.path.exists(target):
-        print(f'Missing: Target {target} not found.')
-        return
-    with open(target, 'r', encoding='utf-8') as f: content = f.read()
-    tree = ast.parse(content)
-    functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-    classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-    print(f'Analysis of {target}:')
-    print(f'  Functions: {len(functions)} {functions}')
-    print(f'  Classes:   {len(classes)} {classes}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_analyze_code_complexity_1770330361
-# Description: analyze code structure complexity and size
-
-import sys
-import os
-import ast
-import time
-
-def run_task():
-    print(f'Task: analyze code structure complexity and size')
-    print(f'CWD: {os.getcwd()}')
-    target = 'ai_brain.py'
-    if not os.path.exists(target):
-        print(f'Missing: Target {target} not found.')
-        return
-    with open(target, 'r', encoding='utf-8') as f: content = f.read()
-    tree = ast.parse(content)
-    functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-    classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-    print(f'Analysis of {target}:')
-    print(f'  Functions: {len(functions)} {functions}')
-    print(f'  Classes:   {len(classes)} {classes}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_find_todos_v2_1770330401
-# Description: find TODO comments in project
-
-import sys
-import os
-import re
-import time
-
-def run_task():
-    print(f'Task: find TODO comments in project')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project for TODOs...')
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                path = os.path.join(root, file)
-                with open(path, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if 'TODO' in line:
-                            print(f'{file}:{i} -> {line.strip()}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_analyze_code_v2_1770330411
-# Description: analyze code structure of ai_brain.py
-
-import sys
-import os
-import ast
-import time
-
-def run_task():
-    print(f'Task: analyze code structure of ai_brain.py')
-    print(f'CWD: {os.getcwd()}')
-    target = 'ai_brain.py'
-    if not os.path.exists(target):
-        print(f'Missing: Target {target} not found.')
-        return
-    with open(target, 'r', encoding='utf-8') as f: content = f.read()
-    tree = ast.parse(content)
-    functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-    classes = [node.name for node in ast.walk(tree) if isinstance(node, ast.ClassDef)]
-    print(f'Analysis of {target}:')
-    print(f'  Functions: {len(functions)} {functions}')
-    print(f'  Classes:   {len(classes)} {classes}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_find_TODO_59_1770331431
-# Description: find TODO in project and save to json
-
-import re
-import datetime
-import random
-import sys
-import time
-import os
-import json
-
-def run_task():
-    print(f'Task: find TODO in project and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_count_TODO_55_1770331482
-# Description: count TODO in project and report
-
-import datetime
-import random
-import sys
-import time
-import os
-
-def run_task():
-    print(f'Task: count TODO in project and report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_analyze_classes_75_1770331507
-# Description: analyze classes recursively and save to json
-
-import datetime
-import ast
-import random
-import sys
-import time
-import os
-import json
-
-def run_task():
-    print(f'Task: analyze classes recursively and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    all_funcs = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
-            tree = ast.parse(content)
-            funcs = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-            if funcs:
-                print(f'{path}: {funcs}')
-                all_funcs.extend(funcs)
-        except: pass
-    print(f'Total Functions Found: {len(all_funcs)}')
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
+import hashlib
+import threading
+import importlib.util
+
+STORE_DIR = os.path.join("data", "extensions")
+
+class ExtensionStore:
+    """Content-addressed store of installed tools with a metadata manifest."""
+    MANIFEST = "manifest.json"
+
+    def __init__(self, store_dir=STORE_DIR):
+        self.store_dir = store_dir
+        self.manifest_path = os.path.join(store_dir, self.MANIFEST)
+        self._manifest = None # hash -> metadata, read on first use
+        self._modules = {} # hash -> loaded module
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def strip_autorun(code):
+        """Removes the top-level run_task() call generated scripts end with."""
+        lines = [line for line in code.split("\n") if line.rstrip() != "run_task()"]
+        return "\n".join(lines).rstrip() + "\n"
+
+    @staticmethod
+    def content_hash(code):
+        """Hash of the code without comments, blank lines or import order, so renamed copies collide."""
+        lines = [line.rstrip() for line in code.split("\n")]
+        lines = [l for l in lines if l and not l.lstrip().startswith("#")]
+        imports = sorted(l for l in lines if l.startswith(("import ", "from ")))
+        body = [l for l in lines if not l.startswith(("import ", "from "))]
+        return hashlib.sha1("\n".join(imports + body).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _description(code):
+        for line in code.split("\n"):
+            if line.startswith("# Description:"):
+                return line[len("# Description:"):].strip()
+        return ""
+
+    # --- Manifest ---
+    def _load_manifest(self):
+        if self._manifest is None:
+            self._manifest = {}
+            if os.path.exists(self.manifest_path):
+                try:
+                    with open(self.manifest_path, "r") as f:
+                        self._manifest = json.load(f)
+                except Exception as e:
+                    print(f"Extension Manifest Error: {e}")
+        return self._manifest
+
+    def _save_manifest(self):
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(self._manifest, f, indent=4)
+        os.replace(tmp_path, self.manifest_path)
+
+    # --- API ---
+    def install(self, name, code, score=None):
+        """Stores a tool once per unique body. Returns False if an identical tool exists."""
+        code = self.strip_autorun(code)
+        digest = self.content_hash(code)
+        with self._lock:
+            manifest = self._load_manifest()
+            if digest in manifest:
+                return False
+
+            filename = f"{digest[:16]}.py"
+            os.makedirs(self.store_dir, exist_ok=True)
+            with open(os.path.join(self.store_dir, filename), "w") as f:
+                f.write(code)
+
+            manifest[digest] = {
+                "name": name,
+                "description": self._description(code),
+                "score": score,
+                "file": filename,
+                "order": len(manifest)
+            }
+            self._save_manifest()
+            return True
+
+    def list(self):
+        """Metadata of every installed tool, oldest first. Reads the manifest only."""
+        with self._lock:
+            manifest = self._load_manifest()
+            entries = [dict(meta, hash=digest) for digest, meta in manifest.items()]
+        return sorted(entries, key=lambda e: e.get("order", 0))
+
+    def _find(self, name):
+        """Hash of the newest tool called name (or whose hash starts with name)."""
+        matches = [e for e in self.list() if e["name"] == name or e["hash"].startswith(name)]
+        return matches[-1]["hash"] if matches else None
+
+    def load(self, name):
+        """Imports a tool's module on first use and returns it."""
+        digest = self._find(name)
+        if digest is None:
+            raise KeyError(f"Extension not found: {name}")
+        with self._lock:
+            if digest not in self._modules:
+                path = os.path.join(self.store_dir, self._manifest[digest]["file"])
+                spec = importlib.util.spec_from_file_location(f"genesis_ext_{digest[:16]}", path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                self._modules[digest] = module
+            return self._modules[digest]
+
+    def run(self, name):
+        return self.load(name).run_task()
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_extension_store():
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ExtensionStore()
+        return _store
 
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_find_TODO_80_1770331517
-# Description: find TODO in project and report
-
-import re
-import datetime
-import random
-import sys
-import time
-import os
-
-def run_task():
-    print(f'Task: find TODO in project and report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_analyze_functions_3_1770331543
-# Description: analyze functions recursively and save to json
-
-import datetime
-import ast
-import random
-import sys
-import time
-import os
-import json
-
-def run_task():
-    print(f'Task: analyze functions recursively and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    all_funcs = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
-            tree = ast.parse(content)
-            funcs = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-            if funcs:
-                print(f'{path}: {funcs}')
-                all_funcs.extend(funcs)
-        except: pass
-    print(f'Total Functions Found: {len(all_funcs)}')
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_count_TODO_48_1770331573
-# Description: count TODO in project and save to json
-
-import datetime
-import random
-import sys
-import time
-import os
-import json
-
-def run_task():
-    print(f'Task: count TODO in project and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_analyze_functions_42_1770332175
-# Description: analyze functions recursively and save to json
-
-import datetime
-import ast
-import time
-import os
-import sys
-import json
-import random
-
-def run_task():
-    print(f'Task: analyze functions recursively and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    all_funcs = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
-            tree = ast.parse(content)
-            funcs = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-            if funcs:
-                print(f'{path}: {funcs}')
-                all_funcs.extend(funcs)
-        except: pass
-    print(f'Total Functions Found: {len(all_funcs)}')
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_analyze_TODO_97_1770332200
-# Description: analyze TODO in project and report
-
-import datetime
-import ast
-import time
-import os
-import sys
-import random
-
-def run_task():
-    print(f'Task: analyze TODO in project and report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_find_TODO_6_1770332210
-# Description: find TODO recursively and save to json
-
-import datetime
-import re
-import time
-import os
-import sys
-import json
-import random
-
-def run_task():
-    print(f'Task: find TODO recursively and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_analyze_classes_26_1770332240
-# Description: analyze classes in project and save to json
-
-import datetime
-import ast
-import time
-import os
-import sys
-import json
-import random
-
-def run_task():
-    print(f'Task: analyze classes in project and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    all_funcs = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f: content = f.read()
-            tree = ast.parse(content)
-            funcs = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
-            if funcs:
-                print(f'{path}: {funcs}')
-                all_funcs.extend(funcs)
-        except: pass
-    print(f'Total Functions Found: {len(all_funcs)}')
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_count_TODO_36_1770332255
-# Description: count TODO recursively and report
-
-import datetime
-import time
-import os
-import sys
-import random
-
-def run_task():
-    print(f'Task: count TODO recursively and report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_find_TODO_99_1770332296
-# Description: find TODO in project and save to json
-
-import datetime
-import re
-import time
-import os
-import sys
-import json
-import random
-
-def run_task():
-    print(f'Task: find TODO in project and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_find_TODO_1770332930
-# Description: find TODO in project and report
-
-import random
-import sys
-import time
-import re
-import os
-import datetime
-
-def run_task():
-    print(f'Task: find TODO in project and report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_count_TODO_1770332940
-# Description: count TODO in project and report
-
-import random
-import sys
-import time
-import os
-import datetime
-
-def run_task():
-    print(f'Task: count TODO in project and report')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-
-
-run_task()
-
-
-# Installed by AutoLearner (Score: 90+)
-# Tool: auto_procedural_analyze_TODO_1770333025
-# Description: analyze TODO recursively and save to json
-
-import random
-import sys
-import time
-import ast
-import json
-import os
-import datetime
-
-def run_task():
-    print(f'Task: analyze TODO recursively and save to json')
-    print(f'CWD: {os.getcwd()}')
-    print('Scanning project...')
-    target_files = []
-    for root, dirs, files in os.walk('.'):
-        if '.venv' in root or '.git' in root: continue
-        for file in files:
-            if file.endswith('.py'):
-                target_files.append(os.path.join(root, file))
-    found_items = []
-    for path in target_files:
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                for i, line in enumerate(f, 1):
-                    if 'TODO' in line:
-                        item = {'file': path, 'line': i, 'content': line.strip()}
-                        found_items.append(item)
-                        print(f'{path}:{i} -> {line.strip()}')
-        except: pass
-    # Saving Report
-    report_data = []
-    if 'found_items' in locals(): report_data = found_items
-    elif 'all_funcs' in locals(): report_data = all_funcs
-    elif 'target_files' in locals(): report_data = target_files
-    
-    filename = 'auto_report.json'
-    with open(filename, 'w') as f: json.dump(report_data, f, indent=2)
-    print(f'Report saved to {filename}')
+def list_extensions():
+    """Lists all installed extensions (metadata only; nothing is imported)."""
+    return get_extension_store().list()
 
+def install_extension(name, code, score=None):
+    return get_extension_store().install(name, code, score)
 
-run_task()
+def run_extension(name):
+    """Loads (on first call) and runs an installed extension's run_task()."""
+    return get_extension_store().run(name)
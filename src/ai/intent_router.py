@@ -0,0 +1,110 @@
+from collections import deque
+
+# --- AHO-CORASICK ---
+class AhoCorasick:
+    """Multi-pattern substring matcher: finds every occurrence of every pattern in one pass."""
+    def __init__(self, patterns):
+        self.goto = [{}]  # state -> {char: state}
+        self.fail = [0]
+        self.out = [[]]   # state -> patterns ending here
+        for pattern in patterns:
+            self._add(pattern)
+        self._link()
+
+    def _add(self, pattern):
+        state = 0
+        for ch in pattern:
+            nxt = self.goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.out.append([])
+                self.goto[state][ch] = nxt
+            state = nxt
+        self.out[state].append(pattern)
+
+    def _link(self):
+        """Breadth-first failure links; each state also inherits its fallback's outputs."""
+        todo = deque(self.goto[0].values())
+        while todo:
+            state = todo.popleft()
+            for ch, nxt in self.goto[state].items():
+                todo.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                self.fail[nxt] = self.goto[f].get(ch, 0)
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def search(self, text):
+        """Yields (start, pattern) for every match in text."""
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(ch, 0)
+            for pattern in self.out[state]:
+                yield i - len(pattern) + 1, pattern
+
+# --- ROUTER ---
+class Route:
+    def __init__(self, command=None, args="", hits=None, intents=None):
+        self.command = command    # handler of the matched /command, if any
+        self.args = args          # text after the command prefix
+        self.hits = hits or set() # keyword groups present in the text
+        self.intents = intents or [] # (name, handler) whose keyword groups all matched, in order
+
+class IntentRouter:
+    """Routes input to /commands and keyword-triggered intents with one automaton pass.
+
+    Plugins register through add_command, add_keywords and add_intent; the
+    automaton is rebuilt lazily on the next route() after any registration.
+    Keywords match as case-insensitive substrings, commands as exact prefixes.
+    """
+    def __init__(self):
+        self.commands = {}  # prefix -> handler(args, thoughts)
+        self.keywords = {}  # group -> [words]
+        self.intents = []   # (name, required groups, handler(ctx))
+        self._automaton = None
+        self._owners = {}   # pattern -> [("command", prefix) | ("keyword", group)]
+
+    def add_command(self, prefix, handler):
+        self.commands[prefix] = handler
+        self._automaton = None
+
+    def add_keywords(self, group, words):
+        self.keywords.setdefault(group, []).extend(w.lower() for w in words)
+        self._automaton = None
+
+    def add_intent(self, name, handler, requires=()):
+        """Intents are tried in registration order; a handler returning None falls through."""
+        self.intents.append((name, tuple(requires), handler))
+
+    def _compile(self):
+        self._owners = {}
+        for prefix in self.commands:
+            self._owners.setdefault(prefix.lower(), []).append(("command", prefix))
+        for group, words in self.keywords.items():
+            for word in words:
+                self._owners.setdefault(word, []).append(("keyword", group))
+        self._automaton = AhoCorasick(self._owners)
+
+    def route(self, text):
+        if self._automaton is None:
+            self._compile()
+
+        command = None
+        hits = set()
+        for start, pattern in self._automaton.search(text.lower()):
+            for kind, key in self._owners[pattern]:
+                if kind == "keyword":
+                    hits.add(key)
+                elif start == 0 and text.startswith(key) and (command is None or len(key) > len(command)):
+                    command = key # Longest matching prefix wins
+
+        if command is not None:
+            return Route(self.commands[command], text[len(command):], hits)
+        intents = [(name, handler) for name, requires, handler in self.intents
+                   if all(group in hits for group in requires)]
+        return Route(hits=hits, intents=intents)
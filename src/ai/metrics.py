@@ -0,0 +1,97 @@
+import os
+import json
+import time
+import bisect
+import threading
+from collections import deque
+from contextlib import contextmanager
+
+# --- METRICS REGISTRY ---
+class StageHistogram:
+    """Wall-time distribution of one stage: fixed millisecond buckets plus recent samples for percentiles."""
+    BUCKETS_MS = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000] # upper bounds; last bucket is overflow
+    RECENT = 1024
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(self.BUCKETS_MS) + 1)
+        self.recent = deque(maxlen=self.RECENT)
+
+    def add(self, ms):
+        self.count += 1
+        self.total += ms
+        self.max = max(self.max, ms)
+        self.buckets[bisect.bisect_left(self.BUCKETS_MS, ms)] += 1
+        self.recent.append(ms)
+
+    def percentile(self, p):
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(p / 100.0 * len(ordered)))]
+
+    def summary(self):
+        labels = [f"<={b}ms" for b in self.BUCKETS_MS] + [f">{self.BUCKETS_MS[-1]}ms"]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "max_ms": round(self.max, 3),
+            "histogram": {label: n for label, n in zip(labels, self.buckets) if n}
+        }
+
+class MetricsRegistry:
+    """In-process latency metrics keyed by stage name."""
+    def __init__(self):
+        self.stages = {} # name -> StageHistogram, in first-seen order
+        self._lock = threading.Lock()
+
+    def record(self, name, seconds):
+        with self._lock:
+            self.stages.setdefault(name, StageHistogram()).add(seconds * 1000.0)
+
+    @contextmanager
+    def timer(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: hist.summary() for name, hist in self.stages.items()}
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+
+    def to_json(self, path=None):
+        """Returns the snapshot as JSON, also writing it to path if given."""
+        text = json.dumps({"generated": time.time(), "stages": self.snapshot()}, indent=4)
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w") as f:
+                f.write(text)
+        return text
+
+    def format_table(self):
+        lines = []
+        for name, s in self.snapshot().items():
+            lines.append(f"{name}: n={s['count']} mean={s['mean_ms']:.2f}ms "
+                         f"p50={s['p50_ms']:.2f}ms p95={s['p95_ms']:.2f}ms max={s['max_ms']:.2f}ms")
+        return "\n".join(lines) if lines else "No timings recorded yet."
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+def get_metrics():
+    """Returns the process-wide metrics registry."""
+    global _metrics
+    with _metrics_lock:
+        if _metrics is None:
+            _metrics = MetricsRegistry()
+        return _metrics
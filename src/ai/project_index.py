@@ -0,0 +1,157 @@
+import os
+import json
+import time
+import hashlib
+import threading
+from src.ai.code_analyzer import ParallelAnalyzer
+
+# --- PROJECT INDEX ---
+class ProjectIndex:
+    """Incremental index of the project tree shared by the brain and generated tools.
+
+    Every file gets path, mtime and size. Python files also get line count,
+    TODO hits and an AST summary (functions, classes, imports, complexity).
+    A refresh only re-reads files whose mtime or size changed since the last
+    one, and only re-parses those whose content hash is new.
+    """
+    IGNORE = {".git", ".venv", "venv", "__pycache__", ".vscode", ".gemini", ".history", ".pytest_cache"}
+    VERSION = 2
+
+    def __init__(self, root=".", cache_file=None, min_interval=1.0):
+        self.root = root
+        self.cache_file = cache_file
+        self.min_interval = min_interval # seconds between tree walks
+        self.files = {} # relative path -> entry
+        self._last_refresh = 0.0
+        self._lock = threading.RLock()
+        self.analyzer = ParallelAnalyzer()
+        self._load()
+
+    # --- Persistence ---
+    def _load(self):
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+        try:
+            with open(self.cache_file, "r") as f:
+                data = json.load(f)
+            if data.get("version") == self.VERSION:
+                self.files = data.get("files", {})
+        except Exception:
+            self.files = {}
+        for entry in self.files.values():
+            if "hash" in entry:
+                summary = {k: v for k, v in entry.items() if k not in ("mtime", "size", "hash")}
+                self.analyzer.seed(entry["hash"], summary)
+
+    def _save(self):
+        if not self.cache_file:
+            return
+        tmp_path = f"{self.cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            with open(tmp_path, "w") as f:
+                json.dump({"version": self.VERSION, "files": self.files}, f)
+            os.replace(tmp_path, self.cache_file) # Atomic; sandbox workers may save concurrently
+        except Exception as e:
+            print(f"Project Index Save Error: {e}")
+
+    # --- Indexing ---
+    def _walk(self):
+        own_file = os.path.abspath(self.cache_file) if self.cache_file else None
+        for root, dirs, filenames in os.walk(self.root):
+            dirs[:] = sorted(d for d in dirs if d not in self.IGNORE)
+            for name in sorted(filenames):
+                full_path = os.path.join(root, name)
+                if own_file and os.path.abspath(full_path).startswith(own_file):
+                    continue # The index file (and its temp copies) would always look changed
+                yield os.path.relpath(full_path, self.root), full_path
+
+    def refresh(self, force=False):
+        """Re-stats the tree and re-reads changed files. Returns True if anything changed."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and self.files and now - self._last_refresh < self.min_interval:
+                return False
+            self._last_refresh = now
+
+            changed = False
+            seen = set()
+            changed_python = [] # (rel_path, full_path, entry) to summarize in one batch
+            for rel_path, full_path in self._walk():
+                try:
+                    stat = os.stat(full_path)
+                except OSError:
+                    continue
+                seen.add(rel_path)
+                entry = self.files.get(rel_path)
+                if entry and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+
+                entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+                if rel_path.endswith(".py"):
+                    changed_python.append((rel_path, full_path, entry))
+                    continue
+                self.files[rel_path] = entry
+                changed = True
+
+            if changed_python:
+                summaries = self.analyzer.analyze([full_path for _, full_path, _ in changed_python])
+                for rel_path, full_path, entry in changed_python:
+                    if full_path not in summaries: continue # Unreadable; retry next refresh
+                    entry.update(summaries[full_path])
+                    self.files[rel_path] = entry
+                    changed = True
+
+            for rel_path in set(self.files) - seen:
+                del self.files[rel_path]
+                changed = True
+
+            if changed:
+                self._save()
+            return changed
+
+    # --- Queries ---
+    def entry(self, path):
+        self.refresh()
+        return self.files.get(os.path.relpath(path, self.root))
+
+    def python_files(self):
+        """Relative paths of every indexed .py file."""
+        with self._lock:
+            self.refresh()
+            return [p for p in self.files if p.endswith(".py")]
+
+    def top_level_files(self):
+        """File names directly under the root."""
+        with self._lock:
+            self.refresh()
+            return [p for p in self.files if os.sep not in p]
+
+    def todos(self):
+        """Returns (path, line, content) for every TODO in the project's Python files."""
+        with self._lock:
+            return [(path, line_no, content)
+                    for path in self.python_files()
+                    for line_no, content in self.files[path].get("todos", [])]
+
+    def fingerprint(self, predicate=None):
+        """Hash of path + mtime for every file (or every file matching predicate)."""
+        with self._lock:
+            self.refresh()
+            h = hashlib.sha1()
+            for path in sorted(self.files):
+                if predicate and not predicate(path):
+                    continue
+                h.update(f"{path}:{self.files[path]['mtime']}\n".encode("utf-8"))
+            return h.hexdigest()
+
+_index = None
+_index_lock = threading.Lock()
+
+def get_project_index():
+    """Returns this process's shared index of the working directory (persisted under data/)."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = ProjectIndex(".", cache_file=os.path.join("data", "project_index.json"))
+        return _index
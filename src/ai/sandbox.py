@@ -0,0 +1,175 @@
+import io
+import os
+import queue
+import atexit
+import threading
+import multiprocessing
+from contextlib import redirect_stdout
+
+try:
+    import resource # POSIX only; limits are skipped on Windows
+except ImportError:
+    resource = None
+
+# Failures caused by the sandbox itself rather than the code; not worth caching
+TRANSIENT_ERRORS = ("Timeout:", "Sandbox worker died", "Sandbox is shut down", "Cancelled by user")
+
+# --- WORKER PROCESS ---
+def _apply_memory_limit(memory_limit):
+    if resource and memory_limit:
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+        except (ValueError, OSError):
+            pass
+
+def _set_cpu_budget(cpu_limit):
+    """RLIMIT_CPU is per process lifetime, so move the soft limit forward before each task."""
+    if not (resource and cpu_limit):
+        return
+    try:
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        used = int(usage.ru_utime + usage.ru_stime) + 1
+        _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+        soft = used + cpu_limit
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+    except (ValueError, OSError):
+        pass
+
+def _worker_main(conn, memory_limit, cpu_limit):
+    """Receives code over the pipe, runs it in a fresh namespace, sends back (success, output)."""
+    _apply_memory_limit(memory_limit)
+    while True:
+        try:
+            code = conn.recv()
+        except (EOFError, OSError):
+            break
+        if code is None:
+            break
+
+        _set_cpu_budget(cpu_limit)
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                exec(code, {})
+            result = (True, buf.getvalue())
+        except SystemExit as e:
+            result = (e.code in (None, 0), buf.getvalue())
+        except BaseException as e:
+            result = (False, str(e))
+
+        try:
+            conn.send(result)
+        except (BrokenPipeError, OSError):
+            break
+
+# --- POOL ---
+class _Worker:
+    def __init__(self, process, conn):
+        self.process = process
+        self.conn = conn
+        self.owner = None # thread ident of the caller running a task
+        self.cancelled = False
+
+class SandboxPool:
+    """Pre-warmed worker processes for running generated code with time and memory limits."""
+    def __init__(self, size=2, timeout=10.0, memory_limit=512 * 1024 * 1024, cpu_limit=10):
+        self.size = size
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.cpu_limit = cpu_limit
+        # spawn, not fork: the parent is a threaded Qt process
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle = queue.Queue()
+        self._busy = set()
+        self._busy_lock = threading.Lock()
+        self._closed = False
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        parent_conn, child_conn = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker_main,
+            args=(child_conn, self.memory_limit, self.cpu_limit),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        return _Worker(process, parent_conn)
+
+    def _kill(self, worker):
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+        if worker.process.is_alive():
+            worker.process.kill()
+        worker.process.join(1.0)
+
+    def run(self, code, timeout=None):
+        """Runs code in an idle worker. Returns (success, output). Hung or crashed workers are replaced."""
+        if self._closed:
+            return False, "Sandbox is shut down."
+        timeout = self.timeout if timeout is None else timeout
+
+        worker = busy = self._idle.get()
+        worker.owner = threading.get_ident()
+        worker.cancelled = False
+        with self._busy_lock:
+            self._busy.add(busy)
+        try:
+            worker.conn.send(code)
+            if not worker.conn.poll(timeout):
+                self._kill(worker)
+                worker = self._spawn()
+                return False, f"Timeout: execution exceeded {timeout:g}s."
+            return worker.conn.recv()
+        except (EOFError, OSError):
+            self._kill(worker)
+            worker = self._spawn()
+            if busy.cancelled:
+                return False, "Cancelled by user."
+            return False, "Sandbox worker died (resource limit exceeded)."
+        finally:
+            with self._busy_lock:
+                self._busy.discard(busy)
+            self._idle.put(worker)
+
+    def cancel(self, owner=None):
+        """Kills running tasks, optionally only those started from thread `owner`. Returns the count."""
+        with self._busy_lock:
+            targets = [w for w in self._busy if owner is None or w.owner == owner]
+        for worker in targets:
+            worker.cancelled = True
+            if worker.process.is_alive():
+                worker.process.kill()
+        return len(targets)
+
+    def shutdown(self):
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+            worker.process.join(0.5)
+            self._kill(worker)
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_sandbox_pool():
+    """Returns the process-wide sandbox pool, starting it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Leave a core for the UI; batch learning scales with the rest
+            _pool = SandboxPool(size=max(2, min(4, (os.cpu_count() or 2) - 1)))
+            atexit.register(_pool.shutdown)
+        return _pool
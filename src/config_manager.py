@@ -88,6 +88,18 @@ class ConfigManager:
     def set_gradient_enabled(self, enabled):
         self.set("use_gradient", enabled)
 
+    def is_warm_jvm_enabled(self):
+        return self.get("warm_jvm", False)
+
+    def set_warm_jvm_enabled(self, enabled):
+        self.set("warm_jvm", enabled)
+
+    def is_prewarm_enabled(self):
+        return self.get("prewarm_modules", True)
+
+    def set_prewarm_enabled(self, enabled):
+        self.set("prewarm_modules", enabled)
+
     def get_window_geometry(self):
         return self.get("window_geometry", None)
 
@@ -2,6 +2,8 @@ import sys
 import os
 import ctypes
 import time
+import importlib
+import threading
 
 # --- Safe Import Logic ---
 def show_error_and_exit(missing_module):
@@ -31,26 +33,39 @@ except ImportError:
 if os.getcwd() not in sys.path:
     sys.path.append(os.getcwd())
 
+# The tools themselves (and the AI brain, integrations, updater) are imported
+# when first used, so the hub window can show before they load.
 try:
-    from workflow_organizer import SmartWorkflowOrganizer
-    from script_library import ScriptLibrary
-    from src.ai.assistant import NeuralAssistant
     from config_manager import ConfigManager
     from src.version import UPDATE_JSON_URL, APP_VERSION
-    from src.utils.updater import UpdateManager
 except ImportError as e:
-    SmartWorkflowOrganizer = None
-    ScriptLibrary = None
-    NeuralAssistant = None
     ConfigManager = None
     print(f"Import Error: {e}")
 
+# Modules the launcher can warm up in the background once the hub is painted
+PREWARM_MODULES = (
+    "src.script_library",
+    "src.workflow_organizer",
+    "src.ai.assistant",
+    "src.ai.brain",
+    "src.integrations.google_calendar",
+)
+
+def prewarm_modules(modules=PREWARM_MODULES):
+    """Imports modules so a later card click doesn't pay for it. Failures are left for that click to report."""
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"Prewarm skipped {name}: {e}")
+
 # --- WORKER THREADS ---
 class UpdateCheckThread(QThread):
     finished = pyqtSignal(bool, str, str, str) # has_update, version, url, notes
 
     def run(self):
         try:
+            from src.utils.updater import UpdateManager
             updater = UpdateManager(UPDATE_JSON_URL)
             has_update, new_ver, url, notes = updater.check_for_updates()
             self.finished.emit(has_update, new_ver, url, notes)
@@ -80,8 +95,14 @@ class DownloadThread(QThread):
 
 # --- MAIN LAUNCHER ---
 class GenesisLauncher(QMainWindow):
+    first_painted = pyqtSignal()
+    PREWARM_DELAY_MS = 300
+
     def __init__(self):
         super().__init__()
+        self.first_paint_at = None # perf_counter() of the first paint, for startup timing
+        self.prewarm_thread = None
+        self.first_painted.connect(self.schedule_prewarm)
         self.setWindowTitle("Project Genesis - Hub")
         self.resize(800, 600)
         
@@ -169,6 +190,22 @@ class GenesisLauncher(QMainWindow):
         # Start Update Check
         QTimer.singleShot(100, self.start_update_check)
 
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_at is None:
+            self.first_paint_at = time.perf_counter()
+            self.first_painted.emit()
+
+    def schedule_prewarm(self):
+        if ConfigManager and ConfigManager._get_shared_instance().is_prewarm_enabled():
+            QTimer.singleShot(self.PREWARM_DELAY_MS, self.start_prewarm)
+
+    def start_prewarm(self):
+        """Imports the tool modules on a daemon thread; the UI thread stays free."""
+        if self.prewarm_thread is None:
+            self.prewarm_thread = threading.Thread(target=prewarm_modules, name="genesis-prewarm", daemon=True)
+            self.prewarm_thread.start()
+
     def animate_fade_in(self):
         try:
             from PyQt6.QtCore import QPropertyAnimation, QEasingCurve
@@ -212,6 +249,7 @@ class GenesisLauncher(QMainWindow):
         self.progress_dlg.setMinimumDuration(0)
         self.progress_dlg.setValue(0)
         
+        from src.utils.updater import UpdateManager
         updater = UpdateManager(UPDATE_JSON_URL)
         
         self.download_thread = DownloadThread(updater, url)
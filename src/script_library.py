@@ -1,34 +1,80 @@
 import sys
 import os
-import json
 from PyQt6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QListWidget, QPlainTextEdit, QLabel, 
+                             QHBoxLayout, QListView, QPlainTextEdit, QLabel, 
                              QPushButton, QInputDialog, QMessageBox, QSplitter,
-                             QComboBox, QTabWidget, QLineEdit)
+                             QComboBox, QTabWidget, QLineEdit, QSpinBox, QCheckBox)
 from PyQt6.QtGui import QColor, QFont, QIcon, QSyntaxHighlighter, QTextCharFormat
 from PyQt6.QtCore import Qt, QRegularExpression, QFileSystemWatcher, QTimer
 from src.themes import ThemeManager
 from config_manager import ConfigManager
+from src.script_runner import ScriptRun, get_python_pool
+from src.script_store import get_script_store
+from src.script_search import ScriptSearchIndex
+from src.ui.output_console import OutputConsole
+from src.ui.script_list import ScriptListModel
 
 # ... (Previous imports remain, ensure QFileSystemWatcher is added)
 
 # --- SYNTAX HIGHLIGHTER ---
-# --- SYNTAX HIGHLIGHTER ---
+class HighlightRules:
+    """One language's rules compiled into a single alternation regex.
+
+    Each top-level capture group is one token kind; `kinds[i - 1]` holds
+    (format, state) for group i, where a non-zero state marks the opening
+    delimiter of a multi-line token closed by `closers[state]`.
+    """
+    def __init__(self, rules, multiline=()):
+        kinds, parts = [], []
+        self.closers = {}
+        for state, (opener, closer, fmt) in enumerate(multiline, start=1):
+            parts.append(opener)
+            kinds.append((fmt, state))
+            self.closers[state] = (QRegularExpression(closer), fmt)
+        for pattern, fmt in rules:
+            parts.append(pattern)
+            kinds.append((fmt, 0))
+        self.kinds = kinds
+        self.regex = QRegularExpression("|".join(f"({p})" for p in parts)) if parts else None
+        if self.regex:
+            self.regex.optimize()
+
 class UniversalHighlighter(QSyntaxHighlighter):
+    LARGE_DOC_LINES = 10000 # Bigger documents are highlighted in the background
+    INLINE_BLOCKS = 300 # Blocks highlighted synchronously before deferring the rest
+    CHUNK_BLOCKS = 400 # Blocks per background step
+    DEFERRED = -2 # Block state of blocks still waiting for the background pass
+
+    _rule_cache = {} # language -> HighlightRules, shared by every editor
+
     def __init__(self, document):
         super().__init__(document)
-        self.rules = []
+        self.rules = None
         self.current_language = "Python"
+        self._ready_until = None # Blocks from here on are deferred (None: none are)
+        self._burst = 0
+        self._background = False
+        self._deferred_timer = QTimer(self)
+        self._deferred_timer.setInterval(0)
+        self._deferred_timer.timeout.connect(self._highlight_chunk)
         self.update_rules("Python")
 
-    def set_language(self, language):
-        self.current_language = document_language = language
+    def set_language(self, language, rehighlight=True):
+        if language == self.current_language and self.rules is not None:
+            return # Already highlighted with these rules
+        self.current_language = language
         self.update_rules(language)
-        self.rehighlight()
+        if rehighlight:
+            self.rehighlight()
 
     def update_rules(self, language):
-        self.rules = []
-        
+        rules = self._rule_cache.get(language)
+        if rules is None:
+            rules = self._rule_cache[language] = self.compile_rules(language)
+        self.rules = rules
+
+    @staticmethod
+    def compile_rules(language):
         # Common formats
         keyword_fmt = QTextCharFormat()
         keyword_fmt.setForeground(QColor("#569cd6")) 
@@ -40,9 +86,6 @@ class UniversalHighlighter(QSyntaxHighlighter):
         comment_fmt = QTextCharFormat()
         comment_fmt.setForeground(QColor("#6a9955"))
         
-        class_fmt = QTextCharFormat()
-        class_fmt.setForeground(QColor("#4ec9b0"))
-        
         if language == "Python":
             keywords = [
                 "def", "class", "if", "else", "elif", "while", "for", "in", "try", "except",
@@ -50,9 +93,16 @@ class UniversalHighlighter(QSyntaxHighlighter):
                 "with", "pass", "lambda", "break", "continue", "global", "nonlocal", "raise", 
                 "yield", "del", "assert", "async", "await"
             ]
-            self.rules.append((QRegularExpression(r"\".*\""), string_fmt))
-            self.rules.append((QRegularExpression(r"'.*'"), string_fmt))
-            self.rules.append((QRegularExpression(r"#[^\n]*"), comment_fmt))
+            # Earlier alternatives win at the same position: triple quotes before plain strings
+            return HighlightRules([
+                (r"#[^\n]*", comment_fmt),
+                (r'"(?:[^"\\]|\\.)*"', string_fmt),
+                (r"'(?:[^'\\]|\\.)*'", string_fmt),
+                (r"\b(?:" + "|".join(keywords) + r")\b", keyword_fmt),
+            ], multiline=[
+                (r'"""', r'"""', string_fmt),
+                (r"'''", r"'''", string_fmt),
+            ])
             
         elif language == "Java":
             keywords = [
@@ -61,37 +111,123 @@ class UniversalHighlighter(QSyntaxHighlighter):
                 "return", "new", "this", "super", "extends", "implements", "interface", "package", 
                 "import", "try", "catch", "finally", "throw", "throws", "null", "true", "false"
             ]
-            self.rules.append((QRegularExpression(r"\".*\""), string_fmt))
-            self.rules.append((QRegularExpression(r"//[^\n]*"), comment_fmt))
-            self.rules.append((QRegularExpression(r"/\*.*?\*/"), comment_fmt)) # Multi-line simple approx
+            return HighlightRules([
+                (r"//[^\n]*", comment_fmt),
+                (r'"(?:[^"\\]|\\.)*"', string_fmt),
+                (r"\b(?:" + "|".join(keywords) + r")\b", keyword_fmt),
+            ], multiline=[
+                (r"/\*", r"\*/", comment_fmt),
+            ])
             
-        else:
-            keywords = []
-
-        for word in keywords:
-            pattern = QRegularExpression(r"\b" + word + r"\b")
-            self.rules.append((pattern, keyword_fmt))
+        return HighlightRules([])
 
     def highlightBlock(self, text):
-        for pattern, format in self.rules:
-            match_iterator = pattern.globalMatch(text)
-            while match_iterator.hasNext():
-                match = match_iterator.next()
-                self.setFormat(match.capturedStart(), match.capturedLength(), format)
+        block_number = self.currentBlock().blockNumber()
+        if self._should_defer(block_number):
+            self.setCurrentBlockState(self.DEFERRED)
+            return
+
+        self.setCurrentBlockState(0)
+        rules = self.rules
+        pos = 0
+        state = self.previousBlockState()
+        if state in rules.closers:
+            # Continue a string/comment opened on an earlier line
+            pos = self._close_multiline(text, 0, 0, state)
+            if pos < 0:
+                return
+        if rules.regex is None:
+            return
+
+        while pos < len(text):
+            match = rules.regex.match(text, pos)
+            if not match.hasMatch():
+                break
+            group = match.lastCapturedIndex()
+            start, length = match.capturedStart(group), match.capturedLength(group)
+            fmt, opens = rules.kinds[group - 1]
+            if opens:
+                pos = self._close_multiline(text, start, length, opens)
+                if pos < 0:
+                    return
+                continue
+            self.setFormat(start, length, fmt)
+            pos = start + max(length, 1)
+
+    def _close_multiline(self, text, start, opener_length, state):
+        """Formats from start to the closing delimiter. Returns the position after it, or -1 if it spills over."""
+        closer, fmt = self.rules.closers[state]
+        match = closer.match(text, start + opener_length)
+        if match.hasMatch():
+            end = match.capturedEnd()
+            self.setFormat(start, end - start, fmt)
+            return end
+        self.setFormat(start, len(text) - start, fmt)
+        self.setCurrentBlockState(state)
+        return -1
+
+    # --- Deferred highlighting for large documents ---
+    def _should_defer(self, block_number):
+        if self._ready_until is not None and block_number >= self._ready_until:
+            return True
+        if self._background:
+            return False
+        # Count blocks highlighted without returning to the event loop (load, paste, rehighlight)
+        if self._burst == 0:
+            QTimer.singleShot(0, self._end_burst)
+        self._burst += 1
+        if self._burst > self.INLINE_BLOCKS and self.document().blockCount() > self.LARGE_DOC_LINES:
+            self._ready_until = block_number
+            self._deferred_timer.start()
+            return True
+        return False
+
+    def _end_burst(self):
+        self._burst = 0
+
+    def _highlight_chunk(self):
+        document = self.document()
+        block = document.findBlockByNumber(self._ready_until) if document else None
+        self._background = True
+        try:
+            for _ in range(self.CHUNK_BLOCKS):
+                if block is None or not block.isValid():
+                    break
+                self._ready_until = block.blockNumber() + 1
+                self.rehighlightBlock(block)
+                block = block.next()
+        finally:
+            self._background = False
+        if block is None or not block.isValid():
+            self._ready_until = None
+            self._deferred_timer.stop()
+
+    def is_pending(self):
+        """True while a background highlighting pass is running."""
+        return self._ready_until is not None
 
 # --- CONFIG ---
 class ScriptLibrary(QMainWindow):
+    RELOAD_DEBOUNCE_MS = 250
+    RELOAD_MAX_RETRIES = 20 # ~5 s of retrying an unreadable manifest
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Project Genesis - Script Library")
         self.resize(1000, 700)
         
-        self.save_file = "data/genesis_scripts.json"
+        # One file per script under data/scripts/, indexed by a manifest
+        self.store = get_script_store()
+        self.save_file = self.store.manifest_path
         
-        # Data Structure: { "Script Name": { "content": "...", "language": "Python" } }
+        # Data Structure: { "Script Name": { "language": "Python", "size": ..., "content": "..." } }
+        # "content" is only present once the script has been opened (or edited).
         self.scripts_data = {} 
         self.current_script = None
 
+        # Full-text search over names and contents (contents indexed in batches after the first search)
+        self.search_index = ScriptSearchIndex(loader=self._index_content)
+
         # --- UI STYLING (Matching the DAG) ---
         cfg = ConfigManager._get_shared_instance()
         theme_name = cfg.get_theme()
@@ -148,11 +284,42 @@ class ScriptLibrary(QMainWindow):
         self.txt_search.textChanged.connect(self.filter_scripts)
         toolbar.addWidget(self.txt_search)
 
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(150) # Debounce keystrokes
+        self.search_timer.timeout.connect(self.apply_search)
+
+        # Indexes pending script contents one batch per event-loop turn, so typing stays responsive
+        self.index_timer = QTimer(self)
+        self.index_timer.setInterval(0)
+        self.index_timer.timeout.connect(self.index_search_batch)
+
         self.btn_run = QPushButton("▶ Run")
         self.btn_run.setStyleSheet("background-color: #2da44e; color: white; border: none; font-weight: bold;")
         self.btn_run.clicked.connect(self.run_script)
         toolbar.addWidget(self.btn_run)
 
+        self.btn_stop = QPushButton("■ Stop")
+        self.btn_stop.setToolTip("Stop the script running in the selected output tab")
+        self.btn_stop.setStyleSheet("background-color: #a1260d; color: white; border: none; font-weight: bold;")
+        self.btn_stop.setEnabled(False)
+        self.btn_stop.clicked.connect(self.stop_script)
+        toolbar.addWidget(self.btn_stop)
+
+        self.spin_timeout = QSpinBox()
+        self.spin_timeout.setRange(0, 3600)
+        self.spin_timeout.setValue(60)
+        self.spin_timeout.setSuffix(" s")
+        self.spin_timeout.setSpecialValueText("No limit")
+        self.spin_timeout.setToolTip("Run timeout (0 = no limit)")
+        toolbar.addWidget(self.spin_timeout)
+
+        self.check_warm_jvm = QCheckBox("Warm JVM")
+        self.check_warm_jvm.setToolTip("Run Java scripts in a long-lived JVM (much faster repeat runs)")
+        self.check_warm_jvm.setChecked(cfg.is_warm_jvm_enabled())
+        self.check_warm_jvm.toggled.connect(cfg.set_warm_jvm_enabled)
+        toolbar.addWidget(self.check_warm_jvm)
+
         self.btn_new = QPushButton("+ New Script")
         self.btn_new.setObjectName("ActionBtn")
         self.btn_new.clicked.connect(self.new_script)
@@ -188,13 +355,11 @@ class ScriptLibrary(QMainWindow):
         """)
         
         # Tab 1: User Scripts
-        self.list_user = QListWidget()
-        self.list_user.currentItemChanged.connect(self.load_selected_script)
+        self.list_user = self._new_script_list()
         self.tabs.addTab(self.list_user, "User Scripts")
         
         # Tab 2: Genesis Learning
-        self.list_auto = QListWidget()
-        self.list_auto.currentItemChanged.connect(self.load_selected_script)
+        self.list_auto = self._new_script_list(grouped=True) # Grouped by generated task
         self.tabs.addTab(self.list_auto, "Genesis Learning")
         
         splitter.addWidget(self.tabs)
@@ -207,13 +372,17 @@ class ScriptLibrary(QMainWindow):
         self.editor.setPlaceholderText("Select or create a script to begin writing...")
         right_splitter.addWidget(self.editor)
         
-        # Console Output
-        self.output_console = QPlainTextEdit()
-        self.output_console.setPlaceholderText("Console Output...")
-        self.output_console.setReadOnly(True)
-        self.output_console.setStyleSheet("font-family: 'Consolas', monospace; font-size: 12px; background-color: #0a0a0a; color: #cccccc;")
-        self.output_console.setFixedHeight(150)
-        right_splitter.addWidget(self.output_console)
+        # Console Output (one tab per run so several scripts can run at once)
+        self.runs = {} # console -> ScriptRun
+        self.run_counter = 0
+        self.output_tabs = QTabWidget()
+        self.output_tabs.setTabsClosable(True)
+        self.output_tabs.tabCloseRequested.connect(self.close_output_tab)
+        self.output_tabs.currentChanged.connect(self.update_run_buttons)
+        self.output_tabs.setFixedHeight(180)
+        self.output_console = self._new_console()
+        self.output_tabs.addTab(self.output_console, "Console")
+        right_splitter.addWidget(self.output_tabs)
         
         splitter.addWidget(right_splitter)
 
@@ -229,93 +398,184 @@ class ScriptLibrary(QMainWindow):
         self.load_data()
 
         # --- LIVE UPDATE WATCHER ---
+        self.reload_retries = 0
+        self.reload_timer = QTimer(self)
+        self.reload_timer.setSingleShot(True)
+        self.reload_timer.setInterval(self.RELOAD_DEBOUNCE_MS)
+        self.reload_timer.timeout.connect(self.reload_external_changes)
+
+        os.makedirs(self.store.root, exist_ok=True)
         self.watcher = QFileSystemWatcher(self)
-        if os.path.exists(self.save_file):
-            self.watcher.addPath(os.path.abspath(self.save_file))
-        self.watcher.fileChanged.connect(self.reload_external_changes)
+        self.watch_store()
+        self.watcher.fileChanged.connect(self.schedule_reload)
+        self.watcher.directoryChanged.connect(self.schedule_reload) # Catches the manifest being replaced
+
+        # Start the warm Python workers once the window is up
+        QTimer.singleShot(0, get_python_pool)
 
-    def reload_external_changes(self, path):
-        """Called when genesis_scripts.json is modified externally (e.g. by AI)."""
+    def schedule_reload(self, path=None):
+        """Watcher events come in bursts (temp file, rename, manifest); coalesce them."""
+        self.reload_retries = 0
+        self.reload_timer.start()
+
+    def reload_external_changes(self):
+        """Applies external changes to the script manifest (e.g. by AI), one script at a time."""
         # We need to reload, but assume the User might be typing. 
-        # Strategy: Reload list. If current script was modified externally, warn or update.
-        print(f"File changed: {path} - Reloading...")
+        # Strategy: diff per-script hashes; only added/removed/modified scripts touch the lists.
         
-        # 1. Read Change
-        new_data = {}
-        try:
-            with open(self.save_file, 'r') as f:
-                new_data = json.load(f)
-        except: return # File might be being written to, ignore partial
+        # 1. Read Change (a half-written manifest is retried shortly instead of dropped)
+        new_data = self.store.reload()
+        if new_data is None:
+            if self.reload_retries < self.RELOAD_MAX_RETRIES:
+                self.reload_retries += 1
+                self.reload_timer.start()
+            return
 
         # 2. Check diff
-        # Simple approach: Just update the list items for now
-        current_names = set(self.scripts_data.keys())
-        new_names = set(new_data.keys())
-        
-        # If new scripts appeared (AI created one)
-        if new_names != current_names:
-            # Refresh Lists
-            self.refresh_lists()
-            
-            # Try to restore selection
-            if self.current_script and self.current_script in self.scripts_data:
-                # Determine which list
-                target_list = self.list_auto if self.current_script.startswith("auto_") or self.current_script.startswith("genesis_") else self.list_user
-                items = target_list.findItems(self.current_script, Qt.MatchFlag.MatchExactly)
-                if items:
-                    target_list.setCurrentItem(items[0])
-
-            
-            # Re-add path to watcher (sometimes editors delete/recreate file breaking watch)
-            if os.path.exists(self.save_file):
-                self.watcher.addPath(os.path.abspath(self.save_file))
+        added, removed, modified = self.store.diff(self.scripts_data, new_data)
+        if added or removed or modified:
+            print(f"Scripts changed on disk: +{len(added)} -{len(removed)} ~{len(modified)}")
+
+        # New scripts appeared (AI created one)
+        for name in added:
+            self.scripts_data[name] = dict(new_data[name])
+            self.add_to_lists(name)
+        for name in removed:
+            if name != self.current_script: # Keep what the user is editing
+                del self.scripts_data[name]
+                self.remove_from_lists(name)
+        for name in modified:
+            self.apply_external_edit(name, new_data[name])
+
+        # Re-rank if a search is active
+        if (added or removed or modified) and self.txt_search.text().strip():
+            self.apply_search()
+
+        # Re-add paths to watcher (atomic replaces and editors recreating the file break the watch)
+        self.watch_store()
+
+    def apply_external_edit(self, name, meta):
+        data = self.scripts_data[name]
+        if name == self.current_script and self.editor.toPlainText() != data.get("content", self.editor.toPlainText()):
+            print(f"'{name}' changed on disk; keeping your unsaved edits.")
+            return
+        data.clear()
+        data.update(meta) # Content is re-read lazily
+        self.search_index.add(name)
+        if name == self.current_script:
+            # Reload the open script in place, keeping the cursor roughly where it was
+            position = self.editor.textCursor().position()
+            self.combo_lang.blockSignals(True)
+            idx = self.combo_lang.findText(meta.get("language", "Plain Text"))
+            self.combo_lang.setCurrentIndex(max(idx, 0))
+            self.combo_lang.blockSignals(False)
+            self.apply_highlighting(self.combo_lang.currentText(), rehighlight=False)
+            self.editor.setPlainText(self.get_content(name)) # Highlighted once, with the right rules
+            cursor = self.editor.textCursor()
+            cursor.setPosition(min(position, len(self.editor.toPlainText())))
+            self.editor.setTextCursor(cursor)
+
+    def watch_store(self):
+        paths = [os.path.abspath(self.store.root)]
+        if os.path.exists(self.save_file):
+            paths.append(os.path.abspath(self.save_file))
+        missing = [p for p in paths if p not in self.watcher.files() and p not in self.watcher.directories()]
+        if missing:
+            self.watcher.addPaths(missing)
 
     # --- LOGIC ---
     def load_data(self):
-        """Loads scripts from JSON."""
-        if os.path.exists(self.save_file):
-            try:
-                with open(self.save_file, 'r') as f:
-                    self.scripts_data = json.load(f)
-            except:
-                self.scripts_data = {}
-        
-        # Migration: Check raw content vs dict content
-        for name, data in self.scripts_data.items():
-            if isinstance(data, str):
-                # Migrate to object
-                self.scripts_data[name] = {
-                    "content": data,
-                    "language": "Plain Text" # Default
-                }
-
+        """Loads the script manifest. Contents are read when a script is selected."""
+        manifest = self.store.load()
+        self.scripts_data = {name: dict(meta) for name, meta in manifest.items()}
         self.refresh_lists()
-        
-    def refresh_lists(self):
-        """Sorts scripts into tabs."""
-        self.list_user.clear()
-        self.list_auto.clear()
-        
-        for name in sorted(self.scripts_data.keys()):
-            # Filter logic
-            search_text = self.txt_search.text().lower()
-            if search_text and search_text not in name.lower():
-                continue
 
-            if name.startswith("auto_") or name.startswith("genesis_"):
-                self.list_auto.addItem(name)
-            else:
-                self.list_user.addItem(name)
-
-    def filter_scripts(self):
-        self.refresh_lists()
+    def get_content(self, name):
+        """Returns a script's content, reading its file on first access."""
+        data = self.scripts_data.get(name)
+        if data is None:
+            return ""
+        if "content" not in data:
+            data["content"] = self.store.read(name)
+        return data["content"]
+        
+    def _index_content(self, name):
+        """Search index loader: edited content if loaded, else the file (not cached)."""
+        data = self.scripts_data.get(name, {})
+        if "content" in data:
+            return data["content"]
+        return self.store.read(name)
+
+    def _new_script_list(self, grouped=False):
+        view = QListView()
+        view.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        view.setUniformItemSizes(True) # Lets the view skip measuring every row
+        model = ScriptListModel(grouped=grouped, parent=view)
+        view.setModel(model)
+        view.clicked.connect(model.toggle_group)
+        view.selectionModel().currentChanged.connect(self.load_selected_script)
+        return view
+
+    def list_for(self, name):
+        """Auto-generated scripts go to the Genesis Learning tab."""
+        return self.list_auto if name.startswith("auto_") or name.startswith("genesis_") else self.list_user
+
+    def add_to_lists(self, name, content=None):
+        self.list_for(name).model().add(name)
+        self.search_index.add(name, content)
+
+    def remove_from_lists(self, name):
+        self.list_for(name).model().remove(name)
+        self.search_index.remove(name)
+
+    def select_script(self, name):
+        view = self.list_for(name)
+        index = view.model().index_of(name)
+        if index.isValid():
+            view.setCurrentIndex(index)
+            view.scrollTo(index)
 
+    def refresh_lists(self):
+        """Rebuilds both tabs and the search index from scripts_data."""
+        self.search_index.clear()
+        user_names, auto_names = [], []
+        for name, data in self.scripts_data.items():
+            (auto_names if self.list_for(name) is self.list_auto else user_names).append(name)
+            self.search_index.add(name, data.get("content"))
+        self.list_user.model().set_names(user_names)
+        self.list_auto.model().set_names(auto_names)
+        self.apply_search()
 
-    def save_data(self):
-        """Writes data to JSON."""
+    def filter_scripts(self):
+        self.search_timer.start()
+
+    def apply_search(self):
+        """Ranks scripts by the search box text; an empty box shows everything."""
+        self.search_timer.stop()
+        query = self.txt_search.text().strip()
+        ranking = dict(self.search_index.search(query)) if query else None
+        for view in (self.list_user, self.list_auto):
+            view.model().set_ranking(ranking)
+        if query and self.search_index.pending:
+            self.index_timer.start() # Name matches for now; re-ranked once contents are in
+
+    def index_search_batch(self):
+        if self.search_index.index_pending(ScriptSearchIndex.PENDING_BATCH):
+            return
+        self.index_timer.stop()
+        if self.txt_search.text().strip():
+            self.apply_search()
+
+
+    def save_data(self, name):
+        """Writes one script's file (and the manifest)."""
+        data = self.scripts_data.get(name)
+        if data is None: return
         try:
-            with open(self.save_file, 'w') as f:
-                json.dump(self.scripts_data, f, indent=4)
+            content = self.get_content(name)
+            if self.store.save(name, content, data.get("language", "Plain Text")):
+                self.search_index.add(name, content)
+            data.update(self.store.meta(name))
         except Exception as e:
             print(f"Save error: {e}")
 
@@ -335,19 +595,18 @@ class ScriptLibrary(QMainWindow):
                 "content": "",
                 "language": "Python" # Default for new
             }
-            # New human scripts go to User tab
-            self.list_user.addItem(name)
-            self.list_user.setCurrentRow(self.list_user.count() - 1)
-            self.tabs.setCurrentIndex(0) # Switch to User tab
-            self.save_data()
+            self.add_to_lists(name, "")
+            self.tabs.setCurrentWidget(self.list_for(name))
+            self.select_script(name)
+            self.save_data(name)
 
 
     def load_selected_script(self, current, previous):
         """Called when user clicks a list item."""
         
-        # 1. Save previous
-        if previous:
-            prev_name = previous.text()
+        # 1. Save previous (whatever is in the editor; it may be in the other tab or filtered out)
+        if self.current_script:
+            prev_name = self.current_script
             if prev_name in self.scripts_data:
                 # Update content from editor
                 self.scripts_data[prev_name]["content"] = self.editor.toPlainText()
@@ -356,29 +615,27 @@ class ScriptLibrary(QMainWindow):
                 # Actually, better to just sync everything here to be safe.
                 self.scripts_data[prev_name]["language"] = self.combo_lang.currentText()
 
+        name = current.data(ScriptListModel.NameRole)
+        if not name:
+            return # Group header, or search filtered the selection out: keep editing
+
         # 2. Block Signals (Prevent loop when setting combo)
         self.combo_lang.blockSignals(True)
 
-        if current:
-            self.current_script = current.text()
-            data = self.scripts_data.get(self.current_script, {"content": "", "language": "Plain Text"})
-            
-            self.editor.setPlainText(data.get("content", ""))
-            
-            lang = data.get("language", "Plain Text")
-            idx = self.combo_lang.findText(lang)
-            if idx >= 0:
-                self.combo_lang.setCurrentIndex(idx)
-            else:
-                self.combo_lang.setCurrentIndex(0)
-
-            # Apply Highlighting logic
-            self.apply_highlighting(lang)
+        self.current_script = name
+        data = self.scripts_data.get(self.current_script, {"content": "", "language": "Plain Text"})
+        
+        lang = data.get("language", "Plain Text")
+        idx = self.combo_lang.findText(lang)
+        if idx >= 0:
+            self.combo_lang.setCurrentIndex(idx)
         else:
-            self.current_script = None
-            self.editor.clear()
             self.combo_lang.setCurrentIndex(0)
-            self.apply_highlighting("Plain Text")
+
+        # Apply Highlighting logic (before loading, so the text is highlighted once)
+        self.apply_highlighting(lang, rehighlight=False)
+        
+        self.editor.setPlainText(self.get_content(self.current_script))
 
         self.combo_lang.blockSignals(False)
 
@@ -392,14 +649,14 @@ class ScriptLibrary(QMainWindow):
         
         self.apply_highlighting(new_lang)
 
-    def apply_highlighting(self, language):
-        self.highlighter.set_language(language)
+    def apply_highlighting(self, language, rehighlight=True):
+        self.highlighter.set_language(language, rehighlight)
 
     def save_current_script(self):
         if self.current_script:
             self.scripts_data[self.current_script]["content"] = self.editor.toPlainText()
             self.scripts_data[self.current_script]["language"] = self.combo_lang.currentText()
-            self.save_data()
+            self.save_data(self.current_script)
 
     def delete_script(self):
         if not self.current_script: return
@@ -407,11 +664,12 @@ class ScriptLibrary(QMainWindow):
         confirm = QMessageBox.question(self, "Delete", f"Delete '{self.current_script}'?", 
                                        QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
         if confirm == QMessageBox.StandardButton.Yes:
-            del self.scripts_data[self.current_script]
-            self.save_data()
-            self.load_data() 
-            self.editor.clear()
+            name = self.current_script
+            self.store.delete(name)
+            del self.scripts_data[name]
             self.current_script = None # Reset
+            self.editor.clear()
+            self.remove_from_lists(name) # Selection may move on to a neighbouring script
 
     def copy_to_clipboard(self):
         cb = QApplication.clipboard()
@@ -440,97 +698,91 @@ class ScriptLibrary(QMainWindow):
         except ImportError as e:
             QMessageBox.warning(self, "Error", f"Could not import 'src.ai.assistant'.\n{e}")
 
+    def _new_console(self):
+        # Bounded, batched console; full output spills to a temp file
+        console = OutputConsole(max_blocks=5000, spill=True)
+        console.setPlaceholderText("Console Output...")
+        console.setStyleSheet("font-family: 'Consolas', monospace; font-size: 12px; background-color: #0a0a0a; color: #cccccc;")
+        return console
+
     def run_script(self):
+        """Starts the current script in its own output tab without blocking the UI."""
         if not self.current_script: return
         
         content = self.editor.toPlainText()
         if not content.strip(): return
         
         lang = self.combo_lang.currentText()
-        
-        self.output_console.clear()
-        self.output_console.appendHtml(f"<b>Running ({lang})...</b><br>")
-        
-        import tempfile
-        import subprocess
-        
-        try:
-            creationflags = 0x08000000 if os.name == 'nt' else 0
-            
-            if lang == "Python":
-                fd, path = tempfile.mkstemp(suffix=".py", text=True)
-                with os.fdopen(fd, 'w') as tmp:
-                    tmp.write(content)
-                
-                cmd = [sys.executable, path]
-                self._execute_process(cmd, path) # Refactored common exec
-                
-            elif lang == "Java":
-                # Java needs a class file. We need to find class name or force Main.
-                # Regex to find 'public class X'
-                match = QRegularExpression(r"public\s+class\s+(\w+)").match(content)
-                class_name = match.captured(1) if match.hasMatch() else "Main"
-                
-                # Make a temp dir
-                temp_dir = tempfile.mkdtemp()
-                java_file = os.path.join(temp_dir, f"{class_name}.java")
-                
-                with open(java_file, 'w') as f:
-                    f.write(content)
-                    
-                # Compile
-                self.output_console.appendHtml("<i>Compiling...</i>")
-                compile_proc = subprocess.run(
-                    ["javac", java_file], 
-                    capture_output=True, text=True, creationflags=creationflags
-                )
-                
-                if compile_proc.returncode != 0:
-                    self.output_console.appendHtml(f"<span style='color: #ff5555'>Compilation Failed:</span>")
-                    self.output_console.appendPlainText(compile_proc.stderr)
-                    shutil.rmtree(temp_dir)
-                    return
-                
-                # Run
-                cmd = ["java", "-cp", temp_dir, class_name]
-                self._execute_process(cmd, temp_dir, is_dir=True)
-                
-            else:
-                self.output_console.appendPlainText("Language not supported for execution.")
-
-        except Exception as e:
-            self.output_console.appendHtml(f"<b style='color: #ff5555'>Execution Error (System): {e}</b>")
 
-    def _execute_process(self, cmd, resource_path, is_dir=False):
-        import subprocess
-        creationflags = 0x08000000 if os.name == 'nt' else 0
-        
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            creationflags=creationflags
-        )
-        
-        stdout, stderr = process.communicate()
-        
-        if stdout:
-            self.output_console.appendPlainText(stdout)
-        if stderr:
-             self.output_console.appendHtml(f"<span style='color: #ff5555'>{stderr}</span>")
-        
-        if process.returncode == 0:
-             self.output_console.appendHtml("<br><b style='color: #2da44e'>Finished Successfully</b>")
-        else:
-             self.output_console.appendHtml(f"<br><b style='color: #ff5555'>Finished with Exit Code {process.returncode}</b>")
-             
-        # Cleanup
-        if not is_dir and os.path.exists(resource_path):
-            os.remove(resource_path)
-        elif is_dir and os.path.exists(resource_path):
-            import shutil
-            shutil.rmtree(resource_path)
+        # Reuse the idle placeholder tab for the first run
+        console = self.output_console
+        if console in self.runs or console.toPlainText():
+            console = self._new_console()
+            self.output_tabs.addTab(console, "")
+        self.run_counter += 1
+        self.output_tabs.setTabText(self.output_tabs.indexOf(console), f"{self.current_script} #{self.run_counter}")
+        self.output_tabs.setCurrentWidget(console)
+        self.output_console = console
+
+        console.clear()
+        console.appendHtml(f"<b>Running ({lang})...</b><br>")
+
+        run = ScriptRun(lang, content, timeout=self.spin_timeout.value(),
+                        warm_jvm=self.check_warm_jvm.isChecked(), parent=self)
+        run.output.connect(console.write)
+        run.error.connect(lambda text: console.write(text, error=True))
+        run.status.connect(lambda text: console.appendHtml(f"<i>{text}</i>"))
+        run.finished.connect(lambda code, outcome: self.on_run_finished(console, code, outcome))
+        self.runs[console] = run
+        run.start()
+        self.update_run_buttons()
+
+    def on_run_finished(self, console, exit_code, outcome):
+        run = self.runs.pop(console, None)
+        if run:
+            run.deleteLater()
+        if outcome == "ok":
+             console.appendHtml("<br><b style='color: #2da44e'>Finished Successfully</b>")
+        elif outcome == "compile_failed":
+             console.appendHtml("<span style='color: #ff5555'>Compilation Failed</span>")
+        elif outcome == "timeout":
+             console.appendHtml(f"<br><b style='color: #ff5555'>Timed out after {run.timeout}s</b>")
+        elif outcome == "stopped":
+             console.appendHtml("<br><b style='color: #ff5555'>Stopped by user</b>")
+        elif outcome == "failed":
+             console.appendHtml(f"<br><b style='color: #ff5555'>Finished with Exit Code {exit_code}</b>")
+        self.update_run_buttons()
+
+    def stop_script(self):
+        run = self.runs.get(self.output_tabs.currentWidget())
+        if run:
+            run.stop()
+
+    def update_run_buttons(self, *args):
+        self.btn_stop.setEnabled(self.output_tabs.currentWidget() in self.runs)
+
+    def close_output_tab(self, index):
+        console = self.output_tabs.widget(index)
+        run = self.runs.pop(console, None)
+        if run:
+            run.finished.disconnect()
+            run.finished.connect(run.deleteLater) # Let it clean up its temp files first
+            run.stop()
+        self.output_tabs.removeTab(index)
+        if self.output_tabs.count() == 0:
+            self.output_tabs.addTab(self._new_console(), "Console")
+        if console is self.output_console:
+            self.output_console = self.output_tabs.currentWidget()
+        console.discard_spill()
+        console.deleteLater()
+        self.update_run_buttons()
+
+    def closeEvent(self, event):
+        for run in list(self.runs.values()):
+            run.stop()
+        for i in range(self.output_tabs.count()):
+            self.output_tabs.widget(i).discard_spill()
+        super().closeEvent(event)
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
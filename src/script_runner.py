@@ -0,0 +1,625 @@
+import os
+import sys
+import shutil
+import codecs
+import hashlib
+import tempfile
+from PyQt6.QtCore import QObject, QProcess, QTimer, QRegularExpression, QCoreApplication, pyqtSignal
+
+# --- JAVA BUILD CACHE ---
+class JavaBuildCache:
+    """Compiled .class outputs keyed by a hash of class name + source.
+
+    A run whose source is unchanged skips javac entirely. Builds compile into a
+    staging dir that is only promoted into the cache when javac succeeds.
+    """
+    MAX_ENTRIES = 32
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.path.join(tempfile.gettempdir(), "genesis_java_cache")
+
+    @staticmethod
+    def key(class_name, source):
+        return hashlib.sha1(f"{class_name}\n{source}".encode("utf-8")).hexdigest()[:16]
+
+    def lookup(self, class_name, source):
+        """Returns the class dir of a previous successful build, or None."""
+        path = os.path.join(self.cache_dir, self.key(class_name, source))
+        if os.path.exists(os.path.join(path, f"{class_name}.class")):
+            try:
+                os.utime(path) # LRU by mtime
+            except OSError:
+                pass
+            return path
+        return None
+
+    def stage(self, class_name, source):
+        """Writes the source into a fresh staging dir. Returns (staging_dir, java_file)."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        staging = tempfile.mkdtemp(prefix="build_", dir=self.cache_dir)
+        java_file = os.path.join(staging, f"{class_name}.java")
+        with open(java_file, 'w') as f:
+            f.write(source)
+        return staging, java_file
+
+    def commit(self, class_name, source, staging):
+        """Promotes a successful staging build into the cache and returns its final dir."""
+        path = os.path.join(self.cache_dir, self.key(class_name, source))
+        try:
+            os.replace(staging, path)
+        except OSError:
+            # Another run cached the same source first
+            shutil.rmtree(staging, ignore_errors=True)
+        self.prune()
+        return path
+
+    def prune(self):
+        try:
+            entries = [os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)
+                       if not name.startswith("build_")]
+        except OSError:
+            return
+        entries.sort(key=lambda p: os.path.getmtime(p), reverse=True)
+        for path in entries[self.MAX_ENTRIES:]:
+            shutil.rmtree(path, ignore_errors=True)
+
+_build_cache = JavaBuildCache()
+
+# --- WARM JVM ---
+RUNNER_CLASS = "GenesisRunner"
+RUNNER_SOURCE = r'''
+import java.io.*;
+import java.lang.reflect.*;
+import java.net.*;
+
+public class GenesisRunner {
+    // Reads "token<TAB>classDir<TAB>className" lines and runs each class's main in a fresh class loader.
+    public static void main(String[] args) throws Exception {
+        BufferedReader in = new BufferedReader(new InputStreamReader(System.in, "UTF-8"));
+        PrintStream out = System.out;
+        PrintStream err = System.err;
+        String line;
+        while ((line = in.readLine()) != null) {
+            String[] parts = line.split("\t", 3);
+            if (parts.length < 3) continue;
+            int code = 0;
+            System.setIn(new ByteArrayInputStream(new byte[0]));
+            URL[] path = new URL[] { new File(parts[1]).toURI().toURL() };
+            try (URLClassLoader loader = new URLClassLoader(path, GenesisRunner.class.getClassLoader().getParent())) {
+                Class<?> cls = Class.forName(parts[2], true, loader);
+                cls.getMethod("main", String[].class).invoke(null, (Object) new String[0]);
+            } catch (InvocationTargetException e) {
+                e.getCause().printStackTrace();
+                code = 1;
+            } catch (Throwable e) {
+                e.printStackTrace();
+                code = 1;
+            }
+            System.setOut(out);
+            System.setErr(err);
+            err.println("\u0000GENESIS_END " + parts[0]);
+            err.flush();
+            out.println("\u0000GENESIS_END " + parts[0] + " " + code);
+            out.flush();
+        }
+    }
+}
+'''
+
+class WarmProcess(QObject):
+    """A long-lived interpreter process that runs one request at a time.
+
+    Each request is tagged with a token; the process ends a request by writing
+    a sentinel line with that token on stdout (with the exit code) and on
+    stderr, so output streams through untouched until both have arrived.
+    """
+    output = pyqtSignal(str)
+    error = pyqtSignal(str)
+    done = pyqtSignal(int) # exit code of the current request
+    exited = pyqtSignal()  # the process itself went away
+    SENTINEL = "\0GENESIS_END "
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.state = "cold" # cold | starting | idle | busy
+        self.process = None
+        self._token = None
+        self._counter = 0
+
+    # --- Lifecycle ---
+    def _launch(self, program, args):
+        self.state = "starting"
+        self.process = QProcess(self)
+        self.process.readyReadStandardOutput.connect(self._read_stdout)
+        self.process.readyReadStandardError.connect(self._read_stderr)
+        self.process.started.connect(self._on_started)
+        self.process.finished.connect(self._on_exit)
+        self.process.errorOccurred.connect(self._on_error)
+        self.process.start(program, args)
+
+    def _on_started(self):
+        self.state = "idle"
+
+    def _on_error(self, err):
+        if err == QProcess.ProcessError.FailedToStart:
+            self._reset()
+            self.exited.emit()
+
+    def _on_exit(self, exit_code, exit_status):
+        # Killed by stop(), a crash, or sys.exit()/System.exit() outside a request
+        busy = self.state == "busy"
+        self._flush_buffers()
+        self._reset()
+        if busy:
+            self.done.emit(exit_code if exit_status == QProcess.ExitStatus.NormalExit else -1)
+        self.exited.emit()
+
+    def _reset(self):
+        if self.process:
+            self.process.deleteLater()
+        self.process = None
+        self.state = "cold"
+        self._token = None
+
+    def stop(self):
+        if self.process:
+            self.process.kill()
+
+    # --- Requests ---
+    def _begin(self):
+        """Starts a request and returns its token, or None if the process isn't idle."""
+        if self.state != "idle":
+            return None
+        self._counter += 1
+        self._token = f"{os.getpid()}-{self._counter}"
+        self._out_buf = self._err_buf = ""
+        self._out_done = self._err_done = False
+        self._exit_code = 0
+        self._out_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._err_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.state = "busy"
+        return self._token
+
+    def _scan(self, buf, text, signal):
+        """Emits text up to this request's sentinel. Returns (remaining buffer, sentinel line or None)."""
+        buf += text
+        marker = buf.find(self.SENTINEL)
+        if marker < 0:
+            # Hold back a possible partial sentinel at the end
+            hold = buf.rfind("\0")
+            emit, buf = (buf, "") if hold < 0 else (buf[:hold], buf[hold:])
+            if emit:
+                signal.emit(emit)
+            return buf, None
+        end = buf.find("\n", marker)
+        if end < 0:
+            if buf[:marker]:
+                signal.emit(buf[:marker])
+            return buf[marker:], None
+        if buf[:marker]:
+            signal.emit(buf[:marker])
+        return "", buf[marker + len(self.SENTINEL):end].strip()
+
+    def _read_stdout(self):
+        if not self.process: return
+        data = bytes(self.process.readAllStandardOutput())
+        if self.state != "busy" or not data: return
+        self._out_buf, line = self._scan(self._out_buf, self._out_decoder.decode(data), self.output)
+        if line is not None:
+            parts = line.split(" ")
+            if parts[0] == self._token:
+                self._exit_code = int(parts[1]) if len(parts) > 1 and parts[1].lstrip("-").isdigit() else 1
+                self._out_done = True
+                self._check_done()
+
+    def _read_stderr(self):
+        if not self.process: return
+        data = bytes(self.process.readAllStandardError())
+        if self.state != "busy" or not data: return
+        self._err_buf, line = self._scan(self._err_buf, self._err_decoder.decode(data), self.error)
+        if line is not None and line.split(" ")[0] == self._token:
+            self._err_done = True
+            self._check_done()
+
+    def _check_done(self):
+        if self._out_done and self._err_done:
+            self.state = "idle"
+            self._token = None
+            self.done.emit(self._exit_code)
+
+    def _flush_buffers(self):
+        if self.state == "busy":
+            if self._out_buf: self.output.emit(self._out_buf)
+            if self._err_buf: self.error.emit(self._err_buf)
+            self._out_buf = self._err_buf = ""
+
+class JvmRunner(WarmProcess):
+    """Long-lived JVM that loads and runs compiled classes, one at a time.
+
+    The first request only starts the warm-up (compiling the runner if needed
+    and launching the JVM); until it is idle, runs fall back to a cold `java`.
+    Stopping a run kills the JVM; it is restarted on the next request.
+    """
+    def __init__(self, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or _build_cache
+
+    def warm_up(self):
+        if self.state != "cold":
+            return
+        self.state = "starting"
+        class_dir = self.cache.lookup(RUNNER_CLASS, RUNNER_SOURCE)
+        if class_dir:
+            self._launch("java", ["-cp", class_dir, RUNNER_CLASS])
+            return
+        try:
+            staging, java_file = self.cache.stage(RUNNER_CLASS, RUNNER_SOURCE)
+        except OSError:
+            self.state = "cold"
+            return
+        javac = QProcess(self)
+        javac.finished.connect(lambda code, status: self._on_runner_built(javac, staging, code))
+        javac.errorOccurred.connect(lambda err: self._on_runner_build_error(javac, staging, err))
+        javac.start("javac", ["-d", staging, java_file])
+
+    def _on_runner_built(self, javac, staging, exit_code):
+        javac.deleteLater()
+        if exit_code != 0:
+            shutil.rmtree(staging, ignore_errors=True)
+            self.state = "cold"
+            return
+        class_dir = self.cache.commit(RUNNER_CLASS, RUNNER_SOURCE, staging)
+        self._launch("java", ["-cp", class_dir, RUNNER_CLASS])
+
+    def _on_runner_build_error(self, javac, staging, err):
+        if err == QProcess.ProcessError.FailedToStart:
+            javac.deleteLater()
+            shutil.rmtree(staging, ignore_errors=True)
+            self.state = "cold"
+
+    def run(self, class_dir, class_name):
+        """Starts a class's main in the warm JVM. Returns False if the JVM isn't idle."""
+        token = self._begin()
+        if token is None:
+            return False
+        self.process.write(f"{token}\t{class_dir}\t{class_name}\n".encode("utf-8"))
+        return True
+
+_jvm_runner = None
+
+def get_jvm_runner():
+    """Returns the shared warm JVM (created on first use; lives on the UI thread)."""
+    global _jvm_runner
+    if _jvm_runner is None:
+        _jvm_runner = JvmRunner(parent=QCoreApplication.instance()) # Killed with the app
+    return _jvm_runner
+
+# --- WARM PYTHON ---
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "script_worker.py")
+
+class PythonWorker(WarmProcess):
+    """Pre-started interpreter (script_worker.py) that executes sources sent over stdin."""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.runs = 0
+        self.completed = 0
+        self.done.connect(self._count_completed)
+
+    def _count_completed(self, exit_code):
+        self.completed += 1
+
+    def start(self):
+        self._launch(sys.executable, ["-u", WORKER_SCRIPT])
+
+    def run(self, source):
+        token = self._begin()
+        if token is None:
+            return False
+        self.runs += 1
+        payload = source.encode("utf-8")
+        self.process.write(f"{token} {len(payload)}\n".encode("ascii") + payload)
+        return True
+
+class PythonWorkerPool(QObject):
+    """Keeps `size` warm Python workers. Each is replaced after max_runs runs or when it dies.
+
+    A worker that dies before completing a run counts as a startup failure:
+    replacements are then delayed with exponential backoff, and after
+    MAX_START_FAILURES in a row the pool stops respawning (runs fall back to
+    a cold interpreter) and emits gave_up.
+    """
+    gave_up = pyqtSignal()
+    MAX_START_FAILURES = 5
+    BACKOFF_MS = 500 # doubled per consecutive failure
+
+    def __init__(self, size=2, max_runs=20, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.max_runs = max_runs
+        self.workers = []
+        self.start_failures = 0
+        self._closed = False
+        self._respawn_timer = QTimer(self)
+        self._respawn_timer.setSingleShot(True)
+        self._respawn_timer.timeout.connect(self._respawn)
+        for _ in range(size):
+            self._spawn()
+
+    def _spawn(self):
+        worker = PythonWorker(self)
+        worker.done.connect(lambda code, w=worker: self._on_done(w))
+        worker.exited.connect(lambda w=worker: self._on_exited(w))
+        self.workers.append(worker)
+        worker.start()
+
+    def acquire(self):
+        """Returns an idle worker, or None if all are busy or still starting."""
+        for worker in self.workers:
+            if worker.state == "idle":
+                return worker
+        return None
+
+    def _on_done(self, worker):
+        if worker.runs >= self.max_runs and worker.state == "idle":
+            worker.stop() # Recycled: _on_exited spawns the replacement
+
+    def _on_exited(self, worker):
+        if worker not in self.workers:
+            return
+        self.workers.remove(worker)
+        worker.deleteLater()
+        if worker.runs == 0 and worker.completed == 0:
+            self.start_failures += 1
+        else:
+            self.start_failures = 0
+        if self.start_failures >= self.MAX_START_FAILURES:
+            self._respawn_timer.stop()
+            if not self.workers:
+                print(f"Warm Python workers keep failing to start; giving up after {self.start_failures} attempts.")
+                self.gave_up.emit()
+            return
+        if self.start_failures:
+            self._respawn_timer.start(self.BACKOFF_MS * 2 ** (self.start_failures - 1))
+        else:
+            self._spawn()
+
+    def _respawn(self):
+        while not self._closed and len(self.workers) < self.size:
+            self._spawn()
+
+    def respawn_pending(self):
+        """True while a backed-off replacement is waiting to start."""
+        return self._respawn_timer.isActive()
+
+    def shutdown(self):
+        self._closed = True
+        self._respawn_timer.stop()
+        for worker in self.workers:
+            worker.exited.disconnect()
+            worker.stop()
+        self.workers = []
+
+_python_pool = None
+
+def get_python_pool():
+    """Returns the shared warm Python pool, or None where sys.executable isn't a Python (frozen builds)."""
+    global _python_pool
+    if getattr(sys, "frozen", False) or not os.path.exists(WORKER_SCRIPT):
+        return None
+    if _python_pool is None:
+        _python_pool = PythonWorkerPool(parent=QCoreApplication.instance())
+    return _python_pool
+
+# --- SCRIPT RUN ---
+class ScriptRun(QObject):
+    """One non-blocking execution of a library script.
+
+    Runs an optional build step (javac, skipped when the build cache has the
+    source) and then the program, streaming stdout/stderr through signals as
+    it arrives. The whole run is bounded by an optional timeout and can be
+    stopped at any time. Python runs use a warm worker from the pool when one
+    is idle; with warm_jvm, Java runs reuse a long-lived JVM.
+    """
+    output = pyqtSignal(str)  # stdout chunk
+    error = pyqtSignal(str)   # stderr chunk
+    status = pyqtSignal(str)  # progress notes ("Compiling...")
+    finished = pyqtSignal(int, str) # exit code, outcome: ok | failed | compile_failed | timeout | stopped | error
+
+    def __init__(self, language, content, timeout=0, warm_jvm=False, warm_python=True, parent=None):
+        super().__init__(parent)
+        self.language = language
+        self.content = content
+        self.timeout = timeout # seconds, 0 = no limit
+        self.warm_jvm = warm_jvm
+        self.warm_python = warm_python
+        self.process = None
+        self.temp_path = None
+        self.class_name = None
+        self.class_dir = None
+        self._steps = []
+        self._warm = None
+        self._outcome = None
+        self._done = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    # --- Setup ---
+    def _prepare(self):
+        """Writes the source to disk and returns the list of step names."""
+        if self.language == "Python":
+            return ["python"]
+
+        if self.language == "Java":
+            # Java needs a class file. We need to find class name or force Main.
+            match = QRegularExpression(r"public\s+class\s+(\w+)").match(self.content)
+            self.class_name = match.captured(1) if match.hasMatch() else "Main"
+            self.class_dir = _build_cache.lookup(self.class_name, self.content)
+            if self.class_dir:
+                return ["java"]
+            self.temp_path, self._java_file = _build_cache.stage(self.class_name, self.content)
+            return ["javac", "java"]
+
+        return None
+
+    # --- Control ---
+    def start(self):
+        try:
+            steps = self._prepare()
+        except OSError as e:
+            self.error.emit(f"Execution Error (System): {e}")
+            self._finish(-1, "error")
+            return
+        if steps is None:
+            self.status.emit("Language not supported for execution.")
+            self._finish(-1, "error")
+            return
+        self._steps = steps
+        if self.timeout:
+            self._timer.start(int(self.timeout * 1000))
+        self._next_step()
+
+    def stop(self):
+        if self.is_running():
+            self._outcome = "stopped"
+            self._kill()
+
+    def is_running(self):
+        if self._warm:
+            return True
+        return self.process is not None and self.process.state() != QProcess.ProcessState.NotRunning
+
+    def _kill(self):
+        if self._warm:
+            self._warm.stop()
+        elif self.process:
+            self.process.kill()
+
+    # --- Steps ---
+    def _next_step(self):
+        step = self._steps.pop(0)
+        self._label = step
+        if step == "python":
+            if self.warm_python and self._start_python_warm():
+                return
+            try:
+                fd, self.temp_path = tempfile.mkstemp(suffix=".py", text=True)
+                with os.fdopen(fd, 'w') as tmp:
+                    tmp.write(self.content)
+            except OSError as e:
+                self.error.emit(f"Execution Error (System): {e}")
+                self._finish(-1, "error")
+                return
+            self._start_process(sys.executable, ["-u", self.temp_path])
+        elif step == "javac":
+            self.status.emit("Compiling...")
+            self._start_process("javac", ["-d", self.temp_path, self._java_file])
+        elif step == "java":
+            if self.warm_jvm and self._start_jvm_warm():
+                return
+            self._start_process("java", ["-cp", self.class_dir, self.class_name])
+
+    # --- Warm processes ---
+    def _start_python_warm(self):
+        pool = get_python_pool()
+        worker = pool.acquire() if pool else None
+        if worker is None or not worker.run(self.content):
+            return False
+        self._attach(worker)
+        return True
+
+    def _start_jvm_warm(self):
+        jvm = get_jvm_runner()
+        if jvm.state == "cold":
+            jvm.warm_up() # Ready for the next run; this one goes cold
+        if not jvm.run(self.class_dir, self.class_name):
+            return False
+        self._attach(jvm)
+        return True
+
+    def _attach(self, warm):
+        self._warm = warm
+        warm.output.connect(self.output)
+        warm.error.connect(self.error)
+        warm.done.connect(self._on_warm_done)
+
+    def _on_warm_done(self, exit_code):
+        warm, self._warm = self._warm, None
+        warm.output.disconnect(self.output)
+        warm.error.disconnect(self.error)
+        warm.done.disconnect(self._on_warm_done)
+        if self._outcome:
+            self._finish(exit_code, self._outcome)
+        else:
+            self._finish(exit_code, "ok" if exit_code == 0 else "failed")
+
+    # --- Process handling ---
+    def _start_process(self, program, args):
+        self._out_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._err_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        self.process = QProcess(self)
+        self.process.readyReadStandardOutput.connect(self._read_stdout)
+        self.process.readyReadStandardError.connect(self._read_stderr)
+        self.process.finished.connect(self._on_process_finished)
+        self.process.errorOccurred.connect(self._on_process_error)
+        self.process.start(program, args)
+        self.process.closeWriteChannel() # No stdin: input() gets EOF, as in a warm worker
+
+    def _read_stdout(self):
+        text = self._out_decoder.decode(bytes(self.process.readAllStandardOutput()))
+        if text:
+            # Compiler chatter is reported as errors only if the build fails
+            (self.error if self._label == "javac" else self.output).emit(text)
+
+    def _read_stderr(self):
+        text = self._err_decoder.decode(bytes(self.process.readAllStandardError()))
+        if text:
+            self.error.emit(text)
+
+    def _on_process_error(self, err):
+        if err == QProcess.ProcessError.FailedToStart:
+            self.error.emit(f"Execution Error (System): could not start '{self.process.program()}'.")
+            self._finish(-1, "error")
+
+    def _on_process_finished(self, exit_code, exit_status):
+        self._read_stdout()
+        self._read_stderr()
+        if self._outcome: # stopped or timed out
+            self._finish(exit_code, self._outcome)
+        elif exit_status == QProcess.ExitStatus.CrashExit:
+            self._finish(exit_code or -1, "failed")
+        elif self._label == "javac" and exit_code != 0:
+            self._finish(exit_code, "compile_failed")
+        else:
+            if self._label == "javac":
+                self.class_dir = _build_cache.commit(self.class_name, self.content, self.temp_path)
+                self.temp_path = None
+            if self._steps:
+                self._next_step()
+            else:
+                self._finish(exit_code, "ok" if exit_code == 0 else "failed")
+
+    def _on_timeout(self):
+        if self.is_running():
+            self._outcome = "timeout"
+            self._kill()
+
+    def _finish(self, exit_code, outcome):
+        if self._done:
+            return
+        self._done = True
+        self._timer.stop()
+        self._cleanup()
+        self.finished.emit(exit_code, outcome)
+
+    def _cleanup(self):
+        if not self.temp_path or not os.path.exists(self.temp_path):
+            return
+        try:
+            if os.path.isdir(self.temp_path):
+                shutil.rmtree(self.temp_path)
+            else:
+                os.remove(self.temp_path)
+        except OSError:
+            pass # Still locked on Windows; the temp dir gets swept eventually
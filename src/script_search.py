@@ -0,0 +1,165 @@
+import re
+import math
+import bisect
+import itertools
+import threading
+from collections import Counter
+
+# --- SCRIPT SEARCH INDEX ---
+class ScriptSearchIndex:
+    """Inverted full-text index over script names and contents.
+
+    Identifiers are indexed whole and split into their snake_case/camelCase
+    parts, so "runScript" is found by "run", "script" and "runscript". Every
+    query term is matched as a prefix. Scripts can be added name-only; their
+    content is indexed later through `loader(name)`, a batch at a time by
+    index_pending(). Until then a search matches them by name only.
+    """
+    TOKEN_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*|\d+")
+    PART_RE = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|\d+")
+    NAME_WEIGHT = 10.0
+    EXACT_BONUS = 2.0
+    PENDING_BATCH = 200 # Scripts loaded per index_pending() step
+
+    def __init__(self, loader=None):
+        self.loader = loader
+        self.name_postings = {} # token -> {name: count}
+        self.body_postings = {}
+        self.doc_terms = {} # name -> (name Counter, body Counter), for removal
+        self.pending = set() # Names whose content is not indexed yet
+        self.vocab = [] # Sorted tokens, for prefix lookups
+        self._lock = threading.RLock()
+
+    @classmethod
+    def tokenize(cls, text):
+        tokens = []
+        for word in cls.TOKEN_RE.findall(text):
+            lower = word.lower()
+            tokens.append(lower)
+            parts = [p.lower() for p in cls.PART_RE.findall(word)]
+            if len(parts) > 1:
+                tokens.extend(parts)
+        return tokens
+
+    # --- Updates ---
+    def add(self, name, content=None):
+        """(Re)indexes one script. content=None defers the body to the first search."""
+        with self._lock:
+            self.remove(name)
+            name_terms = Counter(self.tokenize(name))
+            body_terms = Counter()
+            if content is None:
+                self.pending.add(name)
+            else:
+                body_terms = Counter(self.tokenize(content))
+            self._post(self.name_postings, name, name_terms)
+            self._post(self.body_postings, name, body_terms)
+            self.doc_terms[name] = (name_terms, body_terms)
+
+    def remove(self, name):
+        with self._lock:
+            self.pending.discard(name)
+            terms = self.doc_terms.pop(name, None)
+            if terms is None:
+                return
+            self._unpost(self.name_postings, name, terms[0])
+            self._unpost(self.body_postings, name, terms[1])
+
+    def clear(self):
+        with self._lock:
+            self.name_postings.clear()
+            self.body_postings.clear()
+            self.doc_terms.clear()
+            self.pending.clear()
+            self.vocab = []
+
+    def __contains__(self, name):
+        return name in self.doc_terms
+
+    def __len__(self):
+        return len(self.doc_terms)
+
+    def _post(self, postings, name, terms):
+        for token, count in terms.items():
+            docs = postings.get(token)
+            if docs is None:
+                docs = postings[token] = {}
+                if not self._known(token):
+                    bisect.insort(self.vocab, token)
+            docs[name] = count
+
+    def _unpost(self, postings, name, terms):
+        for token in terms:
+            docs = postings.get(token)
+            if docs is None:
+                continue
+            docs.pop(name, None)
+            if not docs:
+                del postings[token]
+                if token not in self.name_postings and token not in self.body_postings:
+                    i = bisect.bisect_left(self.vocab, token)
+                    if i < len(self.vocab) and self.vocab[i] == token:
+                        del self.vocab[i]
+
+    def _known(self, token):
+        i = bisect.bisect_left(self.vocab, token)
+        return i < len(self.vocab) and self.vocab[i] == token
+
+    def index_pending(self, limit=None):
+        """Indexes the content of up to `limit` pending scripts (all if None). Returns True if more remain."""
+        with self._lock:
+            if self.loader is None:
+                return False
+            batch = list(self.pending) if limit is None else list(itertools.islice(self.pending, limit))
+            for name in batch:
+                self.pending.discard(name)
+                name_terms = self.doc_terms[name][0]
+                try:
+                    content = self.loader(name)
+                except Exception as e:
+                    print(f"Search Index Error ({name}): {e}")
+                    content = ""
+                body_terms = Counter(self.tokenize(content))
+                self._post(self.body_postings, name, body_terms)
+                self.doc_terms[name] = (name_terms, body_terms)
+            return bool(self.pending)
+
+    # --- Queries ---
+    def _prefixed(self, prefix):
+        i = bisect.bisect_left(self.vocab, prefix)
+        while i < len(self.vocab) and self.vocab[i].startswith(prefix):
+            yield self.vocab[i]
+            i += 1
+
+    def search(self, query, limit=None):
+        """Returns [(name, score)] best first. Every query term must match (name or content).
+        Scripts whose content is still pending only match by name."""
+        with self._lock:
+            terms = [t.lower() for t in self.TOKEN_RE.findall(query)]
+            if not terms:
+                return []
+
+            scores = None
+            for term in terms:
+                term_scores = {}
+                for token in self._prefixed(term):
+                    bonus = self.EXACT_BONUS if token == term else 1.0
+                    for name, count in self.name_postings.get(token, {}).items():
+                        term_scores[name] = term_scores.get(name, 0.0) + self.NAME_WEIGHT * bonus
+                    for name, count in self.body_postings.get(token, {}).items():
+                        term_scores[name] = term_scores.get(name, 0.0) + (1.0 + math.log(count)) * bonus
+                if scores is None:
+                    scores = term_scores
+                else:
+                    scores = {name: score + term_scores[name] for name, score in scores.items() if name in term_scores}
+                if not scores:
+                    break
+
+            # Plain substring matches on the name still count (e.g. "abc" in "test_abc2")
+            needle = query.strip().lower()
+            for name in self.doc_terms:
+                if needle in name.lower():
+                    scores[name] = scores.get(name, 0.0) + self.NAME_WEIGHT
+
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+            return ranked[:limit] if limit else ranked
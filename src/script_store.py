@@ -0,0 +1,183 @@
+import os
+import json
+import hashlib
+import threading
+
+# --- SCRIPT STORE ---
+class ScriptStore:
+    """Script library on disk: a small manifest plus one file per script.
+
+    The manifest maps each name to its language, size, content hash and file;
+    content is read only when a script is opened. Saving a script rewrites
+    that script's file and the manifest, never the other scripts.
+    """
+    MANIFEST = "manifest.json"
+    EXTENSIONS = {"Python": ".py", "Java": ".java"}
+
+    def __init__(self, root=os.path.join("data", "scripts"), legacy_file=os.path.join("data", "genesis_scripts.json")):
+        self.root = root
+        self.files_dir = os.path.join(root, "files")
+        self.manifest_path = os.path.join(root, self.MANIFEST)
+        self.legacy_file = legacy_file
+        self.manifest = {}
+        self._lock = threading.RLock()
+        self.load()
+
+    @staticmethod
+    def content_hash(content):
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def file_name(cls, name, language):
+        """Names can hold any character, so files are named by a hash of the name."""
+        digest = hashlib.sha1(name.encode("utf-8")).hexdigest()[:16]
+        return digest + cls.EXTENSIONS.get(language, ".txt")
+
+    # --- Manifest ---
+    def load(self):
+        """(Re)reads the manifest, migrating the legacy single-JSON library on first run."""
+        with self._lock:
+            if not os.path.exists(self.manifest_path) and self.legacy_file and os.path.exists(self.legacy_file):
+                self._migrate_legacy()
+            self.manifest = self.read_manifest()
+            return self.manifest
+
+    def read_manifest(self):
+        """Returns the manifest as currently on disk ({} if missing, the last good one if unreadable)."""
+        manifest = self._read_manifest_file()
+        return dict(self.manifest) if manifest is None else manifest
+
+    def _read_manifest_file(self):
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Script Manifest Error: {e}")
+            return None
+        if not isinstance(manifest, dict):
+            print("Script Manifest Error: not a JSON object")
+            return None
+        return manifest
+
+    def reload(self):
+        """Re-reads the manifest after an external change.
+
+        Returns None (keeping the current manifest) if the file cannot be parsed,
+        e.g. because another writer is mid-way through a non-atomic write; the
+        caller should retry shortly.
+        """
+        with self._lock:
+            manifest = self._read_manifest_file()
+            if manifest is not None:
+                self.manifest = manifest
+            return manifest
+
+    @staticmethod
+    def diff(old, new):
+        """Compares two manifests by per-entry content hash. Returns (added, removed, modified) names."""
+        added = [name for name in new if name not in old]
+        removed = [name for name in old if name not in new]
+        modified = [name for name, meta in new.items()
+                    if name in old and (old[name].get("hash") != meta.get("hash")
+                                        or old[name].get("language") != meta.get("language"))]
+        return added, removed, modified
+
+    def _save_manifest(self):
+        os.makedirs(self.root, exist_ok=True)
+        self._atomic_write(self.manifest_path, json.dumps(self.manifest, indent=4))
+
+    @staticmethod
+    def _atomic_write(path, text):
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, path) # Readers never see a half-written file
+
+    def _migrate_legacy(self):
+        try:
+            with open(self.legacy_file, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Script Migration Error: {e}")
+            return
+        self.manifest = {}
+        for name, data in legacy.items():
+            if isinstance(data, str):
+                data = {"content": data, "language": "Plain Text"}
+            self._write_script(name, data.get("content", ""), data.get("language", "Plain Text"))
+        self._save_manifest()
+        os.replace(self.legacy_file, self.legacy_file + ".migrated")
+        print(f"Migrated {len(legacy)} scripts to {self.root}")
+
+    # --- Scripts ---
+    def names(self):
+        with self._lock:
+            return list(self.manifest)
+
+    def meta(self, name):
+        with self._lock:
+            return self.manifest.get(name)
+
+    def read(self, name):
+        """Loads a script's content from its file ('' if missing)."""
+        meta = self.meta(name)
+        if not meta:
+            return ""
+        try:
+            with open(os.path.join(self.files_dir, meta["file"]), "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError as e:
+            print(f"Script Read Error: {e}")
+            return ""
+
+    def _write_script(self, name, content, language):
+        file_name = self.file_name(name, language)
+        os.makedirs(self.files_dir, exist_ok=True)
+        self._atomic_write(os.path.join(self.files_dir, file_name), content)
+        old = self.manifest.get(name)
+        if old and old["file"] != file_name:
+            self._remove_file(old["file"]) # Language (extension) changed
+        self.manifest[name] = {
+            "language": language,
+            "size": len(content.encode("utf-8")),
+            "hash": self.content_hash(content),
+            "file": file_name
+        }
+
+    def save(self, name, content, language="Python"):
+        """Writes one script. Returns False if nothing changed."""
+        with self._lock:
+            old = self.manifest.get(name)
+            if old and old["language"] == language and old["hash"] == self.content_hash(content):
+                return False
+            self._write_script(name, content, language)
+            self._save_manifest()
+            return True
+
+    def delete(self, name):
+        with self._lock:
+            meta = self.manifest.pop(name, None)
+            if meta is None:
+                return False
+            self._remove_file(meta["file"])
+            self._save_manifest()
+            return True
+
+    def _remove_file(self, file_name):
+        try:
+            os.remove(os.path.join(self.files_dir, file_name))
+        except OSError:
+            pass
+
+_store = None
+_store_lock = threading.Lock()
+
+def get_script_store():
+    """Returns the process-wide script store (shared by the library window and the brain)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = ScriptStore()
+        return _store
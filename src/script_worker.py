@@ -0,0 +1,90 @@
+# Warm interpreter for ScriptLibrary Python runs (see PythonWorkerPool).
+# Protocol on stdin: "<token> <nbytes>\n" followed by nbytes of UTF-8 source.
+# The script's output goes straight to stdout/stderr; when it ends, a line
+# "\0GENESIS_END <token> <exit code>" is written to stdout and
+# "\0GENESIS_END <token>" to stderr. Standalone on purpose: no project imports.
+# Between runs the worker restores cwd, sys.path, sys.argv, os.environ and
+# sys.modules (modules a script imported are dropped). A script that leaves
+# threads running cannot be undone, so the worker exits after reporting its
+# result and the pool starts a fresh one.
+import io
+import os
+import sys
+import linecache
+import threading
+import traceback
+
+SENTINEL = "\0GENESIS_END "
+SCRIPT_NAME = "<script>"
+
+def _run(source):
+    """Executes source as __main__ in a fresh namespace. Returns the exit code."""
+    # Lets tracebacks show the script's source lines
+    linecache.cache[SCRIPT_NAME] = (len(source), None, source.splitlines(True), SCRIPT_NAME)
+    try:
+        code = compile(source, SCRIPT_NAME, "exec")
+    except SyntaxError:
+        traceback.print_exc(limit=0)
+        return 1
+    namespace = {"__name__": "__main__", "__file__": SCRIPT_NAME, "__builtins__": __builtins__}
+    try:
+        exec(code, namespace)
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        # Hide this module's frame from the traceback
+        etype, value, tb = sys.exc_info()
+        traceback.print_exception(etype, value, tb.tb_next)
+        return 1
+
+def main():
+    channel = sys.stdin.buffer
+    # The pool decodes both pipes as UTF-8 whatever the console code page is
+    sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+    sys.stderr.reconfigure(encoding="utf-8", errors="replace")
+    stdout, stderr = sys.stdout, sys.stderr
+    cwd, path, argv = os.getcwd(), list(sys.path), list(sys.argv)
+    environ = dict(os.environ)
+    modules = set(sys.modules)
+    threads = threading.active_count()
+    while True:
+        header = channel.readline()
+        if not header:
+            break
+        try:
+            token, size = header.decode("ascii").split()
+            source = channel.read(int(size)).decode("utf-8")
+        except (ValueError, UnicodeDecodeError):
+            continue
+
+        sys.stdin = io.StringIO("")
+        sys.argv = [SCRIPT_NAME]
+        exit_code = _run(source)
+
+        # Undo what a script may have changed for the next one
+        sys.stdout, sys.stderr = stdout, stderr
+        sys.path[:] = path
+        sys.argv = argv
+        try:
+            os.chdir(cwd)
+        except OSError:
+            pass
+        if os.environ != environ:
+            os.environ.clear()
+            os.environ.update(environ)
+        for name in set(sys.modules) - modules:
+            del sys.modules[name]
+        linecache.cache.pop(SCRIPT_NAME, None)
+        stderr.write(f"{SENTINEL}{token}\n")
+        stderr.flush()
+        stdout.write(f"{SENTINEL}{token} {exit_code}\n")
+        stdout.flush()
+        if threading.active_count() > threads:
+            os._exit(0) # Leftover threads: let the pool replace this worker
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+import os
+import tempfile
+from PyQt6.QtWidgets import QPlainTextEdit
+from PyQt6.QtGui import QColor, QTextCharFormat, QTextCursor, QDesktopServices
+from PyQt6.QtCore import QTimer, QUrl
+
+class OutputConsole(QPlainTextEdit):
+    """Read-only console for streamed process output.
+
+    Writes are queued and applied together every FLUSH_MS, the document keeps
+    at most max_blocks lines (oldest dropped first), and with spill=True the
+    complete output is also written to a temp file that can be opened later.
+    """
+    FLUSH_MS = 30
+    ERROR_COLOR = "#ff5555"
+
+    def __init__(self, max_blocks=5000, spill=False, parent=None):
+        super().__init__(parent)
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_blocks)
+        self.spill = spill
+        self.spill_path = None
+        self._spill_file = None
+        self._pending = [] # (kind, text): "text"/"error" stream raw, "line"/"html" get their own block
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        self._plain_fmt = QTextCharFormat()
+        self._error_fmt = QTextCharFormat()
+        self._error_fmt.setForeground(QColor(self.ERROR_COLOR))
+
+    # --- Writing ---
+    def write(self, text, error=False):
+        """Queues raw stream text (no newline added)."""
+        self._queue("error" if error else "text", text)
+
+    def appendPlainText(self, text):
+        """Queues text as its own line(s), like QPlainTextEdit.appendPlainText."""
+        self._queue("line", text)
+
+    def appendHtml(self, html):
+        self._queue("html", html)
+
+    def _queue(self, kind, text):
+        self._pending.append((kind, text))
+        if self.spill and kind != "html":
+            self._spill(text + "\n" if kind == "line" else text)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        if self._spill_file:
+            self._spill_file.flush()
+
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 4
+
+        cursor = QTextCursor(self.document())
+        cursor.beginEditBlock()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        i = 0
+        while i < len(pending):
+            kind, text = pending[i]
+            if kind in ("html", "line"):
+                # Block-level entries start on a fresh line and end one
+                if not self._at_line_start():
+                    cursor.insertBlock()
+                if kind == "html":
+                    cursor.insertHtml(text)
+                else:
+                    cursor.insertText(self._tail(text), self._plain_fmt)
+                cursor.insertBlock()
+                i += 1
+                continue
+            # Coalesce runs of stream text of the same kind into one insert
+            j = i + 1
+            while j < len(pending) and pending[j][0] == kind:
+                text += pending[j][1]
+                j += 1
+            cursor.insertText(self._tail(text), self._error_fmt if kind == "error" else self._plain_fmt)
+            i = j
+        cursor.endEditBlock()
+
+        if at_bottom:
+            bar.setValue(bar.maximum())
+
+    def _at_line_start(self):
+        return self.document().lastBlock().text() == ""
+
+    def _tail(self, text):
+        """Lines beyond the block limit would be dropped by the document anyway; skip inserting them."""
+        limit = self.maximumBlockCount()
+        if limit <= 0 or text.count("\n") < limit:
+            return text
+        return "\n".join(text.split("\n")[-limit:])
+
+    def clear(self):
+        self._pending = []
+        super().clear()
+        if self._spill_file:
+            self._spill_file.seek(0)
+            self._spill_file.truncate()
+
+    # --- Spill file ---
+    def _spill(self, text):
+        try:
+            if self._spill_file is None:
+                fd, self.spill_path = tempfile.mkstemp(prefix="genesis_output_", suffix=".log")
+                self._spill_file = os.fdopen(fd, "w", encoding="utf-8", errors="replace")
+            self._spill_file.write(text)
+        except OSError as e:
+            print(f"Console spill error: {e}")
+            self.spill = False
+
+    def open_spill(self):
+        if self.spill_path:
+            if self._spill_file:
+                self._spill_file.flush()
+            QDesktopServices.openUrl(QUrl.fromLocalFile(self.spill_path))
+
+    def contextMenuEvent(self, event):
+        menu = self.createStandardContextMenu()
+        if self.spill_path:
+            menu.addSeparator()
+            menu.addAction("Open Full Output", self.open_spill)
+        menu.exec(event.globalPos())
+
+    def discard_spill(self):
+        """Closes and deletes the spill file (call when the console goes away)."""
+        if self._spill_file:
+            self._spill_file.close()
+            self._spill_file = None
+        if self.spill_path and os.path.exists(self.spill_path):
+            try:
+                os.remove(self.spill_path)
+            except OSError:
+                pass
+        self.spill_path = None
@@ -0,0 +1,331 @@
+import re
+import bisect
+from contextlib import contextmanager
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PyQt6.QtGui import QFont, QColor
+
+class ScriptListModel(QAbstractListModel):
+    """Sidebar list of script names, built for very large libraries.
+
+    With grouped=True scripts are grouped by their generated-task key
+    ("auto_sort_numbers_1770329354" -> "sort_numbers") under a collapsible
+    header row showing the group's count; single-script groups are shown
+    without a header. Rows are handed to the view in FETCH_BATCH chunks through
+    canFetchMore/fetchMore, and updates are applied as row inserts/removes
+    rather than a model reset, so the selection survives them. Without a
+    ranking an update only splices the changed group's rows (found by binary
+    search), so a burst of updates doesn't rebuild the whole list each time.
+
+    set_ranking({name: score}) shows only the ranked names, best first
+    (groups expanded and ordered by their best match); None shows everything.
+    """
+    NameRole = Qt.ItemDataRole.UserRole
+    FETCH_BATCH = 500
+    KEY_RE = re.compile(r"^(?:auto|genesis)_(.+?)(?:_\d{1,4})?_\d{9,}$")
+    PREFIX_RE = re.compile(r"^(?:auto|genesis)_")
+
+    def __init__(self, grouped=False, parent=None):
+        super().__init__(parent)
+        self.grouped = grouped
+        self.groups = {} # key -> sorted names
+        self.group_keys = [] # sorted keys
+        self.group_of = {} # name -> key
+        self.expanded = set()
+        self.ranking = None
+        self.rows = [] # ("group", key) / ("script", name)
+        self.loaded = 0 # Rows handed to the view so far
+        self._positions = None # row -> index; rebuilt on demand after rows change
+
+        self._header_font = QFont()
+        self._header_font.setBold(True)
+
+    @classmethod
+    def group_key(cls, name):
+        match = cls.KEY_RE.match(name)
+        if match:
+            return match.group(1)
+        return cls.PREFIX_RE.sub("", name)
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.FETCH_BATCH, len(self.rows) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or index.row() >= self.loaded:
+            return None
+        kind, value = self.rows[index.row()]
+        if kind == "group":
+            if role == Qt.ItemDataRole.DisplayRole:
+                arrow = "▾" if self._is_expanded(value) else "▸"
+                return f"{arrow} {value} ({self._member_count(value)})"
+            if role == Qt.ItemDataRole.FontRole:
+                return self._header_font
+            if role == Qt.ItemDataRole.ForegroundRole:
+                return QColor("#9cdcfe")
+            return None
+        if role == self.NameRole or role == Qt.ItemDataRole.ToolTipRole:
+            return value
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Members of an expanded group are indented under their header
+            in_group = self.grouped and len(self.groups[self.group_of[value]]) > 1
+            return ("    " + value) if in_group else value
+        return None
+
+    # --- Content ---
+    def set_names(self, names):
+        """Replaces the whole list (initial load)."""
+        self.beginResetModel()
+        self.groups = {}
+        self.group_of = {}
+        for name in sorted(names):
+            key = self.group_key(name) if self.grouped else name
+            self.groups.setdefault(key, []).append(name)
+            self.group_of[name] = key
+        self.group_keys = sorted(self.groups)
+        self.rows = self._build_rows()
+        self._positions = None
+        self.loaded = min(self.FETCH_BATCH, len(self.rows))
+        self.endResetModel()
+
+    def add(self, name):
+        if name in self.group_of:
+            return
+        key = self.group_key(name) if self.grouped else name
+        with self._group_update(key):
+            members = self.groups.get(key)
+            if members is None:
+                members = self.groups[key] = []
+                bisect.insort(self.group_keys, key)
+            bisect.insort(members, name)
+            self.group_of[name] = key
+
+    def remove(self, name):
+        key = self.group_of.get(name)
+        if key is None:
+            return
+        with self._group_update(key):
+            del self.group_of[name]
+            members = self.groups[key]
+            del members[bisect.bisect_left(members, name)]
+            if not members:
+                del self.groups[key]
+                del self.group_keys[bisect.bisect_left(self.group_keys, key)]
+                self.expanded.discard(key)
+
+    def __contains__(self, name):
+        return name in self.group_of
+
+    def names(self):
+        return list(self.group_of)
+
+    def set_ranking(self, ranking):
+        self.ranking = ranking
+        self.beginResetModel()
+        self.rows = self._build_rows()
+        self._positions = None
+        self.loaded = min(self.FETCH_BATCH, len(self.rows))
+        self.endResetModel()
+
+    # --- Groups ---
+    def is_group(self, index):
+        return index.isValid() and index.row() < self.loaded and self.rows[index.row()][0] == "group"
+
+    def toggle_group(self, index):
+        """Expands/collapses the group whose header is at index (no-op for script rows)."""
+        if not self.is_group(index):
+            return
+        key = self.rows[index.row()][1]
+        with self._group_update(key):
+            if key in self.expanded:
+                self.expanded.discard(key)
+            else:
+                self.expanded.add(key)
+
+    def index_of(self, name):
+        """Returns the row index for name, expanding its group and fetching rows as needed."""
+        key = self.group_of.get(name)
+        if key is None:
+            return QModelIndex()
+        if self.grouped and key not in self.expanded and len(self.groups[key]) > 1:
+            with self._group_update(key):
+                self.expanded.add(key)
+        if self.ranking is None:
+            # Group start by binary search, then the name's place among the members
+            members = self.groups[key]
+            header = 1 if self.grouped and len(members) > 1 else 0
+            row = self._group_start(key) + header + bisect.bisect_left(members, name)
+        else:
+            row = self._row(("script", name))
+        if row is None:
+            return QModelIndex() # Filtered out by the search
+        while row >= self.loaded:
+            self.fetchMore()
+        return self.index(row, 0)
+
+    def _is_expanded(self, key):
+        return self.ranking is not None or key in self.expanded
+
+    def _members(self, key):
+        members = self.groups.get(key, [])
+        if self.ranking is None:
+            return members
+        return [name for name in members if name in self.ranking]
+
+    def _member_count(self, key):
+        return len(self._members(key))
+
+    def _refresh_header(self, key):
+        row = self._row(("group", key))
+        if row is not None and row < self.loaded:
+            index = self.index(row, 0)
+            self.dataChanged.emit(index, index)
+
+    # --- Rows ---
+    def _row(self, row):
+        """Index of a row in self.rows, or None."""
+        if self._positions is None:
+            self._positions = {item: i for i, item in enumerate(self.rows)}
+        return self._positions.get(row)
+
+    def _group_rows(self, key):
+        """The rows group `key` occupies when there is no ranking."""
+        members = self.groups.get(key)
+        if not members:
+            return []
+        if not self.grouped or len(members) == 1:
+            return [("script", name) for name in members]
+        if key in self.expanded:
+            return [("group", key)] + [("script", name) for name in members]
+        return [("group", key)]
+
+    def _group_start(self, key):
+        """Binary search for the first row at or after group `key` (rows are in group_keys order)."""
+        lo, hi = 0, len(self.rows)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            kind, value = self.rows[mid]
+            if (value if kind == "group" else self.group_of[value]) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    @contextmanager
+    def _group_update(self, key):
+        """Wraps a change to one group's membership/expansion and applies it to the rows."""
+        if self.ranking is not None:
+            # Ranked rows are ordered by score, not by group: rebuild them
+            yield
+            self._apply_rows(self._build_rows())
+            self._refresh_header(key)
+            return
+        old = self._group_rows(key)
+        start = self._group_start(key)
+        yield
+        new = self._group_rows(key)
+
+        # Splice only the part of the group's rows that changed
+        prefix = 0
+        while prefix < min(len(old), len(new)) and old[prefix] == new[prefix]:
+            prefix += 1
+        end_old, end_new = len(old), len(new)
+        while end_old > prefix and end_new > prefix and old[end_old - 1] == new[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+        if end_old > prefix:
+            self._remove_rows(start + prefix, end_old - prefix)
+        if end_new > prefix:
+            self._insert_rows(start + prefix, new[prefix:end_new])
+        if new and new[0][0] == "group" and start < self.loaded:
+            index = self.index(start, 0) # Count/arrow changed
+            self.dataChanged.emit(index, index)
+
+    def _insert_rows(self, start, rows):
+        # Rows past the fetched ones stay hidden until fetchMore (unless everything was fetched)
+        visible = start < self.loaded or self.loaded == len(self.rows)
+        if visible:
+            self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self.rows[start:start] = rows
+        self._positions = None
+        if visible:
+            self.loaded += len(rows)
+            self.endInsertRows()
+
+    def _remove_rows(self, start, count):
+        visible = max(0, min(count, self.loaded - start))
+        if visible:
+            self.beginRemoveRows(QModelIndex(), start, start + visible - 1)
+        del self.rows[start:start + count]
+        self._positions = None
+        if visible:
+            self.loaded -= visible
+            self.endRemoveRows()
+
+    def _build_rows(self):
+        if self.ranking is None:
+            ordered = [(key, self.groups[key]) for key in self.group_keys]
+        else:
+            score = self.ranking.get
+            ordered = []
+            for key in self.group_keys:
+                members = [name for name in self.groups[key] if name in self.ranking]
+                if members:
+                    members.sort(key=lambda name: (-score(name), name))
+                    ordered.append((key, members))
+            ordered.sort(key=lambda item: (-score(item[1][0]), item[0]))
+
+        rows = []
+        for key, members in ordered:
+            if not self.grouped or len(self.groups[key]) == 1:
+                rows.extend(("script", name) for name in members)
+                continue
+            rows.append(("group", key))
+            if self._is_expanded(key):
+                rows.extend(("script", name) for name in members)
+        return rows
+
+    def _apply_rows(self, new):
+        """Moves from self.rows to new with one remove + one insert around the changed span."""
+        old = self.rows
+        n = min(len(old), len(new))
+        start = 0
+        while start < n and old[start] == new[start]:
+            start += 1
+        end_old, end_new = len(old), len(new)
+        while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+            end_old -= 1
+            end_new -= 1
+
+        self._positions = None
+        if start >= self.loaded and self.loaded < len(old):
+            self.rows = new # Only rows the view hasn't fetched yet changed; fetchMore picks them up
+            return
+        if end_old <= self.loaded:
+            removed, inserted = end_old - start, end_new - start
+        else:
+            removed, inserted = self.loaded - start, min(len(new), self.loaded) - start
+
+        if removed > 0:
+            self.beginRemoveRows(QModelIndex(), start, start + removed - 1)
+            self.rows = old[:start] + old[start + removed:]
+            self.loaded -= removed
+            self.endRemoveRows()
+        if inserted > 0:
+            self.beginInsertRows(QModelIndex(), start, start + inserted - 1)
+            self.rows = new
+            self.loaded += inserted
+            self.endInsertRows()
+        self.rows = new
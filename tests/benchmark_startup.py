@@ -0,0 +1,83 @@
+"""Startup benchmark: time from process start to the launcher's first painted window.
+
+Usage: python tests/benchmark_startup.py [runs] [--offscreen]
+
+Each run starts a fresh interpreter (so nothing is cached in sys.modules),
+builds the GenesisLauncher and exits on its first paint.
+"""
+import sys
+import os
+import json
+import time
+import statistics
+import subprocess
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+HEAVY_MODULES = ["src.script_library", "src.workflow_organizer", "src.ai.assistant",
+                 "src.ai.brain", "src.integrations.google_calendar", "src.utils.updater"]
+
+def child():
+    started = time.perf_counter()
+    sys.path.append(os.path.join(PROJECT_ROOT, "src")) # Same path setup as main.py
+    sys.path.insert(0, PROJECT_ROOT)
+    os.chdir(PROJECT_ROOT)
+
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QTimer
+    from src.launcher import GenesisLauncher
+    imported = time.perf_counter()
+
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    window = GenesisLauncher()
+    window.first_painted.disconnect(window.schedule_prewarm) # Measure the launcher alone
+
+    def report():
+        painted = window.first_paint_at or time.perf_counter()
+        print("STARTUP " + json.dumps({
+            "import_ms": (imported - started) * 1000,
+            "first_window_ms": (painted - started) * 1000,
+            "heavy_loaded": [name for name in HEAVY_MODULES if name in sys.modules]
+        }), flush=True)
+        app.quit()
+
+    window.first_painted.connect(report)
+    QTimer.singleShot(10000, report) # No paint (e.g. no display): report anyway
+    window.show()
+    app.exec()
+
+def main():
+    runs = int(next((a for a in sys.argv[1:] if a.isdigit()), 5))
+    env = dict(os.environ)
+    if "--offscreen" in sys.argv:
+        env["QT_QPA_PLATFORM"] = "offscreen"
+
+    results = []
+    for i in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                              capture_output=True, text=True, env=env, cwd=PROJECT_ROOT)
+        wall_ms = (time.perf_counter() - started) * 1000
+        line = next((l for l in proc.stdout.splitlines() if l.startswith("STARTUP ")), None)
+        if line is None:
+            print(f"Run {i + 1} failed:\n{proc.stderr}")
+            sys.exit(1)
+        result = json.loads(line[len("STARTUP "):])
+        result["process_ms"] = wall_ms
+        results.append(result)
+        print(f"Run {i + 1}: first window {result['first_window_ms']:.0f} ms "
+              f"(imports {result['import_ms']:.0f} ms, process {wall_ms:.0f} ms)")
+
+    print(f"\nTime to first window over {runs} runs")
+    for key, label in [("import_ms", "Launcher imports"), ("first_window_ms", "First window"),
+                       ("process_ms", "Process (incl. interpreter and exit)")]:
+        values = [r[key] for r in results]
+        print(f"  {label:<38} median {statistics.median(values):7.0f} ms   min {min(values):7.0f} ms")
+    heavy = results[-1]["heavy_loaded"]
+    print(f"  Heavy modules loaded before first window: {', '.join(heavy) if heavy else 'none'}")
+
+if __name__ == "__main__":
+    if "--child" in sys.argv:
+        child()
+    else:
+        main()
@@ -0,0 +1,146 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.brain import NeuralMemory, KnowledgeSeeker, VectorEngine, IntentRegistry
+
+class TestNeuralMemoryIndexes(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp_dir, "brain_memory.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_fact_dedupe_is_normalized(self):
+        mem = NeuralMemory(self.path)
+        mem.add_fact("My favorite color is orange")
+        mem.add_fact("my  favorite color is ORANGE ")
+        self.assertEqual(mem.data["facts"], ["My favorite color is orange"])
+
+    def test_qa_and_opinion_update_in_place(self):
+        mem = NeuralMemory(self.path)
+        mem.add_qa("What is your name", "Genesis")
+        mem.add_qa("what is your name", "Project Genesis")
+        mem.add_opinion("Python", "Readable")
+        mem.add_opinion("python", "Very readable")
+
+        self.assertEqual(mem.data["qa"], [{"q": "What is your name", "a": "Project Genesis"}])
+        self.assertEqual(mem.data["opinions"], [{"topic": "Python", "thought": "Very readable"}])
+
+    def test_indexes_rebuilt_on_load(self):
+        with open(self.path, "w") as f:
+            json.dump({"qa": [{"q": "Hi there", "a": "Hello"}], "facts": ["The sky is blue"]}, f)
+
+        mem = NeuralMemory(self.path)
+        mem.add_fact("the sky is blue")
+        mem.add_qa("hi there", "Greetings")
+
+        self.assertEqual(len(mem.data["facts"]), 1)
+        self.assertEqual(mem.data["qa"][0]["a"], "Greetings")
+        self.assertEqual(mem.data["opinions"], [])
+
+class TestKnowledgeChunks(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.corpus = os.path.join(self.tmp_dir, "corpus.txt")
+        with open(self.corpus, "w") as f:
+            for i in range(200):
+                f.write(f"Verse {i}: the light was divided from the darkness.\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_windows_overlap_and_cover_file(self):
+        size = os.path.getsize(self.corpus)
+        chunks = list(KnowledgeSeeker.iter_chunks(self.corpus, window=256, overlap=32))
+
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[1][0], 256 - 32)
+        self.assertEqual(chunks[-1][0] + chunks[-1][1], size)
+
+    def test_ingest_stores_vectors_with_offsets(self):
+        mem = NeuralMemory(os.path.join(self.tmp_dir, "brain_memory.json"))
+        count = KnowledgeSeeker.ingest_file(self.corpus, mem)
+        self.assertGreater(count, 1)
+        self.assertEqual(mem.data["facts"], [])
+
+        # Re-ingesting the same file adds nothing
+        self.assertEqual(KnowledgeSeeker.ingest_file(self.corpus, mem), 0)
+
+        score, chunk = mem.search_chunks(VectorEngine.text_to_vector("Verse 150"))
+        self.assertGreater(score, 0)
+        self.assertIn("Verse 150", mem.corpus.resolve(chunk))
+        mem.corpus.close()
+
+    def test_chunks_reload_as_file_offsets(self):
+        path = os.path.join(self.tmp_dir, "brain_memory.json")
+        mem = NeuralMemory(path)
+        KnowledgeSeeker.ingest_file(self.corpus, mem)
+        mem.corpus.close()
+
+        # Vectors live in the side store, not in brain_memory.json
+        with open(path, "r") as f:
+            self.assertNotIn("chunks", json.load(f))
+        reloaded = NeuralMemory(path)
+        chunk = reloaded.chunk_store.chunks[0]
+        self.assertEqual(set(chunk), {"file", "offset", "length", "vec"})
+        self.assertTrue(reloaded.corpus.resolve(chunk).startswith("Verse 0:"))
+        reloaded.corpus.close()
+
+    def test_legacy_source_chunks_migrated(self):
+        path = os.path.join(self.tmp_dir, "brain_memory.json")
+        with open(path, "w") as f:
+            json.dump({"facts": ["[BIBLE_VEC] In the beginning...", "I like tea"],
+                       "chunks": [{"source": self.corpus, "offset": 0, "length": 20, "vec": {"verse": 1}}]}, f)
+
+        mem = NeuralMemory(path)
+        self.assertEqual(mem.data["facts"], ["I like tea"])
+        self.assertNotIn("chunks", mem.data)
+        self.assertEqual(mem.corpus.resolve(mem.chunk_store.chunks[0]), "Verse 0: the light w")
+        mem.corpus.close()
+
+    def test_edited_file_replaces_its_chunks(self):
+        mem = NeuralMemory(os.path.join(self.tmp_dir, "brain_memory.json"))
+        KnowledgeSeeker.ingest_file(self.corpus, mem)
+        with open(self.corpus, "w") as f:
+            for i in range(50):
+                f.write(f"Psalm {i}: the waters were gathered together.\n")
+        os.utime(self.corpus, ns=(0, os.stat(self.corpus).st_mtime_ns + 10**9)) # Distinct mtime
+
+        self.assertGreater(KnowledgeSeeker.ingest_file(self.corpus, mem), 0)
+        texts = [mem.corpus.resolve(c) for c in mem.chunk_store.chunks]
+        self.assertEqual(len(texts), len(list(KnowledgeSeeker.iter_chunks(self.corpus))))
+        self.assertFalse(any("Verse" in text for text in texts))
+        mem.corpus.close()
+
+class TestVectorEngine(unittest.TestCase):
+    def test_single_pass_matches_separate_passes(self):
+        text = "How are you doing with the status report?"
+        self.assertEqual(VectorEngine.tokenize(text), ["how", "you", "doing", "status", "report"])
+        self.assertEqual(VectorEngine.generate_ngrams(text, 2)[:3], ["how are", "are you", "you doing"])
+        vec = VectorEngine.text_to_vector(text)
+        self.assertEqual(vec["status report"], 2)
+        self.assertEqual(vec["status"], 1)
+
+    def test_vectors_are_not_shared_between_calls(self):
+        vec = VectorEngine.text_to_vector("hello world")
+        vec["hello"] += 5
+        self.assertEqual(VectorEngine.text_to_vector("hello world")["hello"], 1)
+
+    def test_intent_registry_matches_in_order(self):
+        intents = IntentRegistry()
+        intents.register("status", "Status Check", "how are you status report")
+        intents.register("greeting", "Greeting", "hello hi greetings good morning")
+        self.assertEqual(intents.match(VectorEngine.text_to_vector("hello hi")), ("greeting", "Greeting"))
+        self.assertEqual(intents.match(VectorEngine.text_to_vector("how are you")), ("status", "Status Check"))
+        self.assertIsNone(intents.match(VectorEngine.text_to_vector("tell me about rivers")))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication, QStyleOptionViewItem
+from PyQt6.QtCore import Qt
+
+from src.ai.chat_log import ChatLogModel, ChatLogView
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestChatLogModel(unittest.TestCase):
+    def test_appends_are_batched_until_flush(self):
+        model = ChatLogModel(max_messages=10)
+        inserts = []
+        model.rowsInserted.connect(lambda parent, first, last: inserts.append((first, last)))
+        for i in range(5):
+            model.append(f"msg {i}")
+        self.assertEqual(model.rowCount(), 0)
+
+        model.flush()
+        self.assertEqual(model.rowCount(), 5)
+        self.assertEqual(inserts, [(0, 4)])
+
+    def test_ring_buffer_drops_oldest(self):
+        model = ChatLogModel(max_messages=3)
+        for i in range(5):
+            model.append(f"msg {i}")
+            model.flush()
+        self.assertEqual(model.rowCount(), 3)
+        self.assertEqual(model.index(0).data(), "msg 2")
+        self.assertEqual(model.index(2).data(), "msg 4")
+        # Sequence numbers survive eviction
+        self.assertEqual(model.index(0).data(Qt.ItemDataRole.UserRole), 2)
+
+    def test_oversized_batch_keeps_newest(self):
+        model = ChatLogModel(max_messages=3)
+        for i in range(8):
+            model.append(f"msg {i}")
+        model.flush()
+        self.assertEqual([model.index(r).data() for r in range(3)], ["msg 5", "msg 6", "msg 7"])
+
+class TestChatLogView(unittest.TestCase):
+    def setUp(self):
+        self.view = ChatLogView(max_messages=10)
+        self.view.resize(300, 200)
+        self.view.append("<div><b>User:</b> hello</div><br>")
+        self.view.append("<div><b>Assistant:</b> see <a href='https://example.com'>docs</a></div>")
+        self.view.log_model.flush()
+
+    def test_rows_wrap_at_viewport_width(self):
+        # sizeHint's option carries no rect; the width comes from the view
+        hint = self.view.delegate.sizeHint(QStyleOptionViewItem(), self.view.log_model.index(0))
+        self.assertEqual(hint.width(), self.view.viewport().width())
+
+    def test_copy_selected_messages(self):
+        self.view.selectAll()
+        self.view.copy_selection()
+        self.assertEqual(QApplication.clipboard().text(), "User: hello\nAssistant: see docs")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import sys
+import os
+import io
+import shutil
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.extensions import ExtensionStore
+
+TOOL = """# Tool: auto_hello_1
+# Description: say hello
+
+import os
+import sys
+
+def run_task():
+    print('hello from tool')
+
+
+run_task()
+"""
+
+class TestExtensionStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.store = ExtensionStore(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_duplicates_stored_once(self):
+        renamed = TOOL.replace("auto_hello_1", "auto_hello_2").replace("import os\nimport sys", "import sys\nimport os")
+        self.assertTrue(self.store.install("auto_hello_1", TOOL, 95))
+        self.assertFalse(self.store.install("auto_hello_2", renamed, 95))
+
+        entries = self.store.list()
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0]["description"], "say hello")
+
+    def test_install_and_list_do_not_execute(self):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            self.store.install("auto_hello_1", TOOL)
+            ExtensionStore(self.tmp_dir).list()
+        self.assertEqual(buf.getvalue(), "")
+
+    def test_lazy_load_on_first_call(self):
+        self.store.install("auto_hello_1", TOOL)
+        fresh = ExtensionStore(self.tmp_dir)
+
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            fresh.run("auto_hello_1")
+        self.assertEqual(buf.getvalue(), "hello from tool\n")
+        with self.assertRaises(KeyError):
+            fresh.load("missing_tool")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import os
+import unittest
+
+# Add project root and src/ to path (src.script_library imports config_manager etc. from src/, as in main.py)
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(PROJECT_ROOT)
+src_path = os.path.join(PROJECT_ROOT, "src")
+if src_path not in sys.path:
+    sys.path.append(src_path)
+
+from PyQt6.QtWidgets import QApplication
+from PyQt6.QtGui import QTextDocument
+from PyQt6.QtWidgets import QPlainTextDocumentLayout
+from PyQt6.QtCore import QEventLoop, QTimer
+
+from src.script_library import UniversalHighlighter
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+def formatted(block):
+    """[(start, length)] of the highlighted ranges in a block."""
+    return [(r.start, r.length) for r in block.layout().formats()]
+
+class TestUniversalHighlighter(unittest.TestCase):
+    def setUp(self):
+        # Highlighting only runs on a document with a layout (as in the editor)
+        self.doc = QTextDocument()
+        self.doc.setDocumentLayout(QPlainTextDocumentLayout(self.doc))
+        self.highlighter = UniversalHighlighter(self.doc)
+
+    def test_rule_sets_are_cached(self):
+        self.highlighter.set_language("Java")
+        java_rules = self.highlighter.rules
+        self.highlighter.set_language("Python")
+        self.highlighter.set_language("Java")
+        self.assertIs(self.highlighter.rules, java_rules)
+
+    def test_single_line_tokens(self):
+        self.doc.setPlainText("def f(): return 'x' # done")
+        self.assertEqual(formatted(self.doc.firstBlock()), [(0, 3), (9, 6), (16, 3), (20, 6)])
+
+    def test_multiline_string_state(self):
+        self.doc.setPlainText('x = """start\nmiddle def\nend""" + 1\ny = 2')
+        blocks = [self.doc.findBlockByNumber(i) for i in range(4)]
+        self.assertEqual([b.userState() for b in blocks], [1, 1, 0, 0])
+        self.assertEqual(formatted(blocks[1]), [(0, 10)]) # Keyword inside the string is not highlighted
+        self.assertEqual(formatted(blocks[2]), [(0, 6)])
+        self.assertEqual(formatted(blocks[3]), [])
+
+    def test_java_block_comment(self):
+        self.highlighter.set_language("Java")
+        self.doc.setPlainText("int a; /* one\ntwo */ int b;")
+        second = self.doc.findBlockByNumber(1)
+        self.assertEqual(formatted(second), [(0, 6), (7, 3)])
+
+    def test_large_document_is_deferred(self):
+        lines = UniversalHighlighter.LARGE_DOC_LINES + 5000
+        self.doc.setPlainText("\n".join("def f(): pass" for _ in range(lines)))
+        last = self.doc.lastBlock()
+        self.assertTrue(self.highlighter.is_pending())
+        self.assertEqual(last.userState(), UniversalHighlighter.DEFERRED)
+
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.timeout.connect(lambda: None if self.highlighter.is_pending() else loop.quit())
+        timer.start(10)
+        QTimer.singleShot(20000, loop.quit)
+        loop.exec()
+        self.assertFalse(self.highlighter.is_pending())
+        self.assertEqual(formatted(self.doc.lastBlock()), [(0, 3), (9, 4)])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.intent_router import AhoCorasick, IntentRouter
+
+class TestAhoCorasick(unittest.TestCase):
+    def test_finds_overlapping_patterns(self):
+        ac = AhoCorasick(["he", "she", "his", "hers"])
+        self.assertEqual(sorted(ac.search("ushers")), [(1, "she"), (2, "he"), (2, "hers")])
+
+    def test_no_match(self):
+        self.assertEqual(list(AhoCorasick(["tool"]).search("nothing here")), [])
+
+class TestIntentRouter(unittest.TestCase):
+    def setUp(self):
+        self.router = IntentRouter()
+        self.router.add_command("/learn", lambda args, thoughts: ("learn", args))
+        self.router.add_command("/learnall", lambda args, thoughts: ("learnall", args))
+        self.router.add_keywords("create", ["create", "write"])
+        self.router.add_keywords("object", ["tool", "script"])
+        self.router.add_intent("coding", lambda ctx: "coding", requires=("create", "object"))
+        self.router.add_intent("fallback", lambda ctx: None)
+
+    def test_command_prefix_with_args(self):
+        route = self.router.route("/learn sky : blue")
+        self.assertEqual(route.command(route.args, []), ("learn", " sky : blue"))
+
+    def test_longest_command_wins(self):
+        route = self.router.route("/learnall x")
+        self.assertEqual(route.command(route.args, []), ("learnall", " x"))
+
+    def test_command_must_be_prefix(self):
+        self.assertIsNone(self.router.route("please /learn this").command)
+
+    def test_intent_requires_all_groups(self):
+        route = self.router.route("Please WRITE a Script")
+        self.assertEqual(route.hits, {"create", "object"})
+        self.assertEqual([name for name, _ in route.intents], ["coding", "fallback"])
+        route = self.router.route("write me a poem")
+        self.assertEqual([name for name, _ in route.intents], ["fallback"])
+
+    def test_keywords_match_substrings(self):
+        # Same semantics as the old `t in text` checks
+        self.assertIn("object", self.router.route("my toolbox").hits)
+
+    def test_registration_after_routing(self):
+        self.router.route("warm up the automaton")
+        self.router.add_keywords("greeting", ["hello"])
+        self.assertIn("greeting", self.router.route("hello there").hits)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,6 +34,13 @@ try:
         print("PASS: Stylesheet applied.")
     else:
         print("WARN: Stylesheet might be empty?")
+
+    # Tools are imported on first use, not with the launcher
+    eager = [m for m in ("src.script_library", "src.workflow_organizer", "src.ai.assistant", "src.ai.brain") if m in sys.modules]
+    if eager:
+        print(f"FAIL: Launcher imported tool modules at startup: {eager}")
+    else:
+        print("PASS: Tool modules are loaded lazily.")
         
 except Exception as e:
     print(f"FAIL: Crash during launcher init: {e}")
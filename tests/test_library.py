@@ -38,8 +38,8 @@ lib.refresh_lists()
 # Test 1: Empty Search
 lib.txt_search.setText("")
 lib.refresh_lists()
-count_user = lib.list_user.count()
-count_auto = lib.list_auto.count()
+count_user = lib.list_user.model().rowCount()
+count_auto = lib.list_auto.model().rowCount()
 if count_user == 2 and count_auto == 1:
     print("PASS: Empty search shows all.")
 else:
@@ -48,7 +48,7 @@ else:
 # Test 2: Search 'test'
 lib.txt_search.setText("test")
 lib.refresh_lists()
-if lib.list_user.count() == 1 and lib.list_user.item(0).text() == "test_abc":
+if lib.list_user.model().rowCount() == 1 and lib.list_user.model().index(0, 0).data() == "test_abc":
     print("PASS: Search 'test' correct.")
 else:
     print(f"FAIL: Search 'test' failed.")
@@ -56,9 +56,17 @@ else:
 # Test 3: Search 'auto'
 lib.txt_search.setText("auto")
 lib.refresh_lists()
-if lib.list_auto.count() == 1 and lib.list_auto.item(0).text() == "auto_generated":
+if lib.list_auto.model().rowCount() == 1 and lib.list_auto.model().index(0, 0).data() == "auto_generated":
     print("PASS: Search 'auto' correct.")
 else:
     print(f"FAIL: Search 'auto' failed.")
+
+# Test 4: Full-text search finds content
+lib.txt_search.setText("hello")
+lib.apply_search()
+if lib.list_user.model().rowCount() == 1 and lib.list_user.model().index(0, 0).data() == "my_script":
+    print("PASS: Search 'hello' matches content.")
+else:
+    print(f"FAIL: Content search failed.")
     
 print("Done.")
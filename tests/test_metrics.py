@@ -0,0 +1,45 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.metrics import MetricsRegistry
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_histogram_summary(self):
+        metrics = MetricsRegistry()
+        for ms in (0.05, 2, 2, 2, 700):
+            metrics.record("qa_scan", ms / 1000.0)
+        s = metrics.snapshot()["qa_scan"]
+        self.assertEqual(s["count"], 5)
+        self.assertAlmostEqual(s["max_ms"], 700, places=3)
+        self.assertAlmostEqual(s["p50_ms"], 2, places=3)
+        self.assertEqual(s["histogram"], {"<=0.1ms": 1, "<=5ms": 3, "<=1000ms": 1})
+
+    def test_timer_records_on_exception(self):
+        metrics = MetricsRegistry()
+        with self.assertRaises(ValueError):
+            with metrics.timer("fact_scan"):
+                raise ValueError("boom")
+        self.assertEqual(metrics.snapshot()["fact_scan"]["count"], 1)
+
+    def test_json_export(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            metrics = MetricsRegistry()
+            metrics.record("vectorize", 0.001)
+            path = os.path.join(tmp_dir, "stats", "brain_stats.json")
+            metrics.to_json(path)
+            with open(path) as f:
+                data = json.load(f)
+            self.assertEqual(data["stages"]["vectorize"]["count"], 1)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
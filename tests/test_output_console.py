@@ -0,0 +1,52 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.output_console import OutputConsole
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+class TestOutputConsole(unittest.TestCase):
+    def test_writes_are_batched(self):
+        console = OutputConsole()
+        console.write("hel")
+        console.write("lo\n")
+        self.assertEqual(console.toPlainText(), "")
+        console.flush()
+        self.assertEqual(console.toPlainText(), "hello\n")
+
+    def test_block_limit_keeps_newest_lines(self):
+        console = OutputConsole(max_blocks=100)
+        console.write("".join(f"line {i}\n" for i in range(10000)))
+        console.flush()
+        self.assertLessEqual(console.blockCount(), 100)
+        self.assertIn("line 9999", console.toPlainText())
+        self.assertNotIn("line 0\n", console.toPlainText())
+
+    def test_lines_and_stream_text_keep_order(self):
+        console = OutputConsole()
+        console.appendPlainText("Running...")
+        console.write("partial")
+        console.appendPlainText("Done")
+        console.flush()
+        self.assertEqual(console.toPlainText().split("\n")[:3], ["Running...", "partial", "Done"])
+
+    def test_spill_keeps_everything(self):
+        console = OutputConsole(max_blocks=10, spill=True)
+        try:
+            console.write("".join(f"{i}\n" for i in range(50)))
+            console.flush()
+            with open(console.spill_path) as f:
+                self.assertEqual(len(f.read().splitlines()), 50)
+        finally:
+            path = console.spill_path
+            console.discard_spill()
+            self.assertFalse(os.path.exists(path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai import code_analyzer
+from src.ai.code_analyzer import ParallelAnalyzer, summarize_source
+from src.ai.project_index import ProjectIndex
+
+class TestProjectIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        os.makedirs(os.path.join(self.tmp_dir, "pkg"))
+        os.makedirs(os.path.join(self.tmp_dir, ".git"))
+        self.write("pkg/mod.py", "import os\n\nclass A:\n    def run(self):\n        pass  # TODO: speed up\n")
+        self.write("notes.txt", "hello\n")
+        self.write(".git/ignored.py", "def hidden(): pass\n")
+        self.cache_file = os.path.join(self.tmp_dir, "data", "index.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def write(self, rel_path, content):
+        with open(os.path.join(self.tmp_dir, rel_path), "w") as f:
+            f.write(content)
+
+    def test_summaries(self):
+        index = ProjectIndex(self.tmp_dir, min_interval=0)
+        mod = os.path.join("pkg", "mod.py")
+
+        self.assertEqual(index.python_files(), [mod])
+        self.assertEqual(index.top_level_files(), ["notes.txt"])
+        entry = index.entry(os.path.join(self.tmp_dir, mod))
+        self.assertEqual(entry["lines"], 5)
+        self.assertEqual(entry["classes"], ["A"])
+        self.assertEqual(entry["functions"], ["run"])
+        self.assertEqual(entry["imports"], ["os"])
+        self.assertEqual(index.todos(), [(mod, 5, "pass  # TODO: speed up")])
+
+    def test_refresh_only_rereads_changed_files(self):
+        index = ProjectIndex(self.tmp_dir, min_interval=0)
+        index.refresh()
+
+        with patch.object(code_analyzer, "summarize_source", wraps=summarize_source) as spy:
+            self.assertFalse(index.refresh())
+            self.assertEqual(spy.call_count, 0)
+
+            self.write("pkg/new.py", "def added(): pass\n")
+            self.assertTrue(index.refresh())
+            self.assertEqual(spy.call_count, 1)
+
+            # Rewriting identical content is served from the content-hash cache
+            stat = os.stat(os.path.join(self.tmp_dir, "pkg", "mod.py"))
+            os.utime(os.path.join(self.tmp_dir, "pkg", "mod.py"), ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertTrue(index.refresh())
+            self.assertEqual(spy.call_count, 1)
+
+        os.remove(os.path.join(self.tmp_dir, "pkg", "new.py"))
+        self.assertTrue(index.refresh())
+        self.assertNotIn(os.path.join("pkg", "new.py"), index.files)
+
+    def test_persisted_index_is_reused(self):
+        ProjectIndex(self.tmp_dir, cache_file=self.cache_file, min_interval=0).refresh()
+        self.assertTrue(os.path.exists(self.cache_file))
+
+        reloaded = ProjectIndex(self.tmp_dir, cache_file=self.cache_file, min_interval=0)
+        self.assertIn(os.path.join("pkg", "mod.py"), reloaded.files)
+        self.assertFalse(reloaded.refresh())
+
+class TestCodeAnalyzer(unittest.TestCase):
+    def test_cyclomatic_complexity(self):
+        source = (
+            "def simple():\n"
+            "    return 1\n"
+            "\n"
+            "def branchy(items):\n"
+            "    for x in items:\n"
+            "        if x and x > 2:\n"
+            "            return x\n"
+            "    return [y for y in items if y]\n"
+        )
+        summary = summarize_source(source)
+        self.assertEqual(summary["complexity"], {"simple:1": 1, "branchy:4": 6})
+
+    def test_parallel_matches_inline(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            paths = []
+            for i in range(6):
+                path = os.path.join(tmp_dir, f"m{i}.py")
+                with open(path, "w") as f:
+                    f.write(f"class C{i}:\n    def f(self):\n        return {i}\n")
+                paths.append(path)
+
+            analyzer = ParallelAnalyzer(max_workers=2)
+            analyzer.MIN_PARALLEL = 2
+            results = analyzer.analyze(paths)
+
+            self.assertEqual(len(results), 6)
+            for i, path in enumerate(paths):
+                expected = summarize_source(open(path).read())
+                self.assertEqual(results[path]["classes"], expected["classes"])
+                self.assertEqual(results[path]["hash"], ParallelAnalyzer.content_hash(open(path).read()))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    unittest.main()
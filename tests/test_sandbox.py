@@ -0,0 +1,112 @@
+import sys
+import os
+import time
+import shutil
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ai.sandbox import SandboxPool
+from src.ai.brain import CodeSandbox, RunCache
+from src.ai.project_index import ProjectIndex
+
+class TestSandboxPool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = SandboxPool(size=1, timeout=5.0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.shutdown()
+
+    def test_captures_stdout(self):
+        success, output = self.pool.run("import os\ndef f():\n    print(os.sep)\nf()\n")
+        self.assertTrue(success)
+        self.assertEqual(output, os.sep + "\n")
+
+    def test_exception_reported(self):
+        success, output = self.pool.run("raise ValueError('boom')")
+        self.assertFalse(success)
+        self.assertEqual(output, "boom")
+
+    def test_timeout_kills_and_respawns(self):
+        start = time.time()
+        success, output = self.pool.run("while True: pass", timeout=0.5)
+        self.assertFalse(success)
+        self.assertIn("Timeout", output)
+        self.assertLess(time.time() - start, 5.0)
+
+        # Replacement worker is usable
+        success, output = self.pool.run("print('alive')")
+        self.assertTrue(success)
+        self.assertEqual(output.strip(), "alive")
+
+    def test_cancel_from_another_thread(self):
+        import threading
+        results = []
+        runner = threading.Thread(target=lambda: results.append(self.pool.run("while True: pass", timeout=30)))
+        runner.start()
+        deadline = time.time() + 5
+        while not self.pool.cancel(owner=runner.ident) and time.time() < deadline:
+            time.sleep(0.05)
+        runner.join(5)
+
+        self.assertEqual(results, [(False, "Cancelled by user.")])
+        self.assertEqual(self.pool.run("print('ok')"), (True, "ok\n"))
+
+    def test_security_check_skips_execution(self):
+        success, output = CodeSandbox.simulate("import subprocess")
+        self.assertFalse(success)
+        self.assertIn("Security Risk", output)
+
+class TestRunCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.module = os.path.join(self.tmp_dir, "mod.py")
+        with open(self.module, "w") as f:
+            f.write("x = 1\n")
+        self.cache = RunCache(ProjectIndex(self.tmp_dir, min_interval=0))
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_hit_ignores_comments(self):
+        self.cache.put("# Tool: auto_a_1\nprint('hi')\n", True, "hi\n", 20)
+        self.assertEqual(self.cache.get("# Tool: auto_a_2\n\n    # Mutation\nprint('hi')"), (True, "hi\n", 20))
+        self.assertIsNone(self.cache.get("print('bye')"))
+
+    def test_project_change_invalidates(self):
+        self.cache.put("print('hi')", True, "hi\n", 20)
+        stat = os.stat(self.module)
+        os.utime(self.module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(self.cache.get("print('hi')"))
+
+    def test_any_readable_file_invalidates(self):
+        notes = os.path.join(self.tmp_dir, "notes.txt")
+        with open(notes, "w") as f:
+            f.write("one\n")
+        self.cache.put("print(open('notes.txt').read())", True, "one\n", 20)
+        os.makedirs(os.path.join(self.tmp_dir, "data"))
+        with open(os.path.join(self.tmp_dir, "data", "brain_memory.json"), "w") as f:
+            f.write("{}") # App state is not a tool input
+        self.assertIsNotNone(self.cache.get("print(open('notes.txt').read())"))
+
+        with open(notes, "w") as f:
+            f.write("one\ntwo\n")
+        stat = os.stat(notes)
+        os.utime(notes, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(self.cache.get("print(open('notes.txt').read())"))
+
+    def test_writing_tools_not_cached(self):
+        code = "with open('auto_report.json', 'w') as f: f.write('[]')"
+        self.cache.put(code, True, "", 20)
+        self.assertIsNone(self.cache.get(code))
+
+    def test_transient_failures_not_cached(self):
+        self.cache.put("while True: pass", False, "Timeout: execution exceeded 10s.", 0)
+        self.assertIsNone(self.cache.get("while True: pass"))
+
+if __name__ == '__main__':
+    unittest.main()
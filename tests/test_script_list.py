@@ -0,0 +1,79 @@
+import sys
+import os
+import time
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtWidgets import QApplication
+
+from src.ui.script_list import ScriptListModel
+
+app = QApplication.instance() or QApplication(sys.argv)
+
+def visible(model):
+    return [model.index(row, 0).data() for row in range(model.rowCount())]
+
+class TestScriptListModel(unittest.TestCase):
+    def setUp(self):
+        self.model = ScriptListModel(grouped=True)
+        self.model.set_names(["auto_sort_numbers_1770329354", "auto_sort_numbers_1770330391",
+                              "auto_fibonacci_1770326234", "calc_pi"])
+
+    def test_group_key(self):
+        self.assertEqual(ScriptListModel.group_key("auto_generic_task_1770327049"), "generic_task")
+        self.assertEqual(ScriptListModel.group_key("auto_procedural_find_TODO_59_1770331431"), "procedural_find_TODO")
+        self.assertEqual(ScriptListModel.group_key("genesis_helper"), "helper")
+
+    def test_groups_collapse_and_expand(self):
+        # Single-script groups have no header
+        self.assertEqual(visible(self.model), ["calc_pi", "auto_fibonacci_1770326234", "▸ sort_numbers (2)"])
+        self.model.toggle_group(self.model.index(2, 0))
+        self.assertEqual(self.model.rowCount(), 5)
+        self.assertEqual(self.model.index(3, 0).data(ScriptListModel.NameRole), "auto_sort_numbers_1770329354")
+
+    def test_index_of_expands_group(self):
+        index = self.model.index_of("auto_sort_numbers_1770330391")
+        self.assertEqual(index.data(ScriptListModel.NameRole), "auto_sort_numbers_1770330391")
+
+    def test_add_and_remove_update_counts(self):
+        self.model.add("auto_sort_numbers_1770339999")
+        self.assertIn("▸ sort_numbers (3)", visible(self.model))
+        self.model.remove("auto_fibonacci_1770326234")
+        self.assertNotIn("auto_fibonacci_1770326234", visible(self.model))
+
+    def test_ranking_filters_and_orders(self):
+        self.model.set_ranking({"auto_sort_numbers_1770330391": 5.0, "calc_pi": 1.0})
+        self.assertEqual(visible(self.model), ["▾ sort_numbers (1)", "    auto_sort_numbers_1770330391", "calc_pi"])
+        self.model.set_ranking(None)
+        self.assertEqual(len(visible(self.model)), 3)
+
+    def test_large_library_is_fetched_lazily(self):
+        model = ScriptListModel(grouped=False)
+        started = time.perf_counter()
+        model.set_names(f"script_{i}" for i in range(100000))
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertEqual(model.rowCount(), ScriptListModel.FETCH_BATCH)
+        self.assertTrue(model.canFetchMore())
+        model.fetchMore()
+        self.assertEqual(model.rowCount(), 2 * ScriptListModel.FETCH_BATCH)
+        index = model.index_of("script_99999")
+        self.assertEqual(index.data(), "script_99999")
+
+    def test_update_burst_on_large_library(self):
+        model = ScriptListModel(grouped=True)
+        model.set_names(f"auto_task{i % 100}_{1770000000 + i}" for i in range(100000))
+        model.toggle_group(model.index(3, 0))
+        started = time.perf_counter()
+        for i in range(2000):
+            model.add(f"auto_task{i % 100}_{1880000000 + i}")
+        for i in range(0, 2000, 2):
+            model.remove(f"auto_task{i % 100}_{1880000000 + i}")
+        self.assertLess(time.perf_counter() - started, 2.0)
+        self.assertEqual(model.rows, model._build_rows())
+        index = model.index_of("auto_task51_1880001951")
+        self.assertEqual(index.data(ScriptListModel.NameRole), "auto_task51_1880001951")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+import sys
+import os
+import shutil
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from src.script_runner import ScriptRun, JavaBuildCache, PythonWorkerPool
+
+app = QCoreApplication.instance() or QCoreApplication(sys.argv)
+
+def run_to_end(run, limit_ms=20000):
+    """Starts run and spins an event loop until it finishes. Returns (exit_code, outcome, stdout, stderr)."""
+    result = {"out": [], "err": []}
+    loop = QEventLoop()
+    run.output.connect(result["out"].append)
+    run.error.connect(result["err"].append)
+    run.finished.connect(lambda code, outcome: (result.update(code=code, outcome=outcome), loop.quit()))
+    QTimer.singleShot(limit_ms, loop.quit)
+    run.start()
+    if "outcome" not in result:
+        loop.exec()
+    return result.get("code"), result.get("outcome"), "".join(result["out"]), "".join(result["err"])
+
+class TestScriptRun(unittest.TestCase):
+    def test_python_output_streams(self):
+        code, outcome, out, err = run_to_end(ScriptRun("Python", "print('hello')\nprint('world')"))
+        self.assertEqual((code, outcome), (0, "ok"))
+        self.assertEqual(out.split(), ["hello", "world"])
+
+    def test_python_failure_reports_stderr(self):
+        code, outcome, out, err = run_to_end(ScriptRun("Python", "raise ValueError('boom')"))
+        self.assertEqual(outcome, "failed")
+        self.assertIn("ValueError: boom", err)
+
+    def test_timeout_kills_run(self):
+        run = ScriptRun("Python", "import time\ntime.sleep(30)", timeout=1, warm_python=False)
+        code, outcome, out, err = run_to_end(run)
+        self.assertEqual(outcome, "timeout")
+        self.assertFalse(os.path.exists(run.temp_path))
+
+    def test_input_gets_eof_cold_and_warm(self):
+        source = "try:\n    input()\nexcept EOFError:\n    print('eof')"
+        for warm in (False, True):
+            code, outcome, out, err = run_to_end(ScriptRun("Python", source, timeout=10, warm_python=warm))
+            self.assertEqual((outcome, out.strip()), ("ok", "eof"))
+
+    def test_stop(self):
+        run = ScriptRun("Python", "import time\nprint('started', flush=True)\ntime.sleep(30)")
+        run.output.connect(lambda text: run.stop())
+        code, outcome, out, err = run_to_end(run)
+        self.assertEqual(outcome, "stopped")
+
+    def test_unsupported_language(self):
+        code, outcome, out, err = run_to_end(ScriptRun("Plain Text", "hello"))
+        self.assertEqual(outcome, "error")
+
+class TestPythonWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.pool = PythonWorkerPool(size=1, max_runs=2)
+        loop = QEventLoop()
+        QTimer.singleShot(5000, loop.quit)
+        self.pool.workers[0].process.started.connect(loop.quit)
+        loop.exec()
+
+    def tearDown(self):
+        self.pool.shutdown()
+
+    def run_warm(self, source):
+        worker = self.pool.acquire()
+        self.assertIsNotNone(worker)
+        result = {"out": []}
+        loop = QEventLoop()
+        on_output = result["out"].append
+        on_done = lambda code: (result.update(code=code), loop.quit())
+        worker.output.connect(on_output)
+        worker.done.connect(on_done)
+        QTimer.singleShot(10000, loop.quit)
+        self.assertTrue(worker.run(source))
+        loop.exec()
+        worker.output.disconnect(on_output)
+        worker.done.disconnect(on_done)
+        return worker, result.get("code"), "".join(result["out"])
+
+    def test_worker_runs_and_is_recycled(self):
+        first, code, out = self.run_warm("print('one')")
+        self.assertEqual((code, out), (0, "one\n"))
+        loop = QEventLoop()
+        first.exited.connect(loop.quit)
+        QTimer.singleShot(10000, loop.quit)
+        second, code, out = self.run_warm("import sys; sys.exit(2)")
+        self.assertIs(first, second)
+        self.assertEqual(code, 2)
+        loop.exec()
+        # max_runs reached: the worker is replaced
+        self.assertNotIn(first, self.pool.workers)
+        self.assertEqual(len(self.pool.workers), 1)
+
+class TestPythonWorkerPoolBackoff(unittest.TestCase):
+    def test_stops_respawning_workers_that_die_at_startup(self):
+        import src.script_runner as script_runner
+        original = script_runner.WORKER_SCRIPT
+        script_runner.WORKER_SCRIPT = os.path.join(tempfile.gettempdir(), "no_such_worker.py")
+        try:
+            pool = PythonWorkerPool(size=1)
+            pool.BACKOFF_MS = 1
+            loop = QEventLoop()
+            pool.gave_up.connect(loop.quit) # The pool is briefly empty between backed-off respawns too
+            QTimer.singleShot(15000, loop.quit)
+            loop.exec()
+            self.assertEqual(pool.start_failures, PythonWorkerPool.MAX_START_FAILURES)
+            self.assertEqual(pool.workers, [])
+            self.assertFalse(pool.respawn_pending())
+        finally:
+            script_runner.WORKER_SCRIPT = original
+            pool.shutdown()
+
+class TestJavaBuildCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = JavaBuildCache(self.tmp_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _fake_build(self, class_name, source):
+        staging, java_file = self.cache.stage(class_name, source)
+        open(os.path.join(staging, f"{class_name}.class"), "wb").close() # stands in for javac
+        return self.cache.commit(class_name, source, staging)
+
+    def test_hit_only_for_same_source(self):
+        self.assertIsNone(self.cache.lookup("Main", "class Main {}"))
+        path = self._fake_build("Main", "class Main {}")
+        self.assertEqual(self.cache.lookup("Main", "class Main {}"), path)
+        self.assertIsNone(self.cache.lookup("Main", "class Main { }"))
+
+    def test_prune_keeps_newest(self):
+        paths = []
+        for i in range(3):
+            paths.append(self._fake_build("Main", f"// v{i}"))
+            os.utime(paths[-1], (1000 + i, 1000 + i)) # Distinct mtimes, oldest first
+        self.cache.MAX_ENTRIES = 2
+        self.cache.prune()
+        self.assertFalse(os.path.exists(paths[0]))
+        self.assertTrue(os.path.exists(paths[1]))
+        self.assertTrue(os.path.exists(paths[2]))
+
+    @unittest.skipUnless(shutil.which("javac"), "JDK not installed")
+    def test_second_java_run_skips_compile(self):
+        source = 'public class CacheProbe { public static void main(String[] a) { System.out.println("hi"); } }'
+        statuses = []
+        first = ScriptRun("Java", source)
+        first.status.connect(statuses.append)
+        self.assertEqual(run_to_end(first)[1], "ok")
+        second = ScriptRun("Java", source)
+        second.status.connect(statuses.append)
+        code, outcome, out, err = run_to_end(second)
+        self.assertEqual((outcome, out.strip()), ("ok", "hi"))
+        self.assertLessEqual(statuses.count("Compiling..."), 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import sys
+import os
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.script_search import ScriptSearchIndex
+
+class TestScriptSearchIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = ScriptSearchIndex()
+        self.index.add("file_organizer", "import shutil\ndef moveFiles(src, dst): pass")
+        self.index.add("auto_timer", "import time\ntime.sleep(2)")
+        self.index.add("notes", "remember to organize the files")
+
+    def names(self, query):
+        return [name for name, score in self.index.search(query)]
+
+    def test_tokenize_splits_identifiers(self):
+        tokens = ScriptSearchIndex.tokenize("moveFiles file_organizer HTTPServer")
+        for token in ["movefiles", "move", "files", "file_organizer", "file", "organizer", "http", "server"]:
+            self.assertIn(token, tokens)
+
+    def test_prefix_and_ranking(self):
+        # Name hits outrank content hits
+        self.assertEqual(self.names("organ"), ["file_organizer", "notes"])
+        self.assertEqual(self.names("sle"), ["auto_timer"])
+
+    def test_all_terms_must_match(self):
+        self.assertEqual(self.names("import time"), ["auto_timer"])
+        self.assertEqual(self.names("shutil sleep"), [])
+
+    def test_update_and_remove(self):
+        self.index.add("auto_timer", "print('done')")
+        self.assertEqual(self.names("sleep"), [])
+        self.assertEqual(self.names("done"), ["auto_timer"])
+        self.index.remove("auto_timer")
+        self.assertEqual(self.names("done"), [])
+        self.assertNotIn("done", self.index.vocab)
+
+    def test_pending_content_indexed_in_batches(self):
+        loaded = []
+        index = ScriptSearchIndex(loader=lambda name: loaded.append(name) or "secret_token")
+        for i in range(5):
+            index.add(f"lazy_{i}")
+        # Searching never loads content; pending scripts match by name only
+        self.assertEqual(index.search("secret"), [])
+        self.assertEqual(len(index.search("lazy")), 5)
+        self.assertEqual(loaded, [])
+
+        self.assertTrue(index.index_pending(3))
+        self.assertEqual(len(loaded), 3)
+        self.assertFalse(index.index_pending(3))
+        self.assertEqual(sorted(loaded), [f"lazy_{i}" for i in range(5)])
+        self.assertEqual(len(index.search("secret")), 5)
+
+    def test_name_substring_still_matches(self):
+        self.assertEqual(self.names("ganizer"), ["file_organizer"])
+
+if __name__ == '__main__':
+    unittest.main()
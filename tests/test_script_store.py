@@ -0,0 +1,82 @@
+import sys
+import os
+import json
+import shutil
+import tempfile
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.script_store import ScriptStore
+
+class TestScriptStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.root = os.path.join(self.tmp_dir, "scripts")
+        self.legacy = os.path.join(self.tmp_dir, "genesis_scripts.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def files(self):
+        return sorted(os.listdir(os.path.join(self.root, "files")))
+
+    def test_migrates_legacy_json(self):
+        with open(self.legacy, "w") as f:
+            json.dump({"a": {"content": "print(1)", "language": "Python"}, "b": "raw text"}, f)
+        store = ScriptStore(self.root, self.legacy)
+        self.assertEqual(sorted(store.names()), ["a", "b"])
+        self.assertEqual(store.read("a"), "print(1)")
+        self.assertEqual(store.meta("b")["language"], "Plain Text")
+        self.assertFalse(os.path.exists(self.legacy))
+        self.assertTrue(os.path.exists(self.legacy + ".migrated"))
+
+    def test_save_writes_only_that_script(self):
+        store = ScriptStore(self.root, self.legacy)
+        store.save("a", "one", "Python")
+        store.save("b", "two", "Java")
+        path_b = os.path.join(store.files_dir, store.meta("b")["file"])
+        os.utime(path_b, ns=(1, 1))
+        self.assertTrue(store.save("a", "one!", "Python"))
+        self.assertEqual(os.stat(path_b).st_mtime_ns, 1)
+        self.assertFalse(store.save("a", "one!", "Python")) # Unchanged
+        self.assertEqual(ScriptStore(self.root, self.legacy).read("a"), "one!")
+
+    def test_language_change_renames_file(self):
+        store = ScriptStore(self.root, self.legacy)
+        store.save("a", "x", "Python")
+        self.assertTrue(self.files()[0].endswith(".py"))
+        store.save("a", "x", "Java")
+        self.assertEqual(len(self.files()), 1)
+        self.assertTrue(self.files()[0].endswith(".java"))
+
+    def test_delete(self):
+        store = ScriptStore(self.root, self.legacy)
+        store.save("a/b: c", "x", "Plain Text")
+        self.assertTrue(store.delete("a/b: c"))
+        self.assertEqual(self.files(), [])
+        self.assertEqual(store.read("a/b: c"), "")
+        self.assertEqual(ScriptStore(self.root, self.legacy).names(), [])
+
+    def test_diff_by_hash(self):
+        store = ScriptStore(self.root, self.legacy)
+        store.save("a", "1", "Python")
+        store.save("b", "2", "Python")
+        old = {name: dict(store.meta(name)) for name in store.names()}
+        other = ScriptStore(self.root, self.legacy) # e.g. the brain in another process
+        other.save("a", "1!", "Python")
+        other.save("c", "3", "Python")
+        other.delete("b")
+        self.assertEqual(store.diff(old, store.reload()), (["c"], ["b"], ["a"]))
+
+    def test_reload_keeps_manifest_when_unreadable(self):
+        store = ScriptStore(self.root, self.legacy)
+        store.save("a", "1", "Python")
+        with open(store.manifest_path, "w") as f:
+            f.write('{"a": {"lang') # Half-written by a non-atomic writer
+        self.assertIsNone(store.reload())
+        self.assertEqual(store.names(), ["a"])
+
+if __name__ == '__main__':
+    unittest.main()
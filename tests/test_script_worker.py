@@ -0,0 +1,66 @@
+import sys
+import os
+import subprocess
+import unittest
+
+# Add project root to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'script_worker.py')
+
+def request(token, source):
+    payload = source.encode("utf-8")
+    return f"{token} {len(payload)}\n".encode("ascii") + payload
+
+class TestScriptWorker(unittest.TestCase):
+    def run_worker(self, *requests):
+        proc = subprocess.run([sys.executable, "-u", WORKER], input=b"".join(requests),
+                              capture_output=True, timeout=30)
+        return proc.stdout.decode("utf-8"), proc.stderr.decode("utf-8")
+
+    def test_runs_each_source_in_fresh_namespace(self):
+        out, err = self.run_worker(request("a", "x = 41\nprint(x + 1)"),
+                                   request("b", "print('x' in globals())"))
+        self.assertEqual(out, "42\n\0GENESIS_END a 0\nFalse\n\0GENESIS_END b 0\n")
+        self.assertEqual(err, "\0GENESIS_END a\n\0GENESIS_END b\n")
+
+    def test_exit_codes_and_tracebacks(self):
+        out, err = self.run_worker(request("a", "import sys\nsys.exit(3)"),
+                                   request("b", "print(1/0)"),
+                                   request("c", "def broken(:"))
+        self.assertIn("\0GENESIS_END a 3\n", out)
+        self.assertIn("\0GENESIS_END b 1\n", out)
+        self.assertIn("\0GENESIS_END c 1\n", out)
+        self.assertIn("ZeroDivisionError", err)
+        self.assertIn("SyntaxError", err)
+        self.assertNotIn("script_worker.py", err)
+
+    def test_state_is_restored_between_runs(self):
+        out, err = self.run_worker(
+            request("a", "import os, sys, io\nos.chdir('..')\nsys.path.insert(0, 'junk')\nsys.stdout = io.StringIO()"),
+            request("b", "import os, sys\nprint(os.getcwd() == %r, 'junk' in sys.path)" % os.getcwd()))
+        self.assertIn("True False\n\0GENESIS_END b 0\n", out)
+
+    def test_environ_and_modules_are_restored(self):
+        out, err = self.run_worker(
+            request("a", "import os, colorsys\nos.environ['GENESIS_LEAK'] = '1'"),
+            request("b", "import os, sys\nprint('GENESIS_LEAK' in os.environ, 'colorsys' in sys.modules)"))
+        self.assertIn("False False\n\0GENESIS_END b 0\n", out)
+
+    def test_traceback_shows_source_line(self):
+        out, err = self.run_worker(request("a", "x = 1\nraise ValueError('boom %d' % x)"))
+        self.assertIn("raise ValueError('boom %d' % x)", err)
+
+    def test_exits_after_run_that_leaves_threads(self):
+        out, err = self.run_worker(
+            request("a", "import threading, time\nthreading.Thread(target=time.sleep, args=(60,), daemon=True).start()"),
+            request("b", "print('never')"))
+        self.assertIn("\0GENESIS_END a 0\n", out)
+        self.assertNotIn("never", out)
+
+    def test_unicode_output(self):
+        out, err = self.run_worker(request("a", "print('héllo ✓')"))
+        self.assertTrue(out.startswith("héllo ✓\n"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -27,23 +27,15 @@ try:
     print(f"AI Response:\n{response}")
     
     # Check if script saved
-    import json
-    if os.path.exists("data/genesis_scripts.json"):
-        with open("data/genesis_scripts.json", "r") as f:
-            try:
-                data = json.load(f)
-                print(f"DEBUG: Keys in genesis_scripts.json: {list(data.keys())}")
-                if "my_timer" in data:
-                    print("SUCCESS: 'my_timer' found in genesis_scripts.json")
-                    print("Content prefix:", data["my_timer"]["content"][:50])
-                else:
-                    print(f"FAILURE: 'my_timer' not found in {list(data.keys())}")
-                    sys.exit(1)
-            except json.JSONDecodeError:
-                print("FAILURE: genesis_scripts.json is invalid JSON.")
-                sys.exit(1)
+    from src.script_store import get_script_store
+    store = get_script_store()
+    store.load()
+    print(f"DEBUG: Scripts in library: {store.names()}")
+    if store.meta("my_timer"):
+        print("SUCCESS: 'my_timer' found in the script library")
+        print("Content prefix:", store.read("my_timer")[:50])
     else:
-        print("FAILURE: data/genesis_scripts.json does not exist.")
+        print(f"FAILURE: 'my_timer' not found in {store.names()}")
         sys.exit(1)
             
     print("Verification Successful.")
@@ -47,17 +47,18 @@ def test_knowledge_embedding():
     msg = KnowledgeSeeker.ingest_bible(mem)
     print(f"Result: {msg}")
     
-    # Check if facts were added
-    if "facts" in mem.data and len(mem.data["facts"]) > 0:
-        print(f"Facts in Memory: {len(mem.data['facts'])}")
-        print(f"Sample Fact: {mem.data['facts'][-1]}")
+    # Check if chunk vectors were added
+    if len(mem.chunk_store) > 0:
+        chunk = mem.chunk_store.chunks[-1]
+        print(f"Chunks in Memory: {len(mem.chunk_store)}")
+        print(f"Sample Chunk: {mem.corpus.name(chunk['file'])} @ {chunk['offset']} (+{chunk['length']})")
         
-        if "[BIBLE_VEC]" in mem.data['facts'][-1]:
-            print("PASS: Vector embedding tag found.")
+        if chunk["vec"] and mem.corpus.resolve(chunk):
+            print("PASS: Vector embedding resolves to source text.")
         else:
-            print("FAIL: No vector tag found.")
+            print("FAIL: Chunk vector or offset invalid.")
     else:
-        print("FAIL: No facts added.")
+        print("FAIL: No chunks added.")
 
 def test_auto_learner_routing():
     print("\n--- Testing AutoLearner Routing ---")
@@ -1,9 +1,9 @@
-
-import json
 import os
 
+from src.script_store import get_script_store
+
 def update_json():
-    scripts_file = "data/genesis_scripts.json"
+    store = get_script_store()
     
     # helper to read file content safely
     def read_content(path):
@@ -16,37 +16,23 @@ def update_json():
         "script_library.py": "src/script_library.py"
     }
 
-    if not os.path.exists(scripts_file):
-        print(f"Error: {scripts_file} not found.")
-        return
-
-    try:
-        with open(scripts_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-    except Exception as e:
-        print(f"Error reading JSON: {e}")
-        return
-
     print("Updating scripts...")
     for key, source_path in files_to_sync.items():
         if os.path.exists(source_path):
             content = read_content(source_path)
-            if key in data:
-                data[key]["content"] = content
-                print(f"Updated {key} from {source_path}")
-            else:
-                # Add if missing, default to Python
-                data[key] = {"content": content, "language": "Python"}
-                print(f"Added {key} from {source_path}")
+            meta = store.meta(key)
+            language = meta["language"] if meta else "Python" # Add if missing, default to Python
+            try:
+                if store.save(key, content, language):
+                    print(f"{'Updated' if meta else 'Added'} {key} from {source_path}")
+                else:
+                    print(f"Unchanged {key}")
+            except Exception as e:
+                print(f"Error writing {key}: {e}")
         else:
             print(f"Warning: Source {source_path} not found.")
 
-    try:
-        with open(scripts_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4)
-        print("Success: genesis_scripts.json updated.")
-    except Exception as e:
-        print(f"Error writing JSON: {e}")
+    print(f"Success: scripts in {store.root} updated.")
 
 if __name__ == "__main__":
     update_json()